@@ -0,0 +1,81 @@
+"""Measures Account and Transaction deserialization throughput with the
+generated codecs against the previous mapping-based implementation.
+
+    python -m benchmarks.bench_codecs [num_records]
+"""
+
+import contextlib
+import io
+import sys
+import time
+
+from starter_project.developer_api.models import Account, Transaction
+from starter_project.developer_api.models.account import ACCOUNT_SERVICE_MAPPING
+from starter_project.developer_api.models.transcation import (
+    TRANSACTION_SERVICE_MAPPING,
+)
+from starter_project.developer_api.synthetic import make_accounts, make_transactions
+
+
+def legacy_account_deserialize(object_dict):
+    # The implementation Account.deserialize used before the codecs
+    mapped_object_dict = {
+        ACCOUNT_SERVICE_MAPPING.inverse[key]: object_dict[key]
+        for key in object_dict
+    }
+    mapped_object_dict["risk_score"] = int(mapped_object_dict["risk_score"])
+    mapped_object_dict["credit_score"] = int(mapped_object_dict["credit_score"])
+    mapped_object_dict["live_balance"] = bool(mapped_object_dict["live_balance"])
+    mapped_object_dict["balance"] = float(mapped_object_dict["balance"])
+    mapped_object_dict["credit_limit"] = float(mapped_object_dict["credit_limit"])
+    return Account(**mapped_object_dict)
+
+
+def legacy_transaction_deserialize(object_dict):
+    # The implementation Transaction.deserialize used before the codecs,
+    # including its debug output
+    print(object_dict)
+    mapped_object_dict = {
+        TRANSACTION_SERVICE_MAPPING.inverse[key]: object_dict[key]
+        for key in object_dict
+    }
+    mapped_object_dict["latitude"] = float(mapped_object_dict["latitude"])
+    mapped_object_dict["longitude"] = float(mapped_object_dict["longitude"])
+    print(mapped_object_dict)
+    return Transaction(**mapped_object_dict)
+
+
+def records_per_second(func, records, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            for record in records:
+                func(record)
+            best = min(best, time.perf_counter() - started)
+    return len(records) / best
+
+
+def main(num_records: int = 100_000):
+    accounts = make_accounts(num_records)
+    transactions = make_transactions(num_records)
+
+    results = {
+        "account legacy": records_per_second(legacy_account_deserialize, accounts),
+        "account codec": records_per_second(Account.deserialize, accounts),
+        "transaction legacy": records_per_second(
+            legacy_transaction_deserialize, transactions
+        ),
+        "transaction codec": records_per_second(Transaction.deserialize, transactions),
+    }
+    transaction_objects = [Transaction.deserialize(record) for record in transactions]
+    results["transaction serialize"] = records_per_second(
+        Transaction.serialize, transaction_objects
+    )
+
+    for name, rate in results.items():
+        print(f"{name:24} {rate:>12,.0f} records/sec")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
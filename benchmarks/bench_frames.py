@@ -0,0 +1,61 @@
+"""Compares per-currency and per-category sums over Transaction objects with
+the same sums over a TransactionFrame.
+
+    python -m benchmarks.bench_frames [num_transactions]
+"""
+
+import sys
+import time
+from collections import defaultdict
+
+from starter_project.developer_api.frames import TransactionFrame
+from starter_project.developer_api.models import Transaction
+from starter_project.developer_api.synthetic import make_transactions
+
+
+def _timed(func, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def _object_sums(transactions):
+    by_currency = defaultdict(float)
+    by_category = defaultdict(float)
+    for transaction in transactions:
+        by_currency[transaction.currency] += transaction.amount
+        by_category[transaction.merchant.category] += transaction.amount
+    return dict(by_currency), dict(by_category)
+
+
+def _frame_sums(frame):
+    return frame.group_sum("currency"), frame.group_sum("merchant_category")
+
+
+def main(num_transactions: int = 1_000_000):
+    raw = make_transactions(num_transactions)
+    transactions = [Transaction.deserialize(transaction) for transaction in raw]
+
+    build_time, frame = _timed(lambda: TransactionFrame.from_transactions(transactions))
+    object_time, object_result = _timed(lambda: _object_sums(transactions))
+    frame_time, frame_result = _timed(lambda: _frame_sums(frame))
+
+    for expected, actual in zip(object_result, frame_result):
+        assert expected.keys() == actual.keys()
+        assert all(
+            abs(expected[key] - actual[key]) < 1e-6 * num_transactions
+            for key in expected
+        )
+
+    print(f"transactions:           {num_transactions}")
+    print(f"frame build:            {build_time:.3f}s")
+    print(f"object group sums:      {object_time:.3f}s")
+    print(f"frame group sums:       {frame_time:.3f}s")
+    print(f"speedup:                {object_time / frame_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
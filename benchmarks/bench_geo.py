@@ -0,0 +1,84 @@
+"""Compares radius and nearest-neighbour queries on a GeoIndex with a brute
+force haversine scan over every point.
+
+    python -m benchmarks.bench_geo [num_points ...]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from starter_project.developer_api.geoindex import GeoIndex, haversine_km
+
+NUM_QUERIES = 100
+RADIUS_KM = 5
+K = 10
+
+
+def _timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def _brute_force_within(latitudes, longitudes, queries):
+    return [
+        np.flatnonzero(haversine_km(lat, lon, latitudes, longitudes) <= RADIUS_KM)
+        for lat, lon in queries
+    ]
+
+
+def _brute_force_nearest(latitudes, longitudes, queries):
+    return [
+        np.argsort(haversine_km(lat, lon, latitudes, longitudes))[:K]
+        for lat, lon in queries
+    ]
+
+
+def _index_within(index, queries):
+    return [index.within(lat, lon, RADIUS_KM) for lat, lon in queries]
+
+
+def _index_nearest(index, queries):
+    return [index.nearest(lat, lon, K) for lat, lon in queries]
+
+
+def main(*sizes: int):
+    rng = np.random.default_rng(0)
+    for num_points in sizes or (100_000, 1_000_000):
+        # The same area as the synthetic transactions
+        latitudes = rng.uniform(50, 58, num_points)
+        longitudes = rng.uniform(-6, 2, num_points)
+        queries = list(
+            zip(rng.uniform(50, 58, NUM_QUERIES), rng.uniform(-6, 2, NUM_QUERIES))
+        )
+
+        build_time, index = _timed(GeoIndex, latitudes, longitudes)
+        scan_within_time, expected = _timed(
+            _brute_force_within, latitudes, longitudes, queries
+        )
+        index_within_time, found = _timed(_index_within, index, queries)
+        scan_nearest_time, _ = _timed(
+            _brute_force_nearest, latitudes, longitudes, queries
+        )
+        index_nearest_time, _ = _timed(_index_nearest, index, queries)
+        assert all(set(e.tolist()) == set(f) for e, f in zip(expected, found)), (
+            "the index disagrees with the scan"
+        )
+
+        per_query = 1000 / NUM_QUERIES
+        print(f"{'points:':23} {num_points}, index built in {build_time:.3f}s")
+        for name, scan_time, index_time in (
+            (f"within {RADIUS_KM} km", scan_within_time, index_within_time),
+            (f"nearest {K}", scan_nearest_time, index_nearest_time),
+        ):
+            print(
+                f"{name + ':':23} scan {scan_time * per_query:.2f}ms, "
+                f"index {index_time * per_query:.3f}ms per query "
+                f"({scan_time / index_time:.0f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,102 @@
+"""Compares fetching a large Transactions response whole against streaming it
+record by record, and the stdlib decoder against the json_backend one.
+
+    python -m benchmarks.bench_json [num_transactions]
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from starter_project.developer_api import json_backend
+from starter_project.developer_api.clients import DeveloperApiClient
+from starter_project.developer_api.synthetic import make_transactions
+
+
+def _timed(func, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _fetch(fetch):
+    # Returns the time to the first record, the total time and the peak memory
+    tracemalloc.start()
+    started = time.perf_counter()
+    first = None
+    count = 0
+    for _ in fetch():
+        if first is None:
+            first = time.perf_counter() - started
+        count += 1
+    total = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, total, peak, count
+
+
+def _loads_with_gc_paused(body):
+    def loads():
+        with json_backend.PausedGc():
+            return json_backend.loads(body)
+
+    return loads
+
+
+def main(num_transactions: int = 100_000):
+    payload = json.dumps({"Transactions": make_transactions(num_transactions)})
+    body = payload.encode()
+    stdlib_time = _timed(lambda: json.loads(body))
+    backend_time = _timed(lambda: json_backend.loads(body))
+    paused_time = _timed(_loads_with_gc_paused(body))
+
+    # The response is served as a static file by another process so that
+    # neither the timings nor the traced memory include the server
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "transactions", "accounts", "1")
+        os.makedirs(path)
+        with open(os.path.join(path, "transactions"), "wb") as file:
+            file.write(body)
+        server = subprocess.Popen(
+            [sys.executable, "-m", "http.server", "0", "--bind", "127.0.0.1"],
+            cwd=root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        try:
+            port = re.search(r"port (\d+)", server.stdout.readline()).group(1)
+            with DeveloperApiClient(
+                "token", service_url=f"http://127.0.0.1:{port}"
+            ) as client:
+                whole = _fetch(lambda: client.get_transactions("1"))
+                streamed = _fetch(lambda: client.iter_transactions("1"))
+        finally:
+            server.terminate()
+            server.wait()
+    assert whole[3] == streamed[3] == num_transactions
+
+    print(f"transactions:           {num_transactions} ({len(body) / 1e6:.1f} MB)")
+    print(f"json.loads:             {stdlib_time:.3f}s")
+    print(f"json_backend.loads:     {backend_time:.3f}s ({json_backend.BACKEND})")
+    print(f"  with PausedGc:        {paused_time:.3f}s")
+    for name, (first, total, peak, _) in (
+        ("get_transactions", whole),
+        ("iter_transactions", streamed),
+    ):
+        print(
+            f"{name + ':':23} first record {first:.3f}s, all {total:.3f}s, "
+            f"peak {peak / 1e6:.0f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
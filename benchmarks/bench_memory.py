@@ -0,0 +1,60 @@
+"""Measures the memory held per record by the regular and the compact models
+with tracemalloc.
+
+    python -m benchmarks.bench_memory [num_records]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+
+from starter_project.developer_api.models import (
+    Account,
+    CompactAccount,
+    CompactTransaction,
+    MerchantTable,
+    Transaction,
+)
+from starter_project.developer_api.synthetic import make_accounts, make_transactions
+
+
+def bytes_per_record(decode, payload: str, json_key: str):
+    """Decodes a JSON payload into models and returns the bytes still held per
+    record once the parsed dicts are gone, strings included.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = [decode(record) for record in json.loads(payload)[json_key]]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(records)
+
+
+def main(num_records: int = 100_000):
+    accounts = json.dumps({"Accounts": make_accounts(num_records)})
+    transactions = json.dumps({"Transactions": make_transactions(num_records)})
+    merchants = MerchantTable()
+
+    results = {
+        "Account": bytes_per_record(Account.deserialize, accounts, "Accounts"),
+        "CompactAccount": bytes_per_record(
+            CompactAccount.deserialize, accounts, "Accounts"
+        ),
+        "Transaction": bytes_per_record(
+            Transaction.deserialize, transactions, "Transactions"
+        ),
+        "CompactTransaction": bytes_per_record(
+            lambda record: CompactTransaction.deserialize(record, merchants),
+            transactions,
+            "Transactions",
+        ),
+    }
+    for name, size in results.items():
+        print(f"{name:20} {size:>8,.0f} bytes/record")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,86 @@
+"""Compares persisting transactions as JSON from serialize() with a binary
+snapshot, loading everything back and opening it to read a few rows.
+
+    python -m benchmarks.bench_snapshot [num_transactions]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from starter_project.developer_api import json_backend
+from starter_project.developer_api.binary_snapshot import SnapshotReader, write_snapshot
+from starter_project.developer_api.models import Transaction
+from starter_project.developer_api.synthetic import make_transactions
+
+NUM_ROWS_READ = 1000
+
+
+def _timed(func):
+    started = time.perf_counter()
+    result = func()
+    return time.perf_counter() - started, result
+
+
+def _load_json(path):
+    with open(path, "rb") as file:
+        return [Transaction.deserialize(raw) for raw in json_backend.loads(file.read())]
+
+
+def _read_rows(path, rows):
+    with SnapshotReader(path) as reader:
+        return [reader.transactions[row] for row in rows]
+
+
+def _read_all(path):
+    with SnapshotReader(path) as reader:
+        return list(reader.transactions)
+
+
+def main(num_transactions: int = 200_000):
+    transactions = [
+        Transaction.deserialize(raw) for raw in make_transactions(num_transactions)
+    ]
+    rows = random.Random(0).sample(range(num_transactions), NUM_ROWS_READ)
+
+    with tempfile.TemporaryDirectory() as root:
+        json_path = os.path.join(root, "transactions.json")
+        snapshot_path = os.path.join(root, "transactions.bin")
+
+        def dump_json():
+            with open(json_path, "w") as file:
+                json.dump(
+                    [transaction.serialize() for transaction in transactions], file
+                )
+
+        json_write, _ = _timed(dump_json)
+        snapshot_write, _ = _timed(
+            lambda: write_snapshot(snapshot_path, transactions=transactions)
+        )
+        json_load, loaded = _timed(lambda: _load_json(json_path))
+        snapshot_load, read = _timed(lambda: _read_all(snapshot_path))
+        open_time, _ = _timed(lambda: SnapshotReader(snapshot_path).close())
+        rows_time, sampled = _timed(lambda: _read_rows(snapshot_path, rows))
+        assert loaded == read == transactions
+        assert sampled == [transactions[row] for row in rows]
+
+        print(f"{'transactions:':23} {num_transactions}")
+        print(
+            f"{'json:':23} {os.path.getsize(json_path) / 1e6:.0f} MB, "
+            f"write {json_write:.2f}s, load all {json_load:.2f}s"
+        )
+        print(
+            f"{'snapshot:':23} {os.path.getsize(snapshot_path) / 1e6:.0f} MB, "
+            f"write {snapshot_write:.2f}s, load all {snapshot_load:.2f}s"
+        )
+        print(
+            f"{'snapshot open:':23} {open_time * 1000:.2f}ms, "
+            f"{NUM_ROWS_READ} random rows {rows_time * 1000:.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,220 @@
+"""Runs the tracked client benchmarks offline, writes the results as JSON and
+compares them with a baseline, exiting with status 1 if any metric regressed
+by more than the threshold.
+
+    python -m benchmarks.suite [--output results.json] [--baseline baseline.json]
+        [--threshold 0.2] [--records 20000] [--requests 300]
+
+Results go to benchmarks/bench_results.json unless --output is given. Save a
+run as the baseline with ``--output baseline.json``, then compare later runs on
+the same machine with ``--baseline baseline.json``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import dataclass
+
+from benchmarks.bench_memory import bytes_per_record
+from starter_project.developer_api.clients import DeveloperApiClient
+from starter_project.developer_api.filters import Filter
+from starter_project.developer_api.local_server import LocalDeveloperApi
+from starter_project.developer_api.models import Account, Transaction
+from starter_project.developer_api.synthetic import make_accounts, make_transactions
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), "bench_results.json")
+
+
+@dataclass
+class Metric:
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool
+
+    def change_from(self, baseline: float):
+        """Returns how much worse than the baseline this is, as a fraction, so
+        a positive number is a regression whichever way the metric points.
+        """
+        if baseline == 0:
+            return 0.0
+        change = (self.value - baseline) / baseline
+        return -change if self.higher_is_better else change
+
+
+def _per_second(func, count: int, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return count / best
+
+
+def deserialization_metrics(num_records: int):
+    accounts = make_accounts(num_records)
+    transactions = make_transactions(num_records)
+    return [
+        Metric(
+            "account_deserialize",
+            _per_second(
+                lambda: [Account.deserialize(account) for account in accounts],
+                num_records,
+            ),
+            "records/s",
+            True,
+        ),
+        Metric(
+            "transaction_deserialize",
+            _per_second(
+                lambda: [
+                    Transaction.deserialize(transaction) for transaction in transactions
+                ],
+                num_records,
+            ),
+            "records/s",
+            True,
+        ),
+    ]
+
+
+def query_building_metrics(num_queries: int):
+    filters = [
+        Filter("amount").gt(10),
+        Filter("amount").gt(20),
+        Filter("amount").le(500),
+        Filter("status").eq("Successful"),
+        Filter("timestamp").ge("2019-01-01 00:00:00"),
+    ]
+    build = DeveloperApiClient._construct_query_params_from_filters
+    return [
+        Metric(
+            "query_params",
+            _per_second(
+                lambda: [build(filters) for _ in range(num_queries)], num_queries
+            ),
+            "queries/s",
+            True,
+        )
+    ]
+
+
+def request_metrics(num_requests: int):
+    with LocalDeveloperApi(seed=0) as server:
+        (account,) = server.add_accounts(1, num_transactions=10)
+        account_id = account["accountId"]
+        with DeveloperApiClient("token", service_url=server.url) as client:
+            get_rate = _per_second(
+                lambda: [
+                    client._get(f"transactions/accounts/{account_id}/transactions")
+                    for _ in range(num_requests)
+                ],
+                num_requests,
+            )
+            post_rate = _per_second(
+                lambda: [
+                    client._post(
+                        f"transactions/accounts/{account_id}/create", {"quantity": 1}
+                    )
+                    for _ in range(num_requests)
+                ],
+                num_requests,
+            )
+    return [
+        Metric("get_request", get_rate, "requests/s", True),
+        Metric("post_request", post_rate, "requests/s", True),
+    ]
+
+
+def memory_metrics(num_records: int):
+    accounts = json.dumps({"Accounts": make_accounts(num_records)})
+    transactions = json.dumps({"Transactions": make_transactions(num_records)})
+    return [
+        Metric(
+            "account_memory",
+            bytes_per_record(Account.deserialize, accounts, "Accounts"),
+            "bytes/record",
+            False,
+        ),
+        Metric(
+            "transaction_memory",
+            bytes_per_record(Transaction.deserialize, transactions, "Transactions"),
+            "bytes/record",
+            False,
+        ),
+    ]
+
+
+def run(num_records: int, num_requests: int):
+    return (
+        deserialization_metrics(num_records)
+        + query_building_metrics(num_records)
+        + request_metrics(num_requests)
+        + memory_metrics(num_records)
+    )
+
+
+def compare(metrics: list[Metric], baseline: dict, threshold: float):
+    """Compares metrics with a baseline results dict.
+
+    :return: The names of the metrics that regressed by more than the threshold
+    """
+    regressions = []
+    for metric in metrics:
+        if metric.name not in baseline:
+            print(f"{metric.name:24} {metric.value:>14,.1f} {metric.unit:13} (new)")
+            continue
+        change = metric.change_from(baseline[metric.name]["value"])
+        regressed = change > threshold
+        if regressed:
+            regressions.append(metric.name)
+        print(
+            f"{metric.name:24} {metric.value:>14,.1f} {metric.unit:13} "
+            f"{-change:+7.1%}{'  REGRESSED' if regressed else ''}"
+        )
+    return regressions
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    metrics = run(args.records, args.requests)
+    results = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "metrics": {
+            metric.name: {
+                "value": metric.value,
+                "unit": metric.unit,
+                "higher_is_better": metric.higher_is_better,
+            }
+            for metric in metrics
+        },
+    }
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["metrics"]
+    regressions = compare(metrics, baseline, args.threshold)
+    if regressions:
+        print(f"Regressed past {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+import json
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import ClassVar
+
+from starter_project.developer_api import json_backend
+from starter_project.developer_api.frames import merchant_category, plain_value
+
+# Version 2 keys credit/debit indicators by the API's "Credit"/"Debit"
+SNAPSHOT_VERSION = 2
+
+
+@dataclass
+class Aggregate:
+    """Running totals of transaction amounts."""
+
+    count: int = 0
+    total: float = 0.0
+    minimum: float = None
+    maximum: float = None
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, amount: float):
+        self.count += 1
+        self.total += amount
+        if self.minimum is None or amount < self.minimum:
+            self.minimum = amount
+        if self.maximum is None or amount > self.maximum:
+            self.maximum = amount
+
+    def copy(self):
+        return Aggregate(self.count, self.total, self.minimum, self.maximum)
+
+
+class TransactionAggregator:
+    """Keeps per-account totals of transaction amounts up to date as batches
+    of transactions arrive, instead of recomputing them from every transaction.
+
+    Each account has an Aggregate per credit/debit indicator, overall and
+    broken down by merchant category, status, currency and day. Adding a
+    batch only touches the aggregates of the transactions in it, and
+    transactions that were already added are skipped. ``snapshot`` and
+    ``restore`` carry the aggregates over a restart.
+    """
+
+    DIMENSIONS: ClassVar[dict[str, Callable]] = {
+        "merchant_category": lambda transaction: merchant_category(
+            transaction.merchant
+        ),
+        "status": lambda transaction: plain_value(transaction.status),
+        "currency": lambda transaction: transaction.currency,
+        # The date part of the API's ``2019-05-20 10:51:33`` timestamps
+        "day": lambda transaction: transaction.timestamp[:10],
+    }
+
+    def __init__(self, transactions: Iterable = ()):
+        """
+        :param transactions: Transactions to start with, such as the result of
+            get_transactions
+        """
+        self._transaction_uuids = set()
+        # account_uuid -> indicator -> Aggregate
+        self._totals = {}
+        # account_uuid -> dimension -> key -> indicator -> Aggregate
+        self._breakdowns = {}
+        self.add(transactions)
+
+    def __len__(self):
+        return len(self._transaction_uuids)
+
+    def __contains__(self, transaction_uuid: str):
+        return transaction_uuid in self._transaction_uuids
+
+    @property
+    def account_uuids(self):
+        return list(self._totals)
+
+    def _aggregate(self, by_indicator: dict, indicator: str):
+        aggregate = by_indicator.get(indicator)
+        if aggregate is None:
+            aggregate = by_indicator[indicator] = Aggregate()
+        return aggregate
+
+    def add(self, transactions: Iterable):
+        """Adds a batch of transactions to the aggregates, skipping any already added.
+
+        :return: The number of transactions added
+        """
+        added = 0
+        for transaction in transactions:
+            if transaction.transaction_uuid in self._transaction_uuids:
+                continue
+            self._transaction_uuids.add(transaction.transaction_uuid)
+            added += 1
+
+            account_uuid = transaction.account_uuid
+            indicator = plain_value(transaction.credit_debit_indicator)
+            amount = transaction.amount
+            totals = self._totals.setdefault(account_uuid, {})
+            self._aggregate(totals, indicator).add(amount)
+            breakdowns = self._breakdowns.setdefault(account_uuid, {})
+            for dimension, key_of in self.DIMENSIONS.items():
+                by_key = breakdowns.setdefault(dimension, {})
+                by_indicator = by_key.setdefault(key_of(transaction), {})
+                self._aggregate(by_indicator, indicator).add(amount)
+        return added
+
+    def totals(self, account_uuid: str):
+        """Returns an account's Aggregate for each credit/debit indicator."""
+        return {
+            indicator: aggregate.copy()
+            for indicator, aggregate in self._totals.get(account_uuid, {}).items()
+        }
+
+    def breakdown(self, account_uuid: str, dimension: str):
+        """Returns an account's Aggregates for each value of a dimension, split by
+        credit/debit indicator.
+
+        :param account_uuid: The account to return the aggregates of
+        :param dimension: One of merchant_category, status, currency or day
+        """
+        if dimension not in self.DIMENSIONS:
+            raise ValueError(f"dimension must be one of {', '.join(self.DIMENSIONS)}")
+        by_key = self._breakdowns.get(account_uuid, {}).get(dimension, {})
+        return {
+            key: {
+                indicator: aggregate.copy()
+                for indicator, aggregate in by_indicator.items()
+            }
+            for key, by_indicator in by_key.items()
+        }
+
+    def daily(self, account_uuid: str):
+        """Returns an account's Aggregates for each day, in date order."""
+        return dict(sorted(self.breakdown(account_uuid, "day").items()))
+
+    def snapshot(self):
+        """Returns the aggregates and the transactions they include as a dict
+        that can be saved as JSON.
+        """
+
+        def rows(by_indicator):
+            return [
+                [indicator, a.count, a.total, a.minimum, a.maximum]
+                for indicator, a in by_indicator.items()
+            ]
+
+        # Keys are kept in lists rather than as JSON object keys since they
+        # may be None
+        return {
+            "version": SNAPSHOT_VERSION,
+            "transaction_uuids": sorted(self._transaction_uuids),
+            "accounts": [
+                {
+                    "account_uuid": account_uuid,
+                    "totals": rows(totals),
+                    "breakdowns": {
+                        dimension: [
+                            [key, rows(by_indicator)]
+                            for key, by_indicator in by_key.items()
+                        ]
+                        for dimension, by_key in self._breakdowns[account_uuid].items()
+                    },
+                }
+                for account_uuid, totals in self._totals.items()
+            ],
+        }
+
+    @classmethod
+    def restore(cls, snapshot: dict):
+        """Rebuilds an aggregator from a snapshot.
+
+        :raises ValueError: If the snapshot was made by an incompatible version
+        """
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {snapshot.get('version')}")
+
+        def by_indicator(rows):
+            return {indicator: Aggregate(*values) for indicator, *values in rows}
+
+        aggregator = cls()
+        aggregator._transaction_uuids = set(snapshot["transaction_uuids"])
+        for account in snapshot["accounts"]:
+            account_uuid = account["account_uuid"]
+            aggregator._totals[account_uuid] = by_indicator(account["totals"])
+            aggregator._breakdowns[account_uuid] = {
+                dimension: {key: by_indicator(rows) for key, rows in keys}
+                for dimension, keys in account["breakdowns"].items()
+            }
+        return aggregator
+
+    def save(self, path: str):
+        """Writes a snapshot to a JSON file, replacing it only once the new
+        snapshot is complete so a crash can't leave a partial one behind.
+        """
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(self.snapshot(), file)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str):
+        """Restores an aggregator from a JSON file written by save."""
+        with open(path, "rb") as file:
+            return cls.restore(json_backend.loads(file.read()))
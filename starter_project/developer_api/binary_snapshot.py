@@ -0,0 +1,355 @@
+import json
+import mmap
+import typing
+from collections.abc import Iterable
+from dataclasses import fields
+from enum import Enum
+
+import numpy as np
+
+from starter_project.developer_api import json_backend
+from starter_project.developer_api.models import Account, Transaction
+from starter_project.developer_api.models.account import ACCOUNT_SERVICE_MAPPING
+from starter_project.developer_api.models.transcation import (
+    TRANSACTION_SERVICE_MAPPING,
+)
+
+# The layout of a snapshot file is the magic bytes, the length of a JSON
+# header as a little-endian uint64, the header and then the sections it
+# describes. Every section starts on an 8 byte boundary so the arrays in it
+# can be used straight from the memory map.
+MAGIC = b"DAPISNAP"
+VERSION = 1
+ALIGNMENT = 8
+
+# The code a string column holds for None
+NULL_CODE = np.iinfo(np.uint32).max
+
+_NUMERIC_DTYPES = {"int": "<i8", "float": "<f8", "bool": "|u1"}
+
+
+def _column_kinds(model: type, service_mapping):
+    # API key to "int", "float", "bool", "string" or "merchant", from the
+    # model's field types. Enums are stored as their serialized values.
+    hints = typing.get_type_hints(model)
+    kinds = {}
+    for field in fields(model):
+        field_type = hints[field.name]
+        key = service_mapping[field.name]
+        if field_type in (int, float, bool):
+            kinds[key] = field_type.__name__
+        elif isinstance(field_type, type) and hasattr(field_type, "serialize"):
+            kinds[key] = "merchant"
+        elif field_type is str or (
+            isinstance(field_type, type) and issubclass(field_type, Enum)
+        ):
+            kinds[key] = "string"
+        else:
+            raise TypeError(f"{model.__name__}.{field.name} can't be stored")
+    return kinds
+
+
+TABLES = {
+    "accounts": (Account, _column_kinds(Account, ACCOUNT_SERVICE_MAPPING)),
+    "transactions": (
+        Transaction,
+        _column_kinds(Transaction, TRANSACTION_SERVICE_MAPPING),
+    ),
+}
+
+
+class _StringTable:
+    # Gives every distinct string a code, in the order they are first seen
+    def __init__(self):
+        self.codes = {}
+
+    def code(self, value):
+        if value is None:
+            return NULL_CODE
+        if not isinstance(value, str):
+            raise TypeError(f"Expected a string but got {value!r}")
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes)
+        return code
+
+    def sections(self, prefix: str):
+        encoded = [value.encode() for value in self.codes]
+        offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return {
+            f"{prefix}.offsets": offsets,
+            f"{prefix}.data": np.frombuffer(b"".join(encoded), dtype="|u1"),
+        }
+
+
+def _table_sections(name: str, records: list, strings: _StringTable, merchants):
+    _, kinds = TABLES[name]
+    serialized = [record.serialize() for record in records]
+    sections = {}
+    for key, kind in kinds.items():
+        values = [record[key] for record in serialized]
+        if kind == "string":
+            column = np.array([strings.code(value) for value in values], dtype="<u4")
+        elif kind == "merchant":
+            column = np.array(
+                [
+                    NULL_CODE if value is None else merchants.code(json.dumps(value))
+                    for value in values
+                ],
+                dtype="<u4",
+            )
+        else:
+            nulls = np.array([value is None for value in values], dtype=bool)
+            column = np.array(
+                [0 if value is None else value for value in values],
+                dtype=_NUMERIC_DTYPES[kind],
+            )
+            if nulls.any():
+                sections[f"{name}.{key}.nulls"] = nulls.astype("|u1")
+        sections[f"{name}.{key}"] = column
+    return sections
+
+
+def write_snapshot(
+    path: str,
+    accounts: Iterable[Account] = (),
+    transactions: Iterable[Transaction] = (),
+):
+    """Writes accounts and transactions to a binary snapshot file.
+
+    Numeric fields are stored as fixed-width columns, strings as codes into
+    one table of the distinct strings and merchants as codes into a table of
+    their own. Reading a record back from the snapshot gives a model that
+    serializes to exactly what the original did.
+
+    :param path: The file to write
+    :param accounts: Account objects, or anything with the same fields and a
+        serialize method such as CompactAccount
+    :param transactions: Transaction objects, or anything with the same fields
+        and a serialize method such as CompactTransaction
+    """
+    records = {"accounts": list(accounts), "transactions": list(transactions)}
+    strings = _StringTable()
+    merchants = _StringTable()
+    sections = {}
+    for name, table_records in records.items():
+        sections.update(_table_sections(name, table_records, strings, merchants))
+    sections.update(strings.sections("strings"))
+    sections.update(merchants.sections("merchants"))
+
+    header = {
+        "version": VERSION,
+        "rows": {name: len(table_records) for name, table_records in records.items()},
+        "sections": {},
+    }
+    offset = 0
+    for section, array in sections.items():
+        offset += -offset % ALIGNMENT
+        header["sections"][section] = {
+            "offset": offset,
+            "dtype": array.dtype.str,
+            "length": len(array),
+        }
+        offset += array.nbytes
+
+    encoded_header = json.dumps(header).encode()
+    start = len(MAGIC) + 8 + len(encoded_header)
+    start += -start % ALIGNMENT
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(len(encoded_header).to_bytes(8, "little"))
+        file.write(encoded_header)
+        for section, array in sections.items():
+            file.seek(start + header["sections"][section]["offset"])
+            file.write(array.tobytes())
+        file.truncate(start + offset)
+
+
+class _Strings:
+    # Decodes strings from a table in the snapshot as they are asked for
+    def __init__(self, offsets: np.ndarray, data: np.ndarray):
+        self._offsets = offsets
+        self._data = memoryview(data)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def decode(self, codes: np.ndarray):
+        offsets, data = self._offsets, self._data
+        if len(codes) <= 16:
+            return [
+                None
+                if code == NULL_CODE
+                else str(data[offsets[code] : offsets[code + 1]], "utf-8")
+                for code in codes.tolist()
+            ]
+        unique, inverse = np.unique(codes, return_inverse=True)
+        if len(unique) * 2 < len(codes):
+            # Columns such as currency repeat a few strings many times, so
+            # each distinct one is only decoded once
+            decoded = self.decode(unique)
+            return [decoded[index] for index in inverse.tolist()]
+        nulls = codes == NULL_CODE
+        present = codes[~nulls]
+        starts = offsets[present].tolist()
+        ends = offsets[present + 1].tolist()
+        strings = iter([str(data[s:e], "utf-8") for s, e in zip(starts, ends)])
+        return [None if null else next(strings) for null in nulls.tolist()]
+
+
+class SnapshotTable:
+    """The accounts or transactions in a snapshot. Rows are only read from the
+    file and turned into models when they are indexed or iterated over.
+    """
+
+    # The number of rows read at a time when iterating
+    CHUNK_SIZE = 4096
+
+    def __init__(self, name: str, rows: int, reader: "SnapshotReader"):
+        self.name = name
+        self.model, self.kinds = TABLES[name]
+        self._rows = rows
+        self._reader = reader
+        self._columns = {key: reader._section(f"{name}.{key}") for key in self.kinds}
+        self._nulls = {
+            key: reader._section(f"{name}.{key}.nulls")
+            for key in self.kinds
+            if f"{name}.{key}.nulls" in reader._sections
+        }
+
+    def __len__(self):
+        return self._rows
+
+    def column(self, key: str):
+        """Returns a numeric column as an array backed by the file, with 0 for
+        missing values, or the values of a string column decoded into a list.
+
+        :param key: The API name of the field, such as ``amount``
+        """
+        if key not in self.kinds:
+            raise ValueError(f"{key} is not a field of {self.model.__name__}")
+        column = self._columns[key]
+        if self.kinds[key] == "string":
+            return self._reader._strings.decode(column)
+        if self.kinds[key] == "merchant":
+            raise ValueError(f"{key} isn't a column of values")
+        return column
+
+    def _values(self, key: str, kind: str, start: int, stop: int):
+        column = self._columns[key][start:stop]
+        if kind == "string":
+            return self._reader._strings.decode(column)
+        if kind == "merchant":
+            # Every row gets its own merchant dict so no two transactions
+            # share the same mutable pointOfSale list
+            return [
+                None if merchant is None else json_backend.loads(merchant)
+                for merchant in self._reader._merchants.decode(column)
+            ]
+        values = column.astype(bool) if kind == "bool" else column
+        values = values.tolist()
+        if key in self._nulls:
+            nulls = self._nulls[key][start:stop].tolist()
+            values = [None if null else value for value, null in zip(values, nulls)]
+        return values
+
+    def _read(self, start: int, stop: int):
+        # Reads a run of rows column by column, which is far quicker than
+        # reading each field of each row on its own
+        keys = list(self.kinds)
+        columns = [
+            self._values(key, kind, start, stop) for key, kind in self.kinds.items()
+        ]
+        return [dict(zip(keys, values)) for values in zip(*columns)]
+
+    def row(self, index: int):
+        """Returns a row as the dict its record serialized to."""
+        if not -self._rows <= index < self._rows:
+            raise IndexError(f"{self.name} index out of range")
+        index %= self._rows
+        return self._read(index, index + 1)[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._rows)
+            if step == 1:
+                return [self.model.deserialize(row) for row in self._read(start, stop)]
+            return [self[i] for i in range(start, stop, step)]
+        return self.model.deserialize(self.row(index))
+
+    def __iter__(self):
+        for start in range(0, self._rows, self.CHUNK_SIZE):
+            yield from self[start : start + self.CHUNK_SIZE]
+
+
+class SnapshotReader:
+    """Opens a snapshot written by write_snapshot without reading it into
+    memory. The file is memory mapped, so opening it takes the same time
+    whatever its size and only the rows that are used are ever read.
+
+    Arrays returned by ``column`` are views of the file and are only valid
+    until the reader is closed.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: The snapshot file to open
+        :raises ValueError: If the file isn't a snapshot of a supported version
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header()
+        except BaseException:
+            self._map.close()
+            raise
+        self._strings = _Strings(
+            self._section("strings.offsets"), self._section("strings.data")
+        )
+        self._merchants = _Strings(
+            self._section("merchants.offsets"), self._section("merchants.data")
+        )
+        self.accounts = SnapshotTable("accounts", self._rows["accounts"], self)
+        self.transactions = SnapshotTable(
+            "transactions", self._rows["transactions"], self
+        )
+
+    def _read_header(self):
+        if self._map[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path} is not a snapshot")
+        length_end = len(MAGIC) + 8
+        length = int.from_bytes(self._map[len(MAGIC) : length_end], "little")
+        header = json_backend.loads(self._map[length_end : length_end + length])
+        if header["version"] != VERSION:
+            raise ValueError(f"Unsupported snapshot version {header['version']}")
+        self._start = length_end + length
+        self._start += -self._start % ALIGNMENT
+        self._rows = header["rows"]
+        self._sections = header["sections"]
+
+    def _section(self, name: str):
+        section = self._sections[name]
+        return np.frombuffer(
+            self._map,
+            dtype=section["dtype"],
+            count=section["length"],
+            offset=self._start + section["offset"],
+        )
+
+    def close(self):
+        self.accounts = self.transactions = None
+        self._strings = self._merchants = None
+        try:
+            self._map.close()
+        except BufferError:
+            # Arrays from column are still in use, the map is closed once
+            # they are garbage collected
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,242 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import wait as wait_for_futures
+from dataclasses import dataclass
+from typing import Any
+
+import aiohttp
+
+# The errors a client call can fail with that are reported in its BulkResult
+# rather than raised: connection and HTTP errors from requests and aiohttp
+# (requests' exceptions and TimeoutError are OSErrors), bad responses and
+# invalid arguments.
+CALL_ERRORS = (OSError, ValueError, LookupError, aiohttp.ClientError)
+
+
+@dataclass
+class BulkResult:
+    """The outcome of one call in a bulk request.
+
+    Exactly one of ``result`` and ``error`` is set, so a failing key never
+    stops the rest of the batch.
+    """
+
+    key: str
+    result: Any = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def unique_keys(keys: Iterable[str]):
+    """Removes duplicate keys while keeping the order they were first seen in."""
+    return list(dict.fromkeys(keys))
+
+
+def fan_out(func: Callable, keys: Iterable[str], max_workers: int):
+    """Calls ``func(key)`` for every unique key on a thread pool and yields a
+    BulkResult for each one as soon as it finishes.
+
+    :param func: The function to call with each key
+    :param keys: The keys to call the function with, duplicates are skipped
+    :param max_workers: The maximum number of calls running at once
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(func, key): key for key in unique_keys(keys)}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                yield BulkResult(key, result=future.result())
+            except CALL_ERRORS as error:
+                yield BulkResult(key, error=error)
+    finally:
+        # Stop anything not started yet if the caller stops iterating early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def async_fan_out(func: Callable, keys: Iterable[str]):
+    """The asyncio counterpart of fan_out. Concurrency is left to the client's
+    own limit, results are yielded in completion order.
+
+    :param func: The coroutine function to call with each key
+    :param keys: The keys to call the function with, duplicates are skipped
+    """
+
+    async def call(key):
+        try:
+            return BulkResult(key, result=await func(key))
+        except CALL_ERRORS as error:
+            return BulkResult(key, error=error)
+
+    tasks = [asyncio.ensure_future(call(key)) for key in unique_keys(keys)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class Operation:
+    """One client call in a batch, named after the client method it calls,
+    such as ``Operation("get_transactions", account_id, transaction_filters=[...])``.
+    """
+
+    def __init__(self, method: str, *args, timeout: float | None = None, **kwargs):
+        """
+        :param method: The name of the client method to call
+        :param args: Positional arguments for the method
+        :param timeout: Seconds the call may run for, the batch's timeout if not given
+        :param kwargs: Keyword arguments for the method
+        """
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self.timeout = timeout
+
+    def __repr__(self):
+        arguments = [repr(arg) for arg in self.args] + [
+            f"{name}={value!r}" for name, value in self.kwargs.items()
+        ]
+        return f"{self.method}({', '.join(arguments)})"
+
+
+class _Call:
+    # Remembers when a submitted function started running, so a timeout only
+    # counts the time it ran and not the time it spent queued
+    def __init__(self, func: Callable, args: tuple, kwargs: dict):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.started = None
+
+    def __call__(self):
+        self.started = time.monotonic()
+        return self.func(*self.args, **self.kwargs)
+
+
+class BatchExecutor:
+    """A thread pool with a bounded queue: ``submit`` blocks while
+    ``max_pending`` calls are queued or running, so producing calls can't run
+    far ahead of the workers.
+    """
+
+    # How often a call with a timeout that hasn't started yet is checked on
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, max_workers: int = 8, max_pending: int | None = None):
+        """
+        :param max_workers: The number of calls run at once
+        :param max_pending: The number of calls queued or running before submit
+            blocks, four per worker if not given
+        """
+        if max_pending is None:
+            max_pending = max_workers * 4
+        if max_pending < max_workers:
+            raise ValueError("max_pending must be at least max_workers")
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._timed_out = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Calls that timed out may still be running, waiting for them would
+        # hold the caller past the timeout or deadline it asked for
+        self.shutdown(wait=not self._timed_out)
+
+    def shutdown(self, wait: bool = True):
+        """Stops the workers, dropping any calls that haven't started.
+
+        :param wait: Whether to wait for the calls that are running to finish
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _submit(self, call: _Call):
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(call)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def submit(self, func: Callable, *args, **kwargs):
+        """Schedules ``func(*args, **kwargs)``, waiting for room in the queue first.
+
+        :return: A concurrent.futures.Future of the call
+        """
+        return self._submit(_Call(func, args, kwargs))
+
+    def _wait(self, future: Future, call: _Call, timeout: float, deadline: float):
+        # Returns whether the call finished before its timeout and the deadline
+        while True:
+            expires = deadline
+            if timeout is not None and call.started is not None:
+                expires = min(expires or float("inf"), call.started + timeout)
+            wait_for = None if expires is None else expires - time.monotonic()
+            if wait_for is not None and wait_for <= 0:
+                return future.done()
+            if timeout is not None and call.started is None:
+                wait_for = min(wait_for or self.POLL_INTERVAL, self.POLL_INTERVAL)
+            if wait_for_futures([future], timeout=wait_for).done:
+                return True
+
+    def map(
+        self,
+        calls: Iterable[tuple],
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ):
+        """Runs calls and yields a BulkResult for each in the order given.
+
+        Calls are only taken from ``calls`` as there is room for them, so it
+        can be a generator of any length. A call that runs longer than its
+        timeout, or is unfinished at the deadline, gets a TimeoutError. Python
+        can't stop a thread, so a call that is already running still finishes
+        in the background and its result is dropped.
+
+        :param calls: ``(key, func)`` or ``(key, func, timeout)`` tuples, where
+            func takes no arguments and a timeout of None uses the default
+        :param timeout: The default number of seconds one call may run for
+        :param deadline: Seconds from now after which unfinished calls fail
+        """
+        if deadline is not None:
+            deadline = time.monotonic() + deadline
+        pending = deque()
+
+        def result_of(key, future, call, call_timeout):
+            if future is None or not self._wait(future, call, call_timeout, deadline):
+                if future is not None:
+                    future.cancel()
+                self._timed_out = True
+                return BulkResult(key, error=TimeoutError(f"{key} timed out"))
+            try:
+                return BulkResult(key, result=future.result())
+            except CALL_ERRORS as error:
+                return BulkResult(key, error=error)
+
+        for key, func, *call_timeout in calls:
+            call_timeout = call_timeout[0] if call_timeout else None
+            if call_timeout is None:
+                call_timeout = timeout
+            while len(pending) >= self.max_pending:
+                yield result_of(*pending.popleft())
+            if deadline is not None and time.monotonic() >= deadline:
+                pending.append((key, None, None, call_timeout))
+                continue
+            call = _Call(func, (), {})
+            pending.append((key, self._submit(call), call, call_timeout))
+        while pending:
+            yield result_of(*pending.popleft())
@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """A thread-safe LRU cache of decoded API responses with a TTL per endpoint.
+
+    Entries are keyed by the caller's auth identity, the request URL and its
+    normalized query params, so clients with different tokens can share one
+    cache without seeing each other's responses. They also remember the endpoint template (such as ``accounts/{account_id}``) they
+    were fetched from to pick their TTL.
+    """
+
+    def __init__(self, max_size: int = 1024, default_ttl: float = 30.0, ttls=None):
+        """
+        :param max_size: The maximum number of responses kept
+        :param default_ttl: Seconds a response stays fresh if its endpoint has no TTL of its own
+        :param ttls: A dict of endpoint template to TTL in seconds, a TTL of 0 disables caching
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    @staticmethod
+    def make_key(url: str, query_params: dict | None = None, auth: str | None = None):
+        # Filter order doesn't change the result, so it shouldn't change the key
+        normalized = tuple(
+            sorted(
+                (key, tuple(sorted(map(str, values))))
+                for key, values in (query_params or {}).items()
+            )
+        )
+        return auth, url, normalized
+
+    def ttl_for(self, endpoint: str):
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, key):
+        """Returns the cached response for a key, or None if there is no fresh one."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key, value, endpoint: str):
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, url: str, include_children: bool = True):
+        """Drops every response cached for a URL, whatever its query params or
+        the token it was fetched with.
+
+        :param url: The URL to drop responses for
+        :param include_children: Whether to also drop URLs nested under it
+        """
+        child_prefix = f"{url}/"
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if key[1] == url
+                or (include_children and key[1].startswith(child_prefix))
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._stats.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Returns a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                invalidations=self._stats.invalidations,
+                size=len(self._entries),
+            )
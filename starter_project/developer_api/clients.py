@@ -1,21 +1,74 @@
+import asyncio
+import hashlib
 import json
 import os
 import re
+import time
 from collections import defaultdict
+from collections.abc import Iterable
+from functools import partial
 
-import requests
+import aiohttp
 
-from starter_project.developer_api.filters import FilterRelation
+from starter_project.developer_api import json_backend
+from starter_project.developer_api.bulk import (
+    BatchExecutor,
+    Operation,
+    async_fan_out,
+    fan_out,
+    unique_keys,
+)
+from starter_project.developer_api.cache import ResponseCache
+from starter_project.developer_api.coalescing import AsyncSingleFlight, SingleFlight
+from starter_project.developer_api.filters import (
+    ContradictoryFiltersError,
+    FilterRelation,
+    reduce_filters,
+)
+from starter_project.developer_api.instrumentation import (
+    Instrumentation,
+    RequestEvent,
+)
 from starter_project.developer_api.models import (
-    ProductType,
-    AccountState,
     Account,
-    TransactionStatus,
+    AccountState,
+    LazyAccount,
+    LazyTransaction,
+    ProductType,
     Transaction,
+    TransactionStatus,
 )
+from starter_project.developer_api.ratelimit import (
+    AdaptiveRateController,
+    parse_retry_after,
+)
+from starter_project.developer_api.streaming import JsonArrayStreamParser, chunked
+from starter_project.developer_api.transport import HttpTransport, Transport
+
 
+class ApiResponseError(ValueError):
+    """Raised when the API answers a request with a status outside 2xx. It is
+    a ValueError so code that caught the client's original error still does.
+    """
+
+    def __init__(self, method: str, url: str, status_code: int, retry_after=None):
+        """
+        :param method: The HTTP method of the request
+        :param url: The path of the endpoint under SERVICE_URL
+        :param status_code: The status the API answered with
+        :param retry_after: The seconds a Retry-After header asked to wait, if any
+        """
+        super().__init__(f"{method} {url} failed with status {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class BaseDeveloperApiClient:
+    """Holds everything the blocking and asyncio clients share: URLs, headers,
+    query building, request payloads and response deserialization. Only the
+    way requests are sent differs between the two.
+    """
 
-class DeveloperApiClient:
     MONETARY_PATTERN = r"^-?\d+(\.\d{1,2})?$"
     SERVICE_URL = (
         "https://sandbox.capitalone.co.uk/developer-services-platform-pr/api/data"
@@ -25,36 +78,114 @@ class DeveloperApiClient:
 
     ACCOUNTS_JSON_KEY = "Accounts"
     TRANSACTIONS_JSON_KEY = "Transactions"
+    STREAM_CHUNK_SIZE = 64 * 1024
 
-    def __init__(self, bearer_auth_token=None):
+    # Maps request paths to their endpoint template, most specific first
+    ENDPOINT_TEMPLATES = (
+        (re.compile(r"^accounts/create$"), "accounts/create"),
+        (re.compile(r"^accounts/[^/]+$"), "accounts/{account_id}"),
+        (
+            re.compile(r"^transactions/accounts/[^/]+/create$"),
+            "transactions/accounts/{account_id}/create",
+        ),
+        (
+            re.compile(r"^transactions/accounts/[^/]+/transactions$"),
+            "transactions/accounts/{account_id}/transactions",
+        ),
+        (
+            re.compile(r"^transactions/accounts/[^/]+/transactions/[^/]+$"),
+            "transactions/accounts/{account_id}/transactions/{transaction_id}",
+        ),
+    )
+
+    def __init__(
+        self,
+        bearer_auth_token=None,
+        cache: ResponseCache = None,
+        service_url: str | None = None,
+        instrumentation: Instrumentation = None,
+    ):
+        if service_url is not None:
+            self.SERVICE_URL = service_url.rstrip("/")
         if bearer_auth_token is None:
             bearer_auth_token = os.environ["DEVAPI_TOKEN"]
+        # Cache keys hold a digest of the token rather than the token itself
+        self._auth_identity = hashlib.sha256(bearer_auth_token.encode()).hexdigest()
         self._headers = {
             "Authorization": f"Bearer {bearer_auth_token}",
             "Content-Type": self.CONTENT_TYPE,
             "Version": self.VERSION,
         }
+        self.cache = cache
+        self.instrumentation = instrumentation
 
-    def _get(self, base_url: str, query_params: dict = {}):
-        url = f"{self.SERVICE_URL}/{base_url}"
-        response = requests.get(url, headers=self._headers, params=query_params)
-        return response.json()
+    @classmethod
+    def _endpoint_template(cls, base_url: str):
+        for pattern, template in cls.ENDPOINT_TEMPLATES:
+            if pattern.match(base_url):
+                return template
+        return base_url
 
-    def _post(self, base_url: str, payload: dict):
-        """
+    def _record(
+        self,
+        method: str,
+        base_url: str,
+        started: float,
+        received: float | None = None,
+        decoded: float | None = None,
+        **details,
+    ):
+        # The network, decode and model phases end at received, decoded and
+        # now. A request that failed before a phase finished records no time
+        # for that phase or the ones after it.
+        finished = time.perf_counter()
+        if received is None:
+            received = finished
+        if decoded is None:
+            decoded = finished = received
+        self.instrumentation.record(
+            RequestEvent(
+                method,
+                self._endpoint_template(base_url),
+                network_time=received - started,
+                decode_time=decoded - received,
+                model_time=finished - decoded,
+                **details,
+            )
+        )
 
-        :param base_url:
-        :param payload:
-        """
-        url = f"{self.SERVICE_URL}/{base_url}"
-        response = requests.post(url, headers=self._headers, data=json.dumps(payload))
-        if 200 <= response.status_code < 300:
-            return response.json()
-        raise ValueError("TODO: Needs better networking response")
+    def _cache_key(self, url: str, query_params: dict):
+        if self.cache is None:
+            return None
+        return self.cache.make_key(url, query_params, self._auth_identity)
+
+    def _invalidate_accounts(self):
+        if self.cache is not None:
+            self.cache.invalidate(
+                f"{self.SERVICE_URL}/accounts", include_children=False
+            )
+
+    def _invalidate_account(self, account_id: str):
+        # New transactions can move the account's balance as well as its
+        # transaction list
+        if self.cache is not None:
+            self._invalidate_accounts()
+            self.cache.invalidate(f"{self.SERVICE_URL}/accounts/{account_id}")
+            self.cache.invalidate(
+                f"{self.SERVICE_URL}/transactions/accounts/{account_id}"
+            )
 
     @staticmethod
     def _construct_query_params_from_filters(filters: list[FilterRelation]):
-        # Filter is present so run filter reduction algorithm
+        """Builds query params from the reduced filters.
+
+        :return: The query params, or None if the filters contradict each other
+        """
+        try:
+            filters = reduce_filters(filters)
+        except ContradictoryFiltersError:
+            return None
+
         query_params = defaultdict(list)
         for filter_ in filters:
             query_params[filter_.key].append(
@@ -63,6 +194,294 @@ class DeveloperApiClient:
 
         return dict(query_params)
 
+    def _create_accounts_payload(
+        self,
+        quantity: int,
+        num_transactions: int = 0,
+        live_balance: bool = True,
+        balance: str | None = None,
+        credit_score: int | None = None,
+        currency_code: str | None = None,
+        product_type: ProductType | None = None,
+        risk_score: int | None = None,
+        state: AccountState | None = None,
+        credit_limit: str | None = None,
+    ):
+        payload = {
+            "quantity": quantity,
+            "numTransactions": num_transactions,
+            "liveBalance": live_balance,
+        }
+        if balance is not None:
+            payload["balance"] = balance
+        if credit_score is not None:
+            payload["creditScore"] = credit_score
+        if currency_code is not None:
+            payload["currencyCode"] = currency_code
+        if product_type is not None:
+            payload["productType"] = product_type
+        if risk_score is not None:
+            payload["riskScore"] = risk_score
+        if state is not None:
+            payload["state"] = state
+        if credit_limit is not None:
+            payload["creditLimit"] = credit_limit
+        return payload
+
+    def _create_transactions_payload(
+        self,
+        quantity: int,
+        amount: float | None = None,
+        currency: str | None = None,
+        credit_debit_indicator: ProductType | None = None,
+        emoji: str | None = None,
+        status: TransactionStatus | None = None,
+    ):
+        payload = {"quantity": quantity}
+
+        if amount is not None:
+            if not re.match(self.MONETARY_PATTERN, f"{amount}"):
+                raise ValueError("amount must be a valid monetary value")
+            payload["amount"] = amount
+        if currency is not None:
+            payload["currency"] = currency
+        if credit_debit_indicator is not None:
+            payload["credit_debit_indicator"] = credit_debit_indicator
+        if emoji is not None:
+            payload["emoji"] = emoji
+        if status is not None:
+            payload["status"] = status
+        return payload
+
+    def _deserialize_accounts(self, accounts_response: dict, lazy: bool = False):
+        accounts = accounts_response.get(self.ACCOUNTS_JSON_KEY, [])
+        model = LazyAccount if lazy else Account
+        return [model.deserialize(account) for account in accounts]
+
+    def _deserialize_account(self, account_response: dict):
+        return Account.deserialize(account_response[self.ACCOUNTS_JSON_KEY][0])
+
+    def _deserialize_transactions(
+        self, transactions_response: dict, lazy: bool = False
+    ):
+        transactions = transactions_response.get(self.TRANSACTIONS_JSON_KEY, [])
+        model = LazyTransaction if lazy else Transaction
+        return [model.deserialize(transaction) for transaction in transactions]
+
+    def _deserialize_transaction(self, transaction_response: dict):
+        # A single transaction may come back bare or wrapped like the list endpoint
+        if self.TRANSACTIONS_JSON_KEY in transaction_response:
+            transaction_response = transaction_response[self.TRANSACTIONS_JSON_KEY][0]
+        return Transaction.deserialize(transaction_response)
+
+
+class DeveloperApiClient(BaseDeveloperApiClient):
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(
+        self,
+        bearer_auth_token=None,
+        transport: Transport = None,
+        cache: ResponseCache = None,
+        service_url: str | None = None,
+        instrumentation: Instrumentation = None,
+        rate_controller: AdaptiveRateController = None,
+        single_flight: SingleFlight = None,
+    ):
+        """
+        :param bearer_auth_token: Your API token, read from DEVAPI_TOKEN if not given
+        :param transport: The transport used to send requests, a pooled HttpTransport by default
+        :param cache: An optional cache for GET responses, nothing is cached if not given
+        :param service_url: The API base URL to use instead of SERVICE_URL, such as a LocalDeveloperApi
+        :param instrumentation: Records timings and sizes of every request if given
+        :param rate_controller: Paces requests and adapts to throttling, can be shared
+            with other clients and transports. Only used with the default transport,
+            give a custom HttpTransport its own instead.
+        :param single_flight: Makes concurrent identical GETs share one request if given
+        """
+        super().__init__(bearer_auth_token, cache, service_url, instrumentation)
+        self.single_flight = single_flight
+        if transport is None:
+            transport = HttpTransport(rate_controller=rate_controller)
+        elif rate_controller is not None:
+            raise ValueError("rate_controller only applies to the default transport")
+        self._transport = transport
+
+    @property
+    def transport(self):
+        """The transport requests are sent through."""
+        return self._transport
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes the underlying transport and any pooled connections."""
+        self._transport.close()
+
+    def _get(self, base_url: str, query_params: dict | None = None, deserialize=None):
+        """
+        :param base_url: The path of the endpoint under SERVICE_URL
+        :param query_params: The query params built from the filters
+        :param deserialize: Builds the result from the decoded JSON, which is returned as is if not given
+        """
+        if query_params is None:
+            query_params = {}
+        url = f"{self.SERVICE_URL}/{base_url}"
+        cache_key = self._cache_key(url, query_params)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached if deserialize is None else deserialize(cached)
+
+        sent = False
+
+        def fetch():
+            nonlocal sent
+            sent = True
+            return self._fetch(base_url, url, query_params, cache_key)
+
+        if self.single_flight is None:
+            response_data, record = fetch()
+        else:
+            response_data, record = self.single_flight.do(
+                ResponseCache.make_key(url, query_params, self._auth_identity), fetch
+            )
+        result = response_data if deserialize is None else deserialize(response_data)
+        # Only the caller that sent the request records it, once its models are
+        # built, so coalesced reads still get a model time
+        if sent and record is not None:
+            record()
+        return result
+
+    def _fetch(
+        self,
+        base_url: str,
+        url: str,
+        query_params: dict,
+        cache_key,
+    ):
+        # Returns the decoded JSON and, when instrumented, a callable that
+        # records the request once the caller has built its models
+        started = time.perf_counter()
+        try:
+            response = self._transport.request(
+                "GET", url, headers=self._headers, params=query_params
+            )
+        except Exception as error:
+            if self.instrumentation is not None:
+                self._record("GET", base_url, started, error=error)
+            raise
+        received = time.perf_counter()
+        if not 200 <= response.status_code < 300:
+            if self.instrumentation is not None:
+                self._record(
+                    "GET",
+                    base_url,
+                    started,
+                    received,
+                    status_code=response.status_code,
+                    bytes_received=len(response.content),
+                )
+            raise ApiResponseError(
+                "GET",
+                base_url,
+                response.status_code,
+                parse_retry_after(response.headers.get("Retry-After")),
+            )
+        response_data = json_backend.loads(response.content)
+        decoded = time.perf_counter()
+        if cache_key is not None:
+            self.cache.set(cache_key, response_data, self._endpoint_template(base_url))
+        record = None
+        if self.instrumentation is not None:
+            record = partial(
+                self._record,
+                "GET",
+                base_url,
+                started,
+                received,
+                decoded,
+                status_code=response.status_code,
+                bytes_received=len(response.content),
+            )
+        return response_data, record
+
+    def _iter_records(self, base_url: str, query_params: dict, json_key: str):
+        url = f"{self.SERVICE_URL}/{base_url}"
+        response = self._transport.request(
+            "GET", url, headers=self._headers, params=query_params, stream=True
+        )
+        try:
+            if not 200 <= response.status_code < 300:
+                raise ApiResponseError(
+                    "GET",
+                    base_url,
+                    response.status_code,
+                    parse_retry_after(response.headers.get("Retry-After")),
+                )
+            parser = JsonArrayStreamParser(json_key)
+            for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                yield from parser.feed(chunk)
+            yield from parser.close()
+        finally:
+            response.close()
+
+    def _post(self, base_url: str, payload: dict, deserialize=None):
+        """
+        :param base_url: The path of the endpoint under SERVICE_URL
+        :param payload: The request body, sent as JSON
+        :param deserialize: Builds the result from the decoded JSON, which is returned as is if not given
+        """
+        url = f"{self.SERVICE_URL}/{base_url}"
+        data = json.dumps(payload)
+        started = time.perf_counter()
+        try:
+            response = self._transport.request(
+                "POST", url, headers=self._headers, data=data
+            )
+        except Exception as error:
+            if self.instrumentation is not None:
+                self._record("POST", base_url, started, error=error)
+            raise
+        received = time.perf_counter()
+        if not 200 <= response.status_code < 300:
+            if self.instrumentation is not None:
+                self._record(
+                    "POST",
+                    base_url,
+                    started,
+                    received,
+                    status_code=response.status_code,
+                    bytes_sent=len(data.encode()),
+                    bytes_received=len(response.content),
+                )
+            raise ApiResponseError(
+                "POST",
+                base_url,
+                response.status_code,
+                parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+        response_data = json_backend.loads(response.content)
+        decoded = time.perf_counter()
+        result = response_data if deserialize is None else deserialize(response_data)
+        if self.instrumentation is not None:
+            self._record(
+                "POST",
+                base_url,
+                started,
+                received,
+                decoded,
+                status_code=response.status_code,
+                bytes_sent=len(data.encode()),
+                bytes_received=len(response.content),
+            )
+        return result
+
     def create_accounts(
         self,
         quantity: int,
@@ -89,41 +508,41 @@ class DeveloperApiClient:
         :param num_transactions:
         """
         base_url = "accounts/create"
-        payload = {
-            "quantity": quantity,
-            "numTransactions": num_transactions,
-            "liveBalance": live_balance,
-        }
-        if balance is not None:
-            payload["balance"] = balance
-        if credit_score is not None:
-            payload["creditScore"] = credit_score
-        if currency_code is not None:
-            payload["currencyCode"] = currency_code
-        if product_type is not None:
-            payload["productType"] = product_type
-        if risk_score is not None:
-            payload["riskScore"] = risk_score
-        if state is not None:
-            payload["state"] = state
-        if credit_limit is not None:
-            payload["creditLimit"] = credit_limit
+        payload = self._create_accounts_payload(
+            quantity,
+            num_transactions=num_transactions,
+            live_balance=live_balance,
+            balance=balance,
+            credit_score=credit_score,
+            currency_code=currency_code,
+            product_type=product_type,
+            risk_score=risk_score,
+            state=state,
+            credit_limit=credit_limit,
+        )
 
-        accounts_data = self._post(base_url, payload)
-        accounts = accounts_data.get(self.ACCOUNTS_JSON_KEY, [])
-        return [Account.deserialize(account) for account in accounts]
+        accounts = self._post(base_url, payload, self._deserialize_accounts)
+        self._invalidate_accounts()
+        return accounts
 
-    def get_accounts(self, filters: list[FilterRelation] = []):
+    def get_accounts(
+        self, filters: list[FilterRelation] | None = None, lazy: bool = False
+    ):
         """Gets all accounts created with your authorization token.
 
         :param filters: A list of optional filter to use when requesting all accounts
+        :param lazy: Return LazyAccount views that only convert the fields you read
         """
+        if filters is None:
+            filters = []
         base_url = "accounts"
 
         query_params = self._construct_query_params_from_filters(filters)
-        accounts_response = self._get(base_url, query_params=query_params)
-        accounts = accounts_response.get(self.ACCOUNTS_JSON_KEY, [])
-        return [Account.deserialize(account) for account in accounts]
+        if query_params is None:
+            return []
+        return self._get(
+            base_url, query_params, partial(self._deserialize_accounts, lazy=lazy)
+        )
 
     def get_account(self, account_id: str):
         """Gets a specific accounts data using an account's ID.
@@ -131,8 +550,7 @@ class DeveloperApiClient:
         :param account_id: The Account ID of the account you're looking for.
         """
         base_url = f"accounts/{account_id}"
-        account = self._get(base_url)[self.ACCOUNTS_JSON_KEY][0]
-        return Account.deserialize(account)
+        return self._get(base_url, deserialize=self._deserialize_account)
 
     def create_transactions(
         self,
@@ -157,41 +575,42 @@ class DeveloperApiClient:
         """
 
         base_url = f"transactions/accounts/{account_id}/create"
-        payload = {"quantity": quantity}
-
-        if amount is not None:
-            if not re.match(self.MONETARY_PATTERN, f"{amount}"):
-                raise ValueError("amount must be a valid monetary value")
-            payload["amount"] = amount
-        if currency is not None:
-            payload["currency"] = currency
-        if credit_debit_indicator is not None:
-            payload["credit_debit_indicator"] = credit_debit_indicator
-        if emoji is not None:
-            payload["emoji"] = emoji
-        if status is not None:
-            payload["status"] = status
+        payload = self._create_transactions_payload(
+            quantity,
+            amount=amount,
+            currency=currency,
+            credit_debit_indicator=credit_debit_indicator,
+            emoji=emoji,
+            status=status,
+        )
 
-        transactions_data = self._post(base_url, payload)
-        transactions = transactions_data.get(self.TRANSACTIONS_JSON_KEY, [])
-
-        return [Transaction.deserialize(transaction) for transaction in transactions]
+        transactions = self._post(base_url, payload, self._deserialize_transactions)
+        self._invalidate_account(account_id)
+        return transactions
 
     def get_transactions(
-        self, account_id: str, transaction_filters: list[FilterRelation] = []
+        self,
+        account_id: str,
+        transaction_filters: list[FilterRelation] | None = None,
+        lazy: bool = False,
     ):
         """Creates a group of transactions associated with the account you provide.
 
         :param account_id: The Account ID of the account you're looking to populate with transactions
         :param quantity: The number of transactions you wish to create. You can create up to 25 at one time
         :param transaction_filters: A list of optional filters to use when requesting all transactions
+        :param lazy: Return LazyTransaction views that only convert the fields you read
         :return: A list of transactions created
         """
+        if transaction_filters is None:
+            transaction_filters = []
         base_url = f"transactions/accounts/{account_id}/transactions"
         query_params = self._construct_query_params_from_filters(transaction_filters)
-        transactions_response = self._get(base_url, query_params=query_params)
-        accounts = transactions_response._get(self.TRANSACTIONS_JSON_KEY, [])
-        return [Transaction.deserialize(account) for account in accounts]
+        if query_params is None:
+            return []
+        return self._get(
+            base_url, query_params, partial(self._deserialize_transactions, lazy=lazy)
+        )
 
     def get_transaction(self, account_id: str, transaction_id: str):
         """Gets a specific transaction associated with a specific account you provide.
@@ -201,4 +620,700 @@ class DeveloperApiClient:
         :return: The transaction associated with the account and transaction ID you provided.
         """
         base_url = f"transactions/accounts/{account_id}/transactions/{transaction_id}"
-        return self._get(base_url)
+        return self._get(base_url, deserialize=self._deserialize_transaction)
+
+    def iter_accounts(self, filters: list[FilterRelation] | None = None):
+        """Streams all accounts created with your authorization token, parsing
+        the response as it arrives and yielding one account at a time.
+
+        :param filters: A list of optional filter to use when requesting all accounts
+        """
+        if filters is None:
+            filters = []
+        query_params = self._construct_query_params_from_filters(filters)
+        if query_params is None:
+            return
+        for account in self._iter_records(
+            "accounts", query_params, self.ACCOUNTS_JSON_KEY
+        ):
+            yield Account.deserialize(account)
+
+    def iter_accounts_chunked(
+        self, filters: list[FilterRelation] | None = None, chunk_size: int = 100
+    ):
+        """Streams all accounts in lists of at most ``chunk_size`` accounts.
+
+        :param filters: A list of optional filter to use when requesting all accounts
+        :param chunk_size: The maximum number of accounts in each list
+        """
+        return chunked(self.iter_accounts(filters), chunk_size)
+
+    def iter_transactions(
+        self, account_id: str, transaction_filters: list[FilterRelation] | None = None
+    ):
+        """Streams the transactions of the account you provide, parsing the
+        response as it arrives and yielding one transaction at a time.
+
+        :param account_id: The Account ID of the account whose transactions you want
+        :param transaction_filters: A list of optional filters to use when requesting all transactions
+        """
+        if transaction_filters is None:
+            transaction_filters = []
+        base_url = f"transactions/accounts/{account_id}/transactions"
+        query_params = self._construct_query_params_from_filters(transaction_filters)
+        if query_params is None:
+            return
+        for transaction in self._iter_records(
+            base_url, query_params, self.TRANSACTIONS_JSON_KEY
+        ):
+            yield Transaction.deserialize(transaction)
+
+    def iter_transactions_chunked(
+        self,
+        account_id: str,
+        transaction_filters: list[FilterRelation] | None = None,
+        chunk_size: int = 100,
+    ):
+        """Streams the transactions of the account you provide in lists of at
+        most ``chunk_size`` transactions.
+
+        :param account_id: The Account ID of the account whose transactions you want
+        :param transaction_filters: A list of optional filters to use when requesting all transactions
+        :param chunk_size: The maximum number of transactions in each list
+        """
+        return chunked(
+            self.iter_transactions(account_id, transaction_filters), chunk_size
+        )
+
+    def iter_accounts_by_ids(
+        self, account_ids: list[str], max_workers: int | None = None
+    ):
+        """Fetches many accounts in parallel, yielding each one as soon as it arrives.
+
+        :param account_ids: The Account IDs to fetch, duplicates are only fetched once
+        :param max_workers: The number of requests to run at once
+        :return: A generator of BulkResult keyed by account ID, in completion order
+        """
+        return fan_out(
+            self.get_account, account_ids, max_workers or self.DEFAULT_MAX_WORKERS
+        )
+
+    def get_accounts_by_ids(
+        self, account_ids: list[str], max_workers: int | None = None
+    ):
+        """Fetches many accounts in parallel.
+
+        :param account_ids: The Account IDs to fetch, duplicates are only fetched once
+        :param max_workers: The number of requests to run at once
+        :return: A dict of BulkResult keyed by account ID, in the order the IDs were given
+        """
+        results = {
+            result.key: result
+            for result in self.iter_accounts_by_ids(account_ids, max_workers)
+        }
+        return {key: results[key] for key in unique_keys(account_ids)}
+
+    def iter_transactions_for_accounts(
+        self,
+        account_ids: list[str],
+        transaction_filters: list[FilterRelation] | None = None,
+        max_workers: int | None = None,
+    ):
+        """Fetches the transactions of many accounts in parallel, yielding each
+        account's transactions as soon as they arrive.
+
+        :param account_ids: The Account IDs to fetch transactions for, duplicates are only fetched once
+        :param transaction_filters: A list of optional filters applied to every account
+        :param max_workers: The number of requests to run at once
+        :return: A generator of BulkResult keyed by account ID, in completion order
+        """
+        if transaction_filters is None:
+            transaction_filters = []
+        return fan_out(
+            lambda account_id: self.get_transactions(account_id, transaction_filters),
+            account_ids,
+            max_workers or self.DEFAULT_MAX_WORKERS,
+        )
+
+    def get_transactions_for_accounts(
+        self,
+        account_ids: list[str],
+        transaction_filters: list[FilterRelation] | None = None,
+        max_workers: int | None = None,
+    ):
+        """Fetches the transactions of many accounts in parallel.
+
+        :param account_ids: The Account IDs to fetch transactions for, duplicates are only fetched once
+        :param transaction_filters: A list of optional filters applied to every account
+        :param max_workers: The number of requests to run at once
+        :return: A dict of BulkResult keyed by account ID, in the order the IDs were given
+        """
+        if transaction_filters is None:
+            transaction_filters = []
+        results = {
+            result.key: result
+            for result in self.iter_transactions_for_accounts(
+                account_ids, transaction_filters, max_workers
+            )
+        }
+        return {key: results[key] for key in unique_keys(account_ids)}
+
+    def _operation_call(self, operation: Operation):
+        if operation.method.startswith("_") or not callable(
+            getattr(self, operation.method, None)
+        ):
+            raise ValueError(f"{operation.method} is not a client method")
+        return partial(
+            getattr(self, operation.method), *operation.args, **operation.kwargs
+        )
+
+    def iter_batch(
+        self,
+        operations: Iterable[Operation],
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        max_pending: int | None = None,
+    ):
+        """Runs client calls on a thread pool sharing this client's connections
+        and yields a BulkResult for each, keyed by its Operation, in the order
+        given.
+
+        Operations are only taken from ``operations`` as there is room in the
+        queue, so a generator of any length can be passed without building
+        every call up front.
+
+        :param operations: The Operations to run, such as ``Operation("get_account", account_id)``
+        :param max_workers: The number of calls to run at once
+        :param timeout: Seconds a call may run for before it fails with TimeoutError,
+            unless its Operation has a timeout of its own
+        :param deadline: Seconds from now after which unfinished calls fail with TimeoutError
+        :param max_pending: The number of calls queued or running at once, four per worker by default
+        """
+        max_workers = max_workers or self.DEFAULT_MAX_WORKERS
+        with BatchExecutor(max_workers, max_pending) as executor:
+            yield from executor.map(
+                (
+                    (operation, self._operation_call(operation), operation.timeout)
+                    for operation in operations
+                ),
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+    def batch(
+        self,
+        operations: Iterable[Operation],
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        max_pending: int | None = None,
+    ):
+        """Runs client calls in parallel and returns their results in order.
+        See iter_batch for the parameters.
+
+        :return: A list of BulkResult, one per Operation in the order given
+        """
+        return list(
+            self.iter_batch(operations, max_workers, timeout, deadline, max_pending)
+        )
+
+
+class AsyncDeveloperApiClient(BaseDeveloperApiClient):
+    """An asyncio twin of DeveloperApiClient built on a shared aiohttp session.
+
+    At most ``max_concurrency`` requests are in flight at once, any further
+    calls wait for a free slot. Cancelling a task that is waiting on a call
+    aborts its request and releases its slot. A shared AdaptiveRateController
+    can hold the number in flight below that, at what the API sustains.
+    """
+
+    DEFAULT_TIMEOUT = 10.0
+
+    def __init__(
+        self,
+        bearer_auth_token=None,
+        max_concurrency: int = 100,
+        timeout: float = DEFAULT_TIMEOUT,
+        session: aiohttp.ClientSession = None,
+        cache: ResponseCache = None,
+        service_url: str | None = None,
+        instrumentation: Instrumentation = None,
+        rate_controller: AdaptiveRateController = None,
+        single_flight: AsyncSingleFlight = None,
+    ):
+        """
+        :param bearer_auth_token: Your API token, read from DEVAPI_TOKEN if not given
+        :param max_concurrency: The maximum number of requests in flight at once
+        :param timeout: Total timeout in seconds for a single request
+        :param session: An existing session to use, one is created on first use if not given
+        :param cache: An optional cache for GET responses, nothing is cached if not given
+        :param service_url: The API base URL to use instead of SERVICE_URL, such as a LocalDeveloperApi
+        :param instrumentation: Records timings and sizes of every request if given
+        :param rate_controller: Paces requests and adapts to throttling, can be shared
+            with other clients and transports
+        :param single_flight: Makes concurrent identical GETs share one request if given
+        """
+        super().__init__(bearer_auth_token, cache, service_url, instrumentation)
+        self.single_flight = single_flight
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = None
+        self.rate_controller = rate_controller
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes the session if it was created by this client."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self):
+        # Both the session and the semaphore have to be created inside the
+        # running event loop
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def _acquire(self):
+        if self.rate_controller is not None:
+            await self.rate_controller.acquire_async()
+
+    def _release(
+        self, response: aiohttp.ClientResponse | None = None, cancelled: bool = False
+    ):
+        if self.rate_controller is None:
+            return
+        if response is not None:
+            self.rate_controller.release(
+                response.status,
+                parse_retry_after(response.headers.get("Retry-After")),
+            )
+        elif cancelled:
+            self.rate_controller.cancel()
+        else:
+            self.rate_controller.release()
+
+    @staticmethod
+    def _flatten_query_params(query_params: dict):
+        # aiohttp doesn't expand list values into repeated keys like requests does
+        return [
+            (key, value) for key, values in query_params.items() for value in values
+        ]
+
+    async def _get(
+        self, base_url: str, query_params: dict | None = None, deserialize=None
+    ):
+        if query_params is None:
+            query_params = {}
+        url = f"{self.SERVICE_URL}/{base_url}"
+        cache_key = self._cache_key(url, query_params)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached if deserialize is None else deserialize(cached)
+
+        sent = False
+
+        async def fetch():
+            nonlocal sent
+            sent = True
+            return await self._fetch(base_url, url, query_params, cache_key)
+
+        if self.single_flight is None:
+            response_data, record = await fetch()
+        else:
+            response_data, record = await self.single_flight.do(
+                ResponseCache.make_key(url, query_params, self._auth_identity), fetch
+            )
+        result = response_data if deserialize is None else deserialize(response_data)
+        if sent and record is not None:
+            record()
+        return result
+
+    async def _fetch(
+        self,
+        base_url: str,
+        url: str,
+        query_params: dict,
+        cache_key,
+    ):
+        session = self._get_session()
+        async with self._semaphore:
+            await self._acquire()
+            started = time.perf_counter()
+            response = None
+            cancelled = False
+            try:
+                async with session.get(
+                    url,
+                    headers=self._headers,
+                    params=self._flatten_query_params(query_params),
+                ) as response:
+                    body = await response.read()
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            except Exception as error:
+                if self.instrumentation is not None:
+                    self._record("GET", base_url, started, error=error)
+                raise
+            finally:
+                self._release(response, cancelled)
+        received = time.perf_counter()
+        if not 200 <= response.status < 300:
+            if self.instrumentation is not None:
+                self._record(
+                    "GET",
+                    base_url,
+                    started,
+                    received,
+                    status_code=response.status,
+                    bytes_received=len(body),
+                )
+            raise ApiResponseError(
+                "GET",
+                base_url,
+                response.status,
+                parse_retry_after(response.headers.get("Retry-After")),
+            )
+        response_data = json_backend.loads(body)
+        decoded = time.perf_counter()
+        if cache_key is not None:
+            self.cache.set(cache_key, response_data, self._endpoint_template(base_url))
+        record = None
+        if self.instrumentation is not None:
+            record = partial(
+                self._record,
+                "GET",
+                base_url,
+                started,
+                received,
+                decoded,
+                status_code=response.status,
+                bytes_received=len(body),
+            )
+        return response_data, record
+
+    async def _iter_records(self, base_url: str, query_params: dict, json_key: str):
+        url = f"{self.SERVICE_URL}/{base_url}"
+        session = self._get_session()
+        async with self._semaphore:
+            await self._acquire()
+            response = None
+            cancelled = False
+            try:
+                async with session.get(
+                    url,
+                    headers=self._headers,
+                    params=self._flatten_query_params(query_params),
+                ) as response:
+                    if not 200 <= response.status < 300:
+                        raise ApiResponseError(
+                            "GET",
+                            base_url,
+                            response.status,
+                            parse_retry_after(response.headers.get("Retry-After")),
+                        )
+                    parser = JsonArrayStreamParser(json_key)
+                    async for chunk in response.content.iter_chunked(
+                        self.STREAM_CHUNK_SIZE
+                    ):
+                        for record in parser.feed(chunk):
+                            yield record
+                    for record in parser.close():
+                        yield record
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                self._release(response, cancelled)
+
+    async def _post(self, base_url: str, payload: dict, deserialize=None):
+        url = f"{self.SERVICE_URL}/{base_url}"
+        data = json.dumps(payload)
+        session = self._get_session()
+        async with self._semaphore:
+            await self._acquire()
+            started = time.perf_counter()
+            response = None
+            cancelled = False
+            try:
+                async with session.post(
+                    url, headers=self._headers, data=data
+                ) as response:
+                    body = await response.read()
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            except Exception as error:
+                if self.instrumentation is not None:
+                    self._record("POST", base_url, started, error=error)
+                raise
+            finally:
+                self._release(response, cancelled)
+        received = time.perf_counter()
+        if not 200 <= response.status < 300:
+            if self.instrumentation is not None:
+                self._record(
+                    "POST",
+                    base_url,
+                    started,
+                    received,
+                    status_code=response.status,
+                    bytes_sent=len(data.encode()),
+                    bytes_received=len(body),
+                )
+            raise ApiResponseError(
+                "POST",
+                base_url,
+                response.status,
+                parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+        response_data = json_backend.loads(body)
+        decoded = time.perf_counter()
+        result = response_data if deserialize is None else deserialize(response_data)
+        if self.instrumentation is not None:
+            self._record(
+                "POST",
+                base_url,
+                started,
+                received,
+                decoded,
+                status_code=response.status,
+                bytes_sent=len(data.encode()),
+                bytes_received=len(body),
+            )
+        return result
+
+    async def create_accounts(
+        self,
+        quantity: int,
+        num_transactions: int = 0,
+        live_balance: bool = True,
+        balance: str | None = None,
+        credit_score: int | None = None,
+        currency_code: str | None = None,
+        product_type: ProductType | None = None,
+        risk_score: int | None = None,
+        state: AccountState | None = None,
+        credit_limit: str | None = None,
+    ):
+        """Creates an account with customised account information if specified.
+        See DeveloperApiClient.create_accounts for the parameters.
+        """
+        base_url = "accounts/create"
+        payload = self._create_accounts_payload(
+            quantity,
+            num_transactions=num_transactions,
+            live_balance=live_balance,
+            balance=balance,
+            credit_score=credit_score,
+            currency_code=currency_code,
+            product_type=product_type,
+            risk_score=risk_score,
+            state=state,
+            credit_limit=credit_limit,
+        )
+
+        accounts = await self._post(base_url, payload, self._deserialize_accounts)
+        self._invalidate_accounts()
+        return accounts
+
+    async def get_accounts(
+        self, filters: list[FilterRelation] | None = None, lazy: bool = False
+    ):
+        """Gets all accounts created with your authorization token.
+
+        :param filters: A list of optional filter to use when requesting all accounts
+        :param lazy: Return LazyAccount views that only convert the fields you read
+        """
+        if filters is None:
+            filters = []
+        base_url = "accounts"
+
+        query_params = self._construct_query_params_from_filters(filters)
+        if query_params is None:
+            return []
+        return await self._get(
+            base_url, query_params, partial(self._deserialize_accounts, lazy=lazy)
+        )
+
+    async def get_account(self, account_id: str):
+        """Gets a specific accounts data using an account's ID.
+
+        :param account_id: The Account ID of the account you're looking for.
+        """
+        base_url = f"accounts/{account_id}"
+        return await self._get(base_url, deserialize=self._deserialize_account)
+
+    async def create_transactions(
+        self,
+        account_id: str,
+        quantity: int,
+        amount: float | None = None,
+        currency: str | None = None,
+        credit_debit_indicator: ProductType | None = None,
+        emoji: str | None = None,
+        status: TransactionStatus | None = None,
+    ):
+        """Creates a group of transactions associated with the account you provide.
+        See DeveloperApiClient.create_transactions for the parameters.
+        """
+        base_url = f"transactions/accounts/{account_id}/create"
+        payload = self._create_transactions_payload(
+            quantity,
+            amount=amount,
+            currency=currency,
+            credit_debit_indicator=credit_debit_indicator,
+            emoji=emoji,
+            status=status,
+        )
+
+        transactions = await self._post(
+            base_url, payload, self._deserialize_transactions
+        )
+        self._invalidate_account(account_id)
+        return transactions
+
+    async def get_transactions(
+        self,
+        account_id: str,
+        transaction_filters: list[FilterRelation] | None = None,
+        lazy: bool = False,
+    ):
+        """Gets the transactions associated with the account you provide.
+
+        :param account_id: The Account ID of the account whose transactions you want
+        :param transaction_filters: A list of optional filters to use when requesting all transactions
+        :param lazy: Return LazyTransaction views that only convert the fields you read
+        :return: A list of transactions
+        """
+        if transaction_filters is None:
+            transaction_filters = []
+        base_url = f"transactions/accounts/{account_id}/transactions"
+        query_params = self._construct_query_params_from_filters(transaction_filters)
+        if query_params is None:
+            return []
+        return await self._get(
+            base_url, query_params, partial(self._deserialize_transactions, lazy=lazy)
+        )
+
+    async def get_transaction(self, account_id: str, transaction_id: str):
+        """Gets a specific transaction associated with a specific account you provide.
+
+        :param account_id: The Account ID of the account you're looking for.
+        :param transaction_id: The transaction ID of the transaction you're looking for.
+        :return: The transaction associated with the account and transaction ID you provided.
+        """
+        base_url = f"transactions/accounts/{account_id}/transactions/{transaction_id}"
+        return await self._get(base_url, deserialize=self._deserialize_transaction)
+
+    async def iter_accounts(self, filters: list[FilterRelation] | None = None):
+        """Streams all accounts created with your authorization token, yielding
+        one account at a time.
+
+        :param filters: A list of optional filter to use when requesting all accounts
+        """
+        if filters is None:
+            filters = []
+        query_params = self._construct_query_params_from_filters(filters)
+        if query_params is None:
+            return
+        async for account in self._iter_records(
+            "accounts", query_params, self.ACCOUNTS_JSON_KEY
+        ):
+            yield Account.deserialize(account)
+
+    async def iter_transactions(
+        self, account_id: str, transaction_filters: list[FilterRelation] | None = None
+    ):
+        """Streams the transactions of the account you provide, yielding one
+        transaction at a time.
+
+        :param account_id: The Account ID of the account whose transactions you want
+        :param transaction_filters: A list of optional filters to use when requesting all transactions
+        """
+        if transaction_filters is None:
+            transaction_filters = []
+        base_url = f"transactions/accounts/{account_id}/transactions"
+        query_params = self._construct_query_params_from_filters(transaction_filters)
+        if query_params is None:
+            return
+        async for transaction in self._iter_records(
+            base_url, query_params, self.TRANSACTIONS_JSON_KEY
+        ):
+            yield Transaction.deserialize(transaction)
+
+    def iter_accounts_by_ids(self, account_ids: list[str]):
+        """Fetches many accounts concurrently, yielding each one as soon as it arrives.
+
+        :param account_ids: The Account IDs to fetch, duplicates are only fetched once
+        :return: An async generator of BulkResult keyed by account ID, in completion order
+        """
+        return async_fan_out(self.get_account, account_ids)
+
+    async def get_accounts_by_ids(self, account_ids: list[str]):
+        """Fetches many accounts concurrently.
+
+        :param account_ids: The Account IDs to fetch, duplicates are only fetched once
+        :return: A dict of BulkResult keyed by account ID, in the order the IDs were given
+        """
+        results = {
+            result.key: result
+            async for result in self.iter_accounts_by_ids(account_ids)
+        }
+        return {key: results[key] for key in unique_keys(account_ids)}
+
+    def iter_transactions_for_accounts(
+        self,
+        account_ids: list[str],
+        transaction_filters: list[FilterRelation] | None = None,
+    ):
+        """Fetches the transactions of many accounts concurrently, yielding each
+        account's transactions as soon as they arrive.
+
+        :param account_ids: The Account IDs to fetch transactions for, duplicates are only fetched once
+        :param transaction_filters: A list of optional filters applied to every account
+        :return: An async generator of BulkResult keyed by account ID, in completion order
+        """
+        if transaction_filters is None:
+            transaction_filters = []
+        return async_fan_out(
+            lambda account_id: self.get_transactions(account_id, transaction_filters),
+            account_ids,
+        )
+
+    async def get_transactions_for_accounts(
+        self,
+        account_ids: list[str],
+        transaction_filters: list[FilterRelation] | None = None,
+    ):
+        """Fetches the transactions of many accounts concurrently.
+
+        :param account_ids: The Account IDs to fetch transactions for, duplicates are only fetched once
+        :param transaction_filters: A list of optional filters applied to every account
+        :return: A dict of BulkResult keyed by account ID, in the order the IDs were given
+        """
+        if transaction_filters is None:
+            transaction_filters = []
+        results = {
+            result.key: result
+            async for result in self.iter_transactions_for_accounts(
+                account_ids, transaction_filters
+            )
+        }
+        return {key: results[key] for key in unique_keys(account_ids)}
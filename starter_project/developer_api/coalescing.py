@@ -0,0 +1,102 @@
+import asyncio
+import threading
+from dataclasses import dataclass, replace
+
+
+@dataclass
+class SingleFlightStats:
+    executed: int = 0
+    deduplicated: int = 0
+
+    @property
+    def dedup_rate(self):
+        calls = self.executed + self.deduplicated
+        return self.deduplicated / calls if calls else 0.0
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key from different threads
+    into one: the first caller runs the function and everyone who asks for the
+    same key while it runs waits for, and shares, its result or error.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._stats = SingleFlightStats()
+
+    def do(self, key, func):
+        """Runs ``func`` unless a call for ``key`` is already in flight, in
+        which case its outcome is returned or raised instead.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats.executed += 1
+            else:
+                self._stats.deduplicated += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self):
+        with self._lock:
+            return replace(self._stats)
+
+
+class AsyncSingleFlight:
+    """The asyncio twin of SingleFlight for coroutines on one event loop.
+
+    The shared call runs as its own task, so a caller being cancelled does not
+    cancel it for everyone else waiting on it.
+    """
+
+    def __init__(self):
+        self._tasks = {}
+        self._stats = SingleFlightStats()
+
+    async def do(self, key, func):
+        """Awaits ``func()`` unless a call for ``key`` is already in flight, in
+        which case its outcome is returned or raised instead.
+        """
+        task = self._tasks.get(key)
+        if task is not None:
+            self._stats.deduplicated += 1
+        else:
+            task = self._tasks[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self._stats.executed += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key, task: asyncio.Future):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Marks the error as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self):
+        return replace(self._stats)
@@ -85,3 +85,102 @@ class Filter:
         :return:
         """
         return LessThanOrEqual(self.key, value)
+
+
+class ContradictoryFiltersError(ValueError):
+    """Raised when no record could ever match all of the filters."""
+
+
+def _comparable(value):
+    # Numbers and numeric strings compare as numbers, anything else as text
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return 0, value
+    try:
+        return 0, float(value)
+    except (TypeError, ValueError):
+        return 1, str(value)
+
+
+def _stricter_bound(current: FilterRelation, candidate: FilterRelation, lower: bool):
+    if current is None:
+        return candidate
+    current_value = _comparable(current.value)[1]
+    candidate_value = _comparable(candidate.value)[1]
+    if current_value == candidate_value:
+        # At the same value the exclusive bound is the stricter one
+        exclusive = Relation.GT if lower else Relation.LT
+        return candidate if candidate.relation == exclusive else current
+    if lower:
+        return candidate if candidate_value > current_value else current
+    return candidate if candidate_value < current_value else current
+
+
+def _reduce_key(filters: list[FilterRelation]):
+    unique = []
+    seen = set()
+    for filter_ in filters:
+        identity = (filter_.relation, _comparable(filter_.value))
+        if identity not in seen:
+            seen.add(identity)
+            unique.append(filter_)
+
+    kinds = {_comparable(filter_.value)[0] for filter_ in unique}
+    if len(kinds) > 1:
+        # Numbers and text can't be ordered against each other, so leave them
+        return unique
+
+    equals = [f for f in unique if f.relation == Relation.EQ]
+    lower = None
+    upper = None
+    for filter_ in unique:
+        if filter_.relation in (Relation.GT, Relation.GE):
+            lower = _stricter_bound(lower, filter_, lower=True)
+        elif filter_.relation in (Relation.LT, Relation.LE):
+            upper = _stricter_bound(upper, filter_, lower=False)
+
+    if len(equals) > 1:
+        raise ContradictoryFiltersError(
+            f"{equals[0].key} can't equal more than one value"
+        )
+    if equals:
+        value = _comparable(equals[0].value)[1]
+        if lower is not None:
+            bound = _comparable(lower.value)[1]
+            if value < bound or (value == bound and lower.relation == Relation.GT):
+                raise ContradictoryFiltersError(f"{equals[0].key} is out of range")
+        if upper is not None:
+            bound = _comparable(upper.value)[1]
+            if value > bound or (value == bound and upper.relation == Relation.LT):
+                raise ContradictoryFiltersError(f"{equals[0].key} is out of range")
+        return equals
+
+    if lower is not None and upper is not None:
+        lower_value = _comparable(lower.value)[1]
+        upper_value = _comparable(upper.value)[1]
+        if lower_value > upper_value:
+            raise ContradictoryFiltersError(f"{lower.key} has an empty range")
+        if lower_value == upper_value:
+            if lower.relation == Relation.GE and upper.relation == Relation.LE:
+                return [Equals(lower.key, lower.value)]
+            raise ContradictoryFiltersError(f"{lower.key} has an empty range")
+
+    return [bound for bound in (lower, upper) if bound is not None]
+
+
+def reduce_filters(filters: list[FilterRelation]):
+    """Reduces filters to the smallest equivalent set. Duplicates are dropped,
+    overlapping ranges on a key are merged into their tightest bounds and a
+    closed range on a single value becomes an equality.
+
+    :param filters: The filters to reduce, all of which must hold
+    :return: The reduced filters, grouped by key in the order keys first appear
+    :raises ContradictoryFiltersError: If no value could match all the filters on a key
+    """
+    filters_by_key = {}
+    for filter_ in filters:
+        filters_by_key.setdefault(filter_.key, []).append(filter_)
+
+    reduced = []
+    for key_filters in filters_by_key.values():
+        reduced.extend(_reduce_key(key_filters))
+    return reduced
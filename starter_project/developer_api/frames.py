@@ -0,0 +1,268 @@
+from collections.abc import Iterable
+from enum import Enum
+
+import numpy as np
+
+from starter_project.developer_api.filters import (
+    ContradictoryFiltersError,
+    FilterRelation,
+    Relation,
+    reduce_filters,
+)
+from starter_project.developer_api.models import Transaction
+from starter_project.developer_api.models.transcation import (
+    TRANSACTION_SERVICE_MAPPING,
+)
+
+
+def plain_value(value):
+    """Returns the value of an enum member, or the value itself otherwise."""
+    return value.value if isinstance(value, Enum) else value
+
+
+def merchant_category(merchant):
+    """Returns the category of a Merchant or merchant dict, or None."""
+    if merchant is None:
+        return None
+    if isinstance(merchant, dict):
+        return merchant.get("category")
+    return merchant.category
+
+
+def parse_timestamps(timestamps: list[str]):
+    """Parses API timestamps such as ``2019-05-20 10:51:33`` into epoch seconds."""
+    return np.array(timestamps, dtype="datetime64[s]").astype(np.int64)
+
+
+class CategoricalColumn:
+    """A dictionary-encoded column: each distinct value is stored once in
+    ``categories`` and rows hold an integer code into it.
+    """
+
+    def __init__(self, codes: np.ndarray, categories: list):
+        self.codes = codes
+        self.categories = categories
+        self._index = {category: code for code, category in enumerate(categories)}
+
+    @classmethod
+    def encode(cls, values: Iterable):
+        index = {}
+        codes = np.fromiter(
+            (index.setdefault(value, len(index)) for value in values), dtype=np.int32
+        )
+        return cls(codes, list(index))
+
+    def code_of(self, value):
+        """Returns the code of a value, or -1 if it never appears."""
+        return self._index.get(plain_value(value), -1)
+
+    def equals(self, value):
+        return self.codes == self.code_of(value)
+
+    def take(self, selection):
+        return CategoricalColumn(self.codes[selection], self.categories)
+
+    def decode(self):
+        categories = np.array(self.categories, dtype=object)
+        return categories[self.codes].tolist()
+
+    def __len__(self):
+        return len(self.codes)
+
+
+class TransactionFrame:
+    """A columnar, read-only view of many transactions for vectorized analytics.
+
+    Numeric fields are NumPy arrays and categorical fields are dictionary
+    encoded, so group-bys and filters run over arrays instead of looping over
+    Transaction objects.
+    """
+
+    NUMERIC_COLUMNS = ("amount", "latitude", "longitude", "timestamp")
+    CATEGORICAL_COLUMNS = (
+        "account_uuid",
+        "currency",
+        "status",
+        "credit_debit_indicator",
+        "merchant_category",
+    )
+
+    def __init__(self, transaction_uuids: np.ndarray, columns: dict):
+        self.transaction_uuids = transaction_uuids
+        self.columns = columns
+
+    @classmethod
+    def _from_rows(cls, rows: list[tuple]):
+        (
+            transaction_uuids,
+            account_uuids,
+            amounts,
+            latitudes,
+            longitudes,
+            timestamps,
+            currencies,
+            statuses,
+            indicators,
+            categories,
+        ) = zip(*rows) if rows else ((),) * 10
+        columns = {
+            "amount": np.array(amounts, dtype=np.float64),
+            "latitude": np.array(latitudes, dtype=np.float64),
+            "longitude": np.array(longitudes, dtype=np.float64),
+            "timestamp": parse_timestamps(list(timestamps)),
+            "account_uuid": CategoricalColumn.encode(account_uuids),
+            "currency": CategoricalColumn.encode(currencies),
+            "status": CategoricalColumn.encode(statuses),
+            "credit_debit_indicator": CategoricalColumn.encode(indicators),
+            "merchant_category": CategoricalColumn.encode(categories),
+        }
+        return cls(np.array(transaction_uuids, dtype=object), columns)
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable[Transaction]):
+        """Builds a frame from Transaction objects, or any iterable of them such
+        as DeveloperApiClient.iter_transactions.
+        """
+        return cls._from_rows(
+            [
+                (
+                    transaction.transaction_uuid,
+                    transaction.account_uuid,
+                    transaction.amount,
+                    transaction.latitude,
+                    transaction.longitude,
+                    transaction.timestamp,
+                    transaction.currency,
+                    plain_value(transaction.status),
+                    plain_value(transaction.credit_debit_indicator),
+                    merchant_category(transaction.merchant),
+                )
+                for transaction in transactions
+            ]
+        )
+
+    @classmethod
+    def from_dicts(cls, transactions: Iterable[dict]):
+        """Builds a frame straight from raw API transaction dicts, skipping the
+        Transaction objects altogether.
+        """
+        return cls._from_rows(
+            [
+                (
+                    transaction["transactionUUID"],
+                    transaction["accountUUID"],
+                    transaction["amount"],
+                    transaction["latitude"],
+                    transaction["longitude"],
+                    transaction["timestamp"],
+                    transaction["currency"],
+                    transaction["status"],
+                    transaction["creditDebitIndicator"],
+                    merchant_category(transaction.get("merchant")),
+                )
+                for transaction in transactions
+            ]
+        )
+
+    def __len__(self):
+        return len(self.transaction_uuids)
+
+    def __getitem__(self, column: str):
+        return self.columns[column]
+
+    def _column(self, key: str):
+        column = TRANSACTION_SERVICE_MAPPING.inverse.get(key, key)
+        if column == "merchant":
+            column = "merchant_category"
+        if column not in self.columns:
+            raise ValueError(f"{key} is not a column of the frame")
+        return self.columns[column]
+
+    def mask(self, filters: list[FilterRelation]):
+        """Evaluates filters over the whole frame at once.
+
+        :param filters: Filters keyed by API field names, all of which must hold
+        :return: A boolean array marking the matching rows
+        """
+        result = np.ones(len(self), dtype=bool)
+        try:
+            filters = reduce_filters(filters)
+        except ContradictoryFiltersError:
+            return ~result
+
+        for filter_ in filters:
+            column = self._column(filter_.key)
+            if isinstance(column, CategoricalColumn):
+                if filter_.relation != Relation.EQ:
+                    raise ValueError(f"{filter_.key} only supports equality filters")
+                result &= column.equals(filter_.value)
+                continue
+            if column is self.columns["timestamp"]:
+                value = parse_timestamps([filter_.value])[0]
+            else:
+                value = float(filter_.value)
+            if filter_.relation == Relation.EQ:
+                result &= column == value
+            elif filter_.relation == Relation.GT:
+                result &= column > value
+            elif filter_.relation == Relation.LT:
+                result &= column < value
+            elif filter_.relation == Relation.GE:
+                result &= column >= value
+            elif filter_.relation == Relation.LE:
+                result &= column <= value
+        return result
+
+    def filter(self, selection):
+        """Returns a new frame with only the selected rows.
+
+        :param selection: A boolean mask, an array of row indexes or a list of filters
+        """
+        if isinstance(selection, list) and all(
+            isinstance(item, FilterRelation) for item in selection
+        ):
+            selection = self.mask(selection)
+        columns = {
+            name: column.take(selection)
+            if isinstance(column, CategoricalColumn)
+            else column[selection]
+            for name, column in self.columns.items()
+        }
+        return TransactionFrame(self.transaction_uuids[selection], columns)
+
+    def sum(self, column: str = "amount"):
+        return float(self.columns[column].sum())
+
+    def group_sum(self, by: str, column: str = "amount"):
+        """Sums a numeric column for each value of a categorical column.
+
+        :param by: The categorical column to group by, such as ``currency``
+        :param column: The numeric column to sum
+        :return: A dict of category to total
+        """
+        group = self.columns[by]
+        totals = np.bincount(
+            group.codes,
+            weights=self.columns[column],
+            minlength=len(group.categories),
+        )
+        counts = np.bincount(group.codes, minlength=len(group.categories))
+        return {
+            category: float(total)
+            for category, total, count in zip(group.categories, totals, counts)
+            if count
+        }
+
+    def group_count(self, by: str):
+        """Counts the rows for each value of a categorical column.
+
+        :param by: The categorical column to group by, such as ``status``
+        :return: A dict of category to number of rows
+        """
+        group = self.columns[by]
+        counts = np.bincount(group.codes, minlength=len(group.categories))
+        return {
+            category: int(count)
+            for category, count in zip(group.categories, counts)
+            if count
+        }
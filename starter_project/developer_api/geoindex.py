@@ -0,0 +1,207 @@
+import math
+from collections.abc import Iterable
+
+import numpy as np
+
+from starter_project.developer_api.frames import TransactionFrame
+
+# The mean radius of the Earth
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(latitude, longitude, latitudes, longitudes):
+    """Returns the great-circle distances in km from one point to many.
+
+    :param latitude: The latitude of the point in degrees
+    :param longitude: The longitude of the point in degrees
+    :param latitudes: The latitudes of the other points, as an array
+    :param longitudes: The longitudes of the other points, as an array
+    """
+    latitude, longitude = math.radians(latitude), math.radians(longitude)
+    latitudes, longitudes = np.radians(latitudes), np.radians(longitudes)
+    a = (
+        np.sin((latitudes - latitude) / 2) ** 2
+        + math.cos(latitude)
+        * np.cos(latitudes)
+        * np.sin((longitudes - longitude) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class GeoIndex:
+    """Finds points near a location without measuring the distance to all of them.
+
+    Points are bucketed into a grid of ``cell_size`` degree cells and stored
+    sorted by cell, row by row, so the cells a query circle overlaps in one
+    grid row are a single slice found by binary search. Only the points in
+    those slices have their haversine distance computed.
+    """
+
+    def __init__(
+        self,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        items: Iterable | None = None,
+        cell_size: float = 0.1,
+    ):
+        """
+        :param latitudes: Latitudes of the points in degrees
+        :param longitudes: Longitudes of the points in degrees
+        :param items: What queries return for each point, such as Transaction
+            objects, the point's position in the arrays if not given
+        :param cell_size: The width and height of a grid cell in degrees
+        """
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        if latitudes.shape != longitudes.shape:
+            raise ValueError("latitudes and longitudes must be the same length")
+        if items is None:
+            items = np.arange(len(latitudes))
+        else:
+            items = list(items)
+            if len(items) != len(latitudes):
+                raise ValueError("items must be the same length as the coordinates")
+            items, objects = np.empty(len(items), dtype=object), items
+            items[:] = objects
+
+        self.cell_size = cell_size
+        self._num_rows = math.ceil(180 / cell_size)
+        self._num_columns = math.ceil(360 / cell_size)
+
+        cells = self._row(latitudes) * self._num_columns + self._column(longitudes)
+        order = np.argsort(cells, kind="stable")
+        self._cells = cells[order]
+        self._latitudes = latitudes[order]
+        self._longitudes = longitudes[order]
+        self._items = items[order]
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable, cell_size: float = 0.1):
+        """Indexes transactions by where they happened, skipping any without
+        a location. Queries return the Transaction objects.
+        """
+        transactions = [
+            transaction
+            for transaction in transactions
+            if transaction.latitude is not None and transaction.longitude is not None
+        ]
+        return cls(
+            [transaction.latitude for transaction in transactions],
+            [transaction.longitude for transaction in transactions],
+            transactions,
+            cell_size,
+        )
+
+    @classmethod
+    def from_frame(cls, frame: TransactionFrame, cell_size: float = 0.1):
+        """Indexes a TransactionFrame's location columns. Queries return
+        transaction UUIDs.
+        """
+        return cls(
+            frame["latitude"], frame["longitude"], frame.transaction_uuids, cell_size
+        )
+
+    def __len__(self):
+        return len(self._items)
+
+    def _row(self, latitudes):
+        rows = np.floor((np.asarray(latitudes) + 90) / self.cell_size).astype(np.int64)
+        return np.clip(rows, 0, self._num_rows - 1)
+
+    def _column(self, longitudes):
+        columns = np.floor((np.asarray(longitudes) + 180) / self.cell_size)
+        return columns.astype(np.int64) % self._num_columns
+
+    def _column_ranges(self, latitude: float, longitude: float, angle: float):
+        # The longitudes a circle spans are widest at its centre's latitude,
+        # unless it covers a pole, in which case it spans all of them
+        if math.sin(angle) >= math.cos(math.radians(latitude)):
+            return [(0, self._num_columns - 1)]
+        spread = math.degrees(
+            math.asin(math.sin(angle) / math.cos(math.radians(latitude)))
+        )
+        first = math.floor((longitude - spread + 180) / self.cell_size)
+        last = math.floor((longitude + spread + 180) / self.cell_size)
+        if last - first + 1 >= self._num_columns:
+            return [(0, self._num_columns - 1)]
+        first, last = first % self._num_columns, last % self._num_columns
+        if first <= last:
+            return [(first, last)]
+        # The circle crosses the antimeridian
+        return [(first, self._num_columns - 1), (0, last)]
+
+    def _candidates(self, latitude: float, longitude: float, radius_km: float):
+        angle = radius_km / EARTH_RADIUS_KM
+        spread = math.degrees(angle)
+        first_row = int(self._row(latitude - spread))
+        last_row = int(self._row(latitude + spread))
+        rows = np.arange(first_row, last_row + 1) * self._num_columns
+        ranges = self._column_ranges(latitude, longitude, angle)
+        starts = np.concatenate([rows + first for first, _ in ranges])
+        ends = np.concatenate([rows + last + 1 for _, last in ranges])
+        lows = np.searchsorted(self._cells, starts, side="left")
+        highs = np.searchsorted(self._cells, ends, side="left")
+        slices = [np.arange(low, high) for low, high in zip(lows, highs) if high > low]
+        return np.concatenate(slices) if slices else np.empty(0, dtype=np.int64)
+
+    def _within(self, latitude: float, longitude: float, radius_km: float):
+        # Returns the positions of the points within the radius and their
+        # distances, nearest first
+        candidates = self._candidates(latitude, longitude, radius_km)
+        distances = haversine_km(
+            latitude,
+            longitude,
+            self._latitudes[candidates],
+            self._longitudes[candidates],
+        )
+        inside = distances <= radius_km
+        candidates, distances = candidates[inside], distances[inside]
+        order = np.argsort(distances, kind="stable")
+        return candidates[order], distances[order]
+
+    def _results(self, positions, distances, with_distance: bool):
+        items = self._items[positions].tolist()
+        if with_distance:
+            return list(zip(items, distances.tolist()))
+        return items
+
+    def within(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        with_distance: bool = False,
+    ):
+        """Returns the points within ``radius_km`` of a location, nearest first.
+
+        :param latitude: The latitude of the location in degrees
+        :param longitude: The longitude of the location in degrees
+        :param radius_km: The greatest distance returned, inclusive
+        :param with_distance: Return ``(item, distance_km)`` pairs instead of items
+        """
+        return self._results(
+            *self._within(latitude, longitude, radius_km), with_distance
+        )
+
+    def nearest(
+        self, latitude: float, longitude: float, k: int, with_distance: bool = False
+    ):
+        """Returns the ``k`` points nearest to a location, nearest first.
+
+        The search radius starts at a grid cell and doubles until it holds k
+        points, after which those are the nearest ones.
+
+        :param latitude: The latitude of the location in degrees
+        :param longitude: The longitude of the location in degrees
+        :param k: The number of points to return
+        :param with_distance: Return ``(item, distance_km)`` pairs instead of items
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return []
+        radius_km = math.radians(self.cell_size) * EARTH_RADIUS_KM
+        while True:
+            positions, distances = self._within(latitude, longitude, radius_km)
+            if len(positions) >= k or radius_km >= math.pi * EARTH_RADIUS_KM:
+                return self._results(positions[:k], distances[:k], with_distance)
+            radius_km *= 2
@@ -0,0 +1,184 @@
+import math
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+
+
+@dataclass
+class RequestEvent:
+    """What one request cost, from sending it to building the models.
+
+    The times are in seconds. ``network_time`` covers connecting, the server
+    and reading the body, ``decode_time`` parsing the JSON and ``model_time``
+    turning it into models.
+    """
+
+    method: str
+    endpoint: str
+    status_code: int = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    network_time: float = 0.0
+    decode_time: float = 0.0
+    model_time: float = 0.0
+    error: Exception = None
+
+    @property
+    def total_time(self):
+        return self.network_time + self.decode_time + self.model_time
+
+
+class LatencyHistogram:
+    """A fixed-size histogram of latencies in buckets that each grow by
+    ``growth``, so percentiles are accurate to within that factor however
+    many values are recorded.
+    """
+
+    def __init__(self, lowest: float = 1e-6, highest: float = 600.0, growth=1.05):
+        """
+        :param lowest: The smallest latency told apart, in seconds
+        :param highest: Latencies above this, in seconds, share the last bucket
+        :param growth: The ratio between the bounds of neighbouring buckets
+        """
+        self.lowest = lowest
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self._counts = [0] * (int(math.log(highest / lowest) / self._log_growth) + 2)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _bucket(self, value: float):
+        if value <= self.lowest:
+            return 0
+        index = int(math.log(value / self.lowest) / self._log_growth) + 1
+        return min(index, len(self._counts) - 1)
+
+    def record(self, value: float):
+        self._counts[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, percentile: float):
+        """Returns the latency at or below which ``percentile`` percent of the
+        recorded values fall, or 0.0 if nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percentile / 100))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                upper_bound = self.lowest * self.growth**index
+                return min(upper_bound, self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class _EndpointStats:
+    PHASES = ("network", "decode", "model", "total")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.status_codes = defaultdict(int)
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latencies = {phase: LatencyHistogram() for phase in self.PHASES}
+
+    def record(self, event: RequestEvent):
+        self.requests += 1
+        if event.error is not None:
+            self.errors += 1
+        else:
+            self.status_codes[event.status_code] += 1
+        self.bytes_sent += event.bytes_sent
+        self.bytes_received += event.bytes_received
+        self.latencies["network"].record(event.network_time)
+        self.latencies["decode"].record(event.decode_time)
+        self.latencies["model"].record(event.model_time)
+        self.latencies["total"].record(event.total_time)
+
+    def to_dict(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "status_codes": dict(self.status_codes),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency": {
+                phase: histogram.summary()
+                for phase, histogram in self.latencies.items()
+            },
+        }
+
+
+class Instrumentation:
+    """Collects a RequestEvent for every request a client sends, keeps latency
+    histograms per endpoint template and passes each event on to any hooks.
+
+    Give one to a client to turn instrumentation on; clients without one skip
+    all of this. A single instance can be shared by several clients and threads.
+    """
+
+    def __init__(self, hooks: list | None = None):
+        """
+        :param hooks: Callables given every RequestEvent after it is recorded
+        """
+        self.hooks = list(hooks or [])
+        self._endpoints = defaultdict(_EndpointStats)
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    def record(self, event: RequestEvent):
+        with self._lock:
+            self._endpoints[event.endpoint].record(event)
+        for hook in self.hooks:
+            hook(event)
+
+    def percentiles(self, endpoint: str, phase: str = "total"):
+        """Returns the p50, p95 and p99 latency of an endpoint in seconds.
+
+        :param endpoint: The endpoint template, such as ``accounts/{account_id}``
+        :param phase: One of network, decode, model or total
+        """
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            histogram = (
+                stats.latencies[phase] if stats is not None else LatencyHistogram()
+            )
+            return {
+                "p50": histogram.percentile(50),
+                "p95": histogram.percentile(95),
+                "p99": histogram.percentile(99),
+            }
+
+    def stats(self):
+        """Returns everything recorded so far per endpoint template as a plain,
+        JSON serializable dict.
+        """
+        with self._lock:
+            return {
+                endpoint: stats.to_dict() for endpoint, stats in self._endpoints.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,316 @@
+import json
+import random
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from starter_project.developer_api.filters import Relation
+from starter_project.developer_api.synthetic import make_account, make_transaction
+
+# Request body keys of accounts/create that set the account field of the same name
+_ACCOUNT_OVERRIDES = (
+    "liveBalance",
+    "balance",
+    "creditScore",
+    "currencyCode",
+    "productType",
+    "riskScore",
+    "state",
+    "creditLimit",
+)
+
+# Request body keys of transactions/.../create mapped to the transaction fields they set
+_TRANSACTION_OVERRIDES = {
+    "amount": "amount",
+    "currency": "currency",
+    "credit_debit_indicator": "creditDebitIndicator",
+    "emoji": "emoji",
+    "status": "status",
+}
+
+
+def _comparable(value):
+    try:
+        return 0, float(value)
+    except (TypeError, ValueError):
+        return 1, str(value).lower()
+
+
+def _matches(record: dict, query: dict):
+    # Query params look like {"riskScore": ["gte:20", "lte:80"]}, all must hold
+    for key, conditions in query.items():
+        if key not in record:
+            return False
+        field_kind, field_value = _comparable(record[key])
+        for condition in conditions:
+            relation, _, raw_value = condition.partition(":")
+            value_kind, value = _comparable(raw_value)
+            if field_kind != value_kind:
+                field_value, value = str(record[key]).lower(), raw_value.lower()
+            relation = Relation(relation)
+            if relation == Relation.EQ and field_value != value:
+                return False
+            if relation == Relation.GT and not field_value > value:
+                return False
+            if relation == Relation.LT and not field_value < value:
+                return False
+            if relation == Relation.GE and not field_value >= value:
+                return False
+            if relation == Relation.LE and not field_value <= value:
+                return False
+    return True
+
+
+class LocalDeveloperApi:
+    """An in-process stand-in for the Developer API for offline load, latency
+    and connection testing.
+
+    It serves the accounts and transactions endpoints, including the
+    ``eq/gt/lt/gte/lte`` filter syntax, from in-memory data. Latency, jitter,
+    server errors and 429 throttling can be injected and changed while it runs.
+    Point a client at it with ``DeveloperApiClient(service_url=server.url)``.
+    """
+
+    MAX_TRANSACTIONS_PER_REQUEST = 25
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        :param latency: Seconds added to every response
+        :param jitter: Up to this many extra seconds added at random to every response
+        :param error_rate: Fraction of requests answered with a 500
+        :param throttle_rate: Fraction of requests answered with a 429
+        :param retry_after: The Retry-After seconds sent with a 429
+        :param seed: Seed for the generated data and the injected faults
+        :param host: The interface to listen on
+        :param port: The port to listen on, a free one is picked if 0
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._accounts = {}
+        self._transactions = {}
+        self._request_counts = {}
+        self._connections = 0
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def stats(self):
+        """Returns the number of connections accepted and requests per endpoint."""
+        with self._lock:
+            return {
+                "connections": self._connections,
+                "requests": dict(self._request_counts),
+            }
+
+    def add_accounts(self, quantity: int, num_transactions: int = 0, **overrides):
+        """Creates accounts directly, as accounts/create would, and returns them."""
+        with self._lock:
+            accounts = []
+            for _ in range(quantity):
+                account = make_account(len(self._accounts), self._random)
+                account.update(overrides)
+                self._accounts[account["accountId"]] = account
+                self._transactions[account["accountId"]] = []
+                accounts.append(account)
+        for account in accounts:
+            self.add_transactions(account["accountId"], num_transactions)
+        return accounts
+
+    def add_transactions(self, account_id: str, quantity: int, **overrides):
+        """Creates transactions directly, as transactions/.../create would, and
+        returns them. They are timestamped now so they sort after older ones.
+        """
+        with self._lock:
+            created = []
+            for _ in range(quantity):
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+                transaction = make_transaction(account_id, self._random, timestamp)
+                transaction.update(overrides)
+                self._transactions[account_id].append(transaction)
+                created.append(transaction)
+            return created
+
+    def _fault(self):
+        with self._lock:
+            roll = self._random.random()
+            delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+        if roll < self.throttle_rate:
+            return 429
+        if roll < self.throttle_rate + self.error_rate:
+            return 500
+        return None
+
+    def _count(self, endpoint: str):
+        with self._lock:
+            self._request_counts[endpoint] = self._request_counts.get(endpoint, 0) + 1
+
+    def _route(self, method: str, path: str, query: dict, body: dict):
+        # Returns (status, endpoint template, response body)
+        path = path.strip("/")
+        if method == "GET" and path == "accounts":
+            with self._lock:
+                accounts = [a for a in self._accounts.values() if _matches(a, query)]
+            return 200, "accounts", {"Accounts": accounts}
+
+        if method == "POST" and path == "accounts/create":
+            overrides = {key: body[key] for key in _ACCOUNT_OVERRIDES if key in body}
+            accounts = self.add_accounts(
+                int(body.get("quantity", 1)),
+                int(body.get("numTransactions", 0)),
+                **overrides,
+            )
+            return 200, "accounts/create", {"Accounts": accounts}
+
+        match = re.fullmatch(r"accounts/([^/]+)", path)
+        if method == "GET" and match:
+            with self._lock:
+                account = self._accounts.get(match.group(1))
+            if account is None:
+                return 404, "accounts/{account_id}", {"error": "Account not found"}
+            return 200, "accounts/{account_id}", {"Accounts": [account]}
+
+        match = re.fullmatch(r"transactions/accounts/([^/]+)/create", path)
+        if method == "POST" and match:
+            endpoint = "transactions/accounts/{account_id}/create"
+            account_id = match.group(1)
+            quantity = int(body.get("quantity", 1))
+            if account_id not in self._accounts:
+                return 404, endpoint, {"error": "Account not found"}
+            if not 1 <= quantity <= self.MAX_TRANSACTIONS_PER_REQUEST:
+                return 400, endpoint, {"error": "quantity must be between 1 and 25"}
+            overrides = {
+                field: body[key]
+                for key, field in _TRANSACTION_OVERRIDES.items()
+                if key in body
+            }
+            transactions = self.add_transactions(account_id, quantity, **overrides)
+            return 200, endpoint, {"Transactions": transactions}
+
+        match = re.fullmatch(r"transactions/accounts/([^/]+)/transactions", path)
+        if method == "GET" and match:
+            endpoint = "transactions/accounts/{account_id}/transactions"
+            with self._lock:
+                transactions = self._transactions.get(match.group(1))
+                if transactions is None:
+                    return 404, endpoint, {"error": "Account not found"}
+                transactions = [t for t in transactions if _matches(t, query)]
+            return 200, endpoint, {"Transactions": transactions}
+
+        match = re.fullmatch(
+            r"transactions/accounts/([^/]+)/transactions/([^/]+)", path
+        )
+        if method == "GET" and match:
+            endpoint = (
+                "transactions/accounts/{account_id}/transactions/{transaction_id}"
+            )
+            with self._lock:
+                transactions = self._transactions.get(match.group(1), [])
+                for transaction in transactions:
+                    if transaction["transactionUUID"] == match.group(2):
+                        return 200, endpoint, transaction
+            return 404, endpoint, {"error": "Transaction not found"}
+
+        return 404, path, {"error": "Not found"}
+
+    def _handler_class(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body are written separately, so without this
+                # Nagle's algorithm holds the body back for a delayed ACK
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with api._lock:
+                    api._connections += 1
+
+            def _respond(self, status: int, body: dict, headers: dict | None = None):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _handle(self, method: str):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw_body = self.rfile.read(length) if length else b""
+                parts = urlsplit(self.path)
+                fault = api._fault()
+                if fault == 429:
+                    api._count("429")
+                    self._respond(
+                        429,
+                        {"error": "Too many requests"},
+                        {"Retry-After": str(api.retry_after)},
+                    )
+                    return
+                if fault == 500:
+                    api._count("500")
+                    self._respond(500, {"error": "Injected server error"})
+                    return
+                try:
+                    body = json.loads(raw_body) if raw_body else {}
+                except json.JSONDecodeError:
+                    self._respond(400, {"error": "Invalid JSON body"})
+                    return
+                status, endpoint, response = api._route(
+                    method, parts.path, parse_qs(parts.query), body
+                )
+                api._count(endpoint)
+                self._respond(status, response)
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -1,5 +1,16 @@
 from starter_project.developer_api.models.account import Account, AccountState
+from starter_project.developer_api.models.compact import (
+    CompactAccount,
+    CompactMerchant,
+    CompactTransaction,
+    MerchantTable,
+)
 from starter_project.developer_api.models.currency import Currency
+from starter_project.developer_api.models.lazy import (
+    LazyAccount,
+    LazyModel,
+    LazyTransaction,
+)
 from starter_project.developer_api.models.merchant import Merchant
 from starter_project.developer_api.models.product_type import ProductType
 from starter_project.developer_api.models.transcation import (
@@ -10,8 +21,15 @@ from starter_project.developer_api.models.transcation import (
 __all__ = [
     "Account",
     "AccountState",
+    "CompactAccount",
+    "CompactMerchant",
+    "CompactTransaction",
     "Currency",
+    "LazyAccount",
+    "LazyModel",
+    "LazyTransaction",
     "Merchant",
+    "MerchantTable",
     "ProductType",
     "Transaction",
     "TransactionStatus",
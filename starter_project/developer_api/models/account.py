@@ -3,6 +3,7 @@ from enum import Enum
 
 from bidict import bidict
 
+from starter_project.developer_api.models.codecs import codec_for
 from starter_project.developer_api.models.product_type import ProductType
 
 # Used to map the account fields from pythonic style to api expectation bidirectionally
@@ -55,24 +56,12 @@ class Account:
     balance: float
 
     def serialize(self):
-        object_dict = self.__dict__.copy()
-        return {
-            ACCOUNT_SERVICE_MAPPING[key]: object_dict[key] for key in object_dict.keys()
-        }
+        return codec_for(type(self), ACCOUNT_SERVICE_MAPPING).encode(self)
 
     @classmethod
     def deserialize(cls, object_dict):
         # Deserialize to object from dictionary and convert types
-        mapped_object_dict = {
-            ACCOUNT_SERVICE_MAPPING.inverse[key]: object_dict[key]
-            for key in object_dict.keys()
-        }
-        mapped_object_dict["risk_score"] = int(mapped_object_dict["risk_score"])
-        mapped_object_dict["credit_score"] = int(mapped_object_dict["credit_score"])
-        mapped_object_dict["live_balance"] = bool(mapped_object_dict["live_balance"])
-        mapped_object_dict["balance"] = float(mapped_object_dict["balance"])
-        mapped_object_dict["credit_limit"] = float(mapped_object_dict["credit_limit"])
-        return cls(**mapped_object_dict)
+        return codec_for(cls, ACCOUNT_SERVICE_MAPPING).decode(object_dict)
 
     def __repr__(self):
         return (
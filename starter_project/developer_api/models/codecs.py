@@ -0,0 +1,151 @@
+import typing
+from dataclasses import fields
+from enum import Enum
+
+
+def _enum_decoder(enum_type: type):
+    # Values are matched exactly so a record serializes back to the API's own
+    # casing, and values the enum doesn't know about are kept as they are
+    members = {member.value: member for member in enum_type}
+
+    def decode(value):
+        if isinstance(value, enum_type):
+            return value
+        return members.get(value, value)
+
+    return decode
+
+
+def _decode_bool(value):
+    if isinstance(value, str):
+        return value.strip().lower() == "true"
+    return bool(value)
+
+
+def _encode_enum(value):
+    return value.value if isinstance(value, Enum) else value
+
+
+def _encode_model(value):
+    return value.serialize() if hasattr(value, "serialize") else value
+
+
+def _decoder_for(field_type):
+    if field_type in (int, float):
+        return field_type
+    if field_type is bool:
+        return _decode_bool
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        return _enum_decoder(field_type)
+    if isinstance(field_type, type) and hasattr(field_type, "deserialize"):
+        nested_type = field_type
+
+        def decode(value):
+            if isinstance(value, dict):
+                return nested_type.deserialize(value)
+            return value
+
+        return decode
+    return None
+
+
+def _encoder_for(field_type):
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        return _encode_enum
+    if isinstance(field_type, type) and hasattr(field_type, "serialize"):
+        return _encode_model
+    return None
+
+
+class ModelCodec:
+    """Converts between API dicts and one model class with a decode and an
+    encode function generated from the model's fields and service mapping.
+
+    Each field is converted once, in a single pass, based on its type
+    annotation: int/float/bool are parsed, enums are looked up by value and
+    nested models go through their own deserialize/serialize.
+    """
+
+    def __init__(self, model: type, service_mapping, decoders: dict | None = None):
+        """
+        :param model: The dataclass to build instances of
+        :param service_mapping: A bidict of model field name to API key
+        :param decoders: Decoders to use for some fields instead of the ones picked
+            from their type, None keeps the raw value
+        """
+        self.model = model
+        self.service_mapping = service_mapping
+        self.decoders = decoders or {}
+        self.field_decoders = self._build_field_decoders()
+        self.decode = self._build_decode()
+        self.encode = self._build_encode()
+
+    def _fields(self):
+        hints = typing.get_type_hints(self.model)
+        return [(field.name, hints[field.name]) for field in fields(self.model)]
+
+    def _build_field_decoders(self):
+        # Field name to (API key, decoder), where a decoder of None keeps the raw value
+        field_decoders = {}
+        for name, field_type in self._fields():
+            key = self.service_mapping.get(name, name)
+            if name in self.decoders:
+                field_decoders[name] = (key, self.decoders[name])
+            else:
+                field_decoders[name] = (key, _decoder_for(field_type))
+        return field_decoders
+
+    def _build_decode(self):
+        namespace = {"model": self.model}
+        arguments = []
+        for name, (key, decoder) in self.field_decoders.items():
+            if decoder is None:
+                arguments.append(f"{name}=get({key!r})")
+            else:
+                namespace[f"decode_{name}"] = decoder
+                arguments.append(
+                    f"{name}=None if (value := get({key!r})) is None "
+                    f"else decode_{name}(value)"
+                )
+        source = (
+            "def decode(object_dict):\n"
+            "    get = object_dict.get\n"
+            "    return model(\n        " + ",\n        ".join(arguments) + ",\n    )\n"
+        )
+        # The source is built only from the model's field names and the
+        # repr of its API keys, never from response data
+        exec(source, namespace)  # noqa: S102
+        return namespace["decode"]
+
+    def _build_encode(self):
+        namespace = {}
+        items = []
+        for name, field_type in self._fields():
+            key = self.service_mapping.get(name, name)
+            encoder = _encoder_for(field_type)
+            if encoder is None:
+                items.append(f"{key!r}: obj.{name}")
+            else:
+                namespace[f"encode_{name}"] = encoder
+                items.append(f"{key!r}: encode_{name}(obj.{name})")
+        source = (
+            "def encode(obj):\n"
+            "    return {\n        " + ",\n        ".join(items) + ",\n    }\n"
+        )
+        exec(source, namespace)  # noqa: S102
+        return namespace["encode"]
+
+
+_CODECS = {}
+
+
+def codec_for(model: type, service_mapping):
+    """Returns the cached codec for a model, building it on first use.
+
+    Codecs with custom decoders aren't cached here, since the cache is keyed
+    on the model alone. Build those once with ModelCodec instead.
+    """
+    codec = _CODECS.get(model)
+    if codec is None:
+        codec = _CODECS[model] = ModelCodec(model, service_mapping)
+    return codec
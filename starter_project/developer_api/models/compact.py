@@ -0,0 +1,223 @@
+import sys
+import threading
+from dataclasses import dataclass
+
+from starter_project.developer_api.models.account import (
+    ACCOUNT_SERVICE_MAPPING,
+    Account,
+    AccountState,
+)
+from starter_project.developer_api.models.codecs import ModelCodec
+from starter_project.developer_api.models.product_type import ProductType
+from starter_project.developer_api.models.transcation import (
+    TRANSACTION_SERVICE_MAPPING,
+    Transaction,
+    TransactionStatus,
+)
+
+# Memory-compact versions of the models for holding millions of records at
+# once. Instances have no __dict__, repeated strings are interned and every
+# transaction of a merchant shares one CompactMerchant. Each model's codec is
+# built once with its interning decoders, so serializing before the first
+# deserialize can't leave a codec without them.
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass
+class CompactMerchant:
+    __slots__ = ("category", "description", "name", "pointOfSale")
+
+    name: str
+    category: str
+    description: str
+    pointOfSale: list[str]
+
+    def serialize(self):
+        return _MERCHANT_CODEC.encode(self)
+
+    @classmethod
+    def deserialize(cls, object_dict):
+        return _MERCHANT_CODEC.decode(object_dict)
+
+
+_MERCHANT_CODEC = ModelCodec(
+    CompactMerchant, {}, decoders={"name": _intern, "category": _intern}
+)
+
+
+class MerchantTable:
+    """A flyweight table handing out one shared CompactMerchant per merchant UUID."""
+
+    def __init__(self):
+        self._merchants = {}
+        self._lock = threading.Lock()
+
+    def get(self, merchant_uuid: str, merchant):
+        """Returns the shared merchant for a UUID, creating it from ``merchant``
+        (an API dict or a merchant object) the first time the UUID is seen.
+        """
+        if merchant_uuid is None:
+            # Without a UUID there is nothing to share the merchant by
+            if merchant is None:
+                return None
+            return CompactMerchant.deserialize(self._as_dict(merchant))
+        shared = self._merchants.get(merchant_uuid)
+        if shared is not None or merchant is None:
+            return shared
+        merchant = self._as_dict(merchant)
+        with self._lock:
+            return self._merchants.setdefault(
+                merchant_uuid, CompactMerchant.deserialize(merchant)
+            )
+
+    @staticmethod
+    def _as_dict(merchant):
+        return merchant if isinstance(merchant, dict) else merchant.serialize()
+
+    def __len__(self):
+        return len(self._merchants)
+
+    def clear(self):
+        with self._lock:
+            self._merchants.clear()
+
+
+DEFAULT_MERCHANT_TABLE = MerchantTable()
+
+
+@dataclass
+class CompactAccount:
+    __slots__ = (
+        "account_id",
+        "balance",
+        "credit_limit",
+        "credit_score",
+        "currency_code",
+        "developer_id",
+        "email",
+        "firstname",
+        "home_address",
+        "lastname",
+        "live_balance",
+        "phone_number",
+        "product_type",
+        "risk_score",
+        "state",
+        "uci",
+    )
+
+    account_id: str
+    firstname: str
+    phone_number: str
+    developer_id: str
+    uci: str
+    risk_score: int
+    credit_score: int
+    currency_code: str
+    product_type: ProductType
+    email: str
+    lastname: str
+    home_address: str
+    state: AccountState
+    live_balance: bool
+    credit_limit: float
+    balance: float
+
+    def serialize(self):
+        return _ACCOUNT_CODEC.encode(self)
+
+    @classmethod
+    def deserialize(cls, object_dict):
+        return _ACCOUNT_CODEC.decode(object_dict)
+
+    @classmethod
+    def from_account(cls, account: Account):
+        return cls.deserialize(account.serialize())
+
+    def to_account(self):
+        return Account.deserialize(self.serialize())
+
+
+_ACCOUNT_CODEC = ModelCodec(
+    CompactAccount,
+    ACCOUNT_SERVICE_MAPPING,
+    decoders={"developer_id": _intern, "currency_code": _intern},
+)
+
+
+@dataclass
+class CompactTransaction:
+    __slots__ = (
+        "account_uuid",
+        "amount",
+        "credit_debit_indicator",
+        "currency",
+        "emoji",
+        "latitude",
+        "longitude",
+        "merchant",
+        "merchant_uuid",
+        "message",
+        "point_of_sale",
+        "status",
+        "timestamp",
+        "transaction_uuid",
+    )
+
+    transaction_uuid: str
+    account_uuid: str
+    merchant_uuid: str
+    merchant: CompactMerchant
+    credit_debit_indicator: ProductType
+    currency: str
+    timestamp: str
+    emoji: str
+    latitude: float
+    longitude: float
+    status: TransactionStatus
+    message: str
+    point_of_sale: str
+    amount: float
+
+    def serialize(self):
+        return _TRANSACTION_CODEC.encode(self)
+
+    @classmethod
+    def deserialize(cls, object_dict, merchants: MerchantTable = None):
+        """
+        :param object_dict: The transaction as returned by the API
+        :param merchants: The flyweight table to share merchants through, a
+            process wide table if not given
+        """
+        transaction = _TRANSACTION_CODEC.decode(object_dict)
+        if merchants is None:
+            merchants = DEFAULT_MERCHANT_TABLE
+        transaction.merchant = merchants.get(
+            transaction.merchant_uuid, transaction.merchant
+        )
+        return transaction
+
+    @classmethod
+    def from_transaction(cls, transaction: Transaction, merchants=None):
+        return cls.deserialize(transaction.serialize(), merchants)
+
+    def to_transaction(self):
+        return Transaction.deserialize(self.serialize())
+
+
+_TRANSACTION_CODEC = ModelCodec(
+    CompactTransaction,
+    TRANSACTION_SERVICE_MAPPING,
+    decoders={
+        "account_uuid": _intern,
+        "merchant_uuid": _intern,
+        "merchant": None,
+        "currency": _intern,
+        "emoji": _intern,
+        "message": _intern,
+        "point_of_sale": _intern,
+    },
+)
@@ -0,0 +1,97 @@
+from starter_project.developer_api.models.account import (
+    ACCOUNT_SERVICE_MAPPING,
+    Account,
+)
+from starter_project.developer_api.models.codecs import codec_for
+from starter_project.developer_api.models.transcation import (
+    TRANSACTION_SERVICE_MAPPING,
+    Transaction,
+)
+
+
+class _LazyField:
+    # Decodes one field from the raw dict the first time it's read and keeps
+    # the result for later reads
+    __slots__ = ("decoder", "key", "name")
+
+    def __init__(self, name: str, key: str, decoder):
+        self.name = name
+        self.key = key
+        self.decoder = decoder
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        decoded = instance._decoded
+        try:
+            return decoded[self.name]
+        except KeyError:
+            pass
+        value = instance._raw.get(self.key)
+        if value is not None and self.decoder is not None:
+            value = self.decoder(value)
+        decoded[self.name] = value
+        return value
+
+    def __set__(self, instance, value):
+        instance._decoded[self.name] = value
+
+
+class LazyModel:
+    """A read-through view over a raw API dict that only maps and converts a
+    field when it is first read, for responses where most fields go unused.
+
+    Attribute access, ``serialize()`` and equality behave like the model the
+    view stands in for, and ``to_model()`` builds the full model.
+    """
+
+    __slots__ = ("_decoded", "_raw")
+
+    model = None
+
+    def __init_subclass__(
+        cls, model: type | None = None, service_mapping=None, **kwargs
+    ):
+        super().__init_subclass__(**kwargs)
+        cls.model = model
+        cls._codec = codec_for(model, service_mapping)
+        for name, (key, decoder) in cls._codec.field_decoders.items():
+            setattr(cls, name, _LazyField(name, key, decoder))
+
+    def __init__(self, object_dict: dict):
+        self._raw = object_dict
+        self._decoded = {}
+
+    @classmethod
+    def deserialize(cls, object_dict):
+        return cls(object_dict)
+
+    def serialize(self):
+        return self._codec.encode(self)
+
+    def to_model(self):
+        return self.model(
+            **{name: getattr(self, name) for name in self._codec.field_decoders}
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, LazyModel):
+            other = other.to_model()
+        if isinstance(other, self.model):
+            return self.to_model() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Lazy{self.to_model()!r}"
+
+
+class LazyAccount(LazyModel, model=Account, service_mapping=ACCOUNT_SERVICE_MAPPING):
+    __slots__ = ()
+
+
+class LazyTransaction(
+    LazyModel, model=Transaction, service_mapping=TRANSACTION_SERVICE_MAPPING
+):
+    __slots__ = ()
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from starter_project.developer_api.models.codecs import codec_for
+
 
 @dataclass
 class Merchant:
@@ -7,3 +9,10 @@ class Merchant:
     category: str
     description: str
     pointOfSale: list[str]
+
+    def serialize(self):
+        return codec_for(type(self), {}).encode(self)
+
+    @classmethod
+    def deserialize(cls, object_dict):
+        return codec_for(cls, {}).decode(object_dict)
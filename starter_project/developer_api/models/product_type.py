@@ -2,5 +2,5 @@ from enum import Enum
 
 
 class ProductType(Enum):
-    CREDIT = "credit"
-    DEBIT = "debit"
+    CREDIT = "Credit"
+    DEBIT = "Debit"
@@ -3,6 +3,7 @@ from enum import Enum
 
 from bidict import bidict
 
+from starter_project.developer_api.models.codecs import codec_for
 from starter_project.developer_api.models.merchant import Merchant
 from starter_project.developer_api.models.product_type import ProductType
 
@@ -51,24 +52,9 @@ class Transaction:
     amount: float
 
     def serialize(self):
-        object_dict = self.__dict__.copy()
-        # Updates private property names
-        serialized_object = {
-            TRANSACTION_SERVICE_MAPPING[key]: object_dict[key]
-            for key in object_dict.keys()
-        }
-        serialized_object["merchant"] = serialized_object["merchant"].serialize()
-        return serialized_object
+        return codec_for(type(self), TRANSACTION_SERVICE_MAPPING).encode(self)
 
     @classmethod
     def deserialize(cls, object_dict):
         # Deserialize to object from dictionary and convert types
-        print(object_dict)
-        mapped_object_dict = {
-            TRANSACTION_SERVICE_MAPPING.inverse[key]: object_dict[key]
-            for key in object_dict.keys()
-        }
-        mapped_object_dict["latitude"] = float(mapped_object_dict["latitude"])
-        mapped_object_dict["longitude"] = float(mapped_object_dict["longitude"])
-        print(mapped_object_dict)
-        return cls(**mapped_object_dict)
+        return codec_for(cls, TRANSACTION_SERVICE_MAPPING).decode(object_dict)
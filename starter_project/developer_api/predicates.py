@@ -0,0 +1,117 @@
+import operator
+import typing
+from dataclasses import fields
+from enum import Enum
+from operator import attrgetter
+
+from starter_project.developer_api.filters import (
+    ContradictoryFiltersError,
+    FilterRelation,
+    Relation,
+    reduce_filters,
+)
+from starter_project.developer_api.models import Account, Transaction
+from starter_project.developer_api.models.account import ACCOUNT_SERVICE_MAPPING
+from starter_project.developer_api.models.transcation import (
+    TRANSACTION_SERVICE_MAPPING,
+)
+
+SERVICE_MAPPINGS = {
+    Account: ACCOUNT_SERVICE_MAPPING,
+    Transaction: TRANSACTION_SERVICE_MAPPING,
+}
+
+_OPERATORS = {
+    Relation.EQ: operator.eq,
+    Relation.GT: operator.gt,
+    Relation.LT: operator.lt,
+    Relation.GE: operator.ge,
+    Relation.LE: operator.le,
+}
+
+
+def model_field_types(model: type):
+    """Returns the type of each field of a model dataclass by attribute name."""
+    hints = typing.get_type_hints(model)
+    return {field.name: hints[field.name] for field in fields(model)}
+
+
+def value_converter(field_type: type):
+    """Returns a function turning values of a field, and the filter values
+    compared against it, into numbers or text so they compare consistently.
+    """
+    if field_type in (int, float):
+        return float
+    # Records may hold an enum or the raw API string for the same field
+    return lambda value: value.value if isinstance(value, Enum) else str(value)
+
+
+class CompiledFilter:
+    """A list of filters compiled into a predicate that runs locally against
+    Account or Transaction objects, so one fetched dataset can answer many
+    queries without another request.
+
+    Filter keys use the API field names, such as ``riskScore``, the same as
+    when the filters are sent to the server. Numeric fields are compared as
+    numbers and everything else as text.
+    """
+
+    def __init__(self, filters: list[FilterRelation], model: type):
+        """
+        :param filters: The filters that must all hold for a record to match
+        :param model: Account or Transaction
+        """
+        if model not in SERVICE_MAPPINGS:
+            raise ValueError(f"Can't compile filters for {model.__name__}")
+        self.model = model
+        mapping = SERVICE_MAPPINGS[model]
+        field_types = model_field_types(model)
+
+        try:
+            reduced = reduce_filters(filters)
+        except ContradictoryFiltersError:
+            reduced = None
+
+        checks = []
+        for filter_ in reduced or []:
+            attribute = mapping.inverse.get(filter_.key, filter_.key)
+            if attribute not in field_types:
+                raise ValueError(f"{filter_.key} is not a field of {model.__name__}")
+            field_type = field_types[attribute]
+            convert = value_converter(field_type)
+            checks.append(
+                (
+                    attrgetter(attribute),
+                    _OPERATORS[filter_.relation],
+                    convert(filter_.value),
+                    convert,
+                )
+            )
+        self._checks = tuple(checks)
+        self._never_matches = reduced is None
+
+    def __call__(self, record):
+        if self._never_matches:
+            return False
+        for get, compare, value, convert in self._checks:
+            field_value = get(record)
+            if field_value is None or not compare(convert(field_value), value):
+                return False
+        return True
+
+    def mask(self, records):
+        """Returns a list of booleans saying which records match."""
+        return [self(record) for record in records]
+
+    def select(self, records):
+        """Returns the records that match."""
+        return [record for record in records if self(record)]
+
+
+def compile_filters(filters: list[FilterRelation], model: type):
+    """Compiles filters into a CompiledFilter for the given model.
+
+    :param filters: The filters that must all hold for a record to match
+    :param model: Account or Transaction
+    """
+    return CompiledFilter(filters, model)
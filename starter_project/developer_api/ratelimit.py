@@ -0,0 +1,220 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class TokenBucket:
+    """A thread-safe token bucket allowing ``rate`` calls per second on average
+    with bursts of up to ``burst`` calls.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        :param rate: The number of calls allowed per second
+        :param burst: The number of calls that may be made back to back
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self):
+        """Takes a token if one is available.
+
+        :return: 0 if a token was taken, otherwise the seconds until one is free
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """Blocks until a token is available and takes it."""
+        while wait := self.try_acquire():
+            time.sleep(wait)
+
+
+def parse_retry_after(value: str, maximum: float = 60.0):
+    """Parses a Retry-After header given either in seconds or as an HTTP date.
+
+    :param value: The header value, or None if the response had none
+    :param maximum: The longest wait in seconds that is honoured
+    :return: The seconds to wait, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), maximum)
+
+
+@dataclass
+class RateControllerStats:
+    limit: float = 0.0
+    in_flight: int = 0
+    successes: int = 0
+    throttled: int = 0
+    decreases: int = 0
+
+
+class AdaptiveRateController:
+    """Shares a request rate and an adaptive concurrency limit between every
+    thread and event loop sending requests through it.
+
+    The concurrency limit follows AIMD: every healthy response raises it by
+    ``increase / limit``, so about ``increase`` per round of requests, and a
+    429, 5xx or failed request multiplies it by ``decrease``, at most once per
+    ``cooldown`` so one burst of errors only counts once. A Retry-After holds
+    back every new request until it has passed.
+    """
+
+    BACKOFF_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        requests_per_second: float | None = None,
+        burst: int = 1,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        """
+        :param requests_per_second: A fixed cap on the request rate, no cap if not given
+        :param burst: The number of requests that may start back to back under the rate cap
+        :param initial_limit: The number of requests allowed in flight to begin with
+        :param min_limit: The limit never drops below this
+        :param max_limit: The limit never grows above this
+        :param increase: How much the limit grows per round of healthy requests
+        :param decrease: The factor the limit is multiplied by when backing off
+        :param cooldown: The minimum seconds between two decreases
+        """
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min <= initial <= max")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self._bucket = (
+            TokenBucket(requests_per_second, burst) if requests_per_second else None
+        )
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._stats = RateControllerStats()
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._async_waiters = []
+
+    @property
+    def limit(self):
+        return self._limit
+
+    def _try_acquire(self):
+        # Returns 0 once a request may start, otherwise the seconds to wait,
+        # or None to wait for a request in flight to finish
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._in_flight >= int(self._limit):
+            return None
+        if self._bucket is not None and (wait := self._bucket.try_acquire()):
+            return wait
+        self._in_flight += 1
+        return 0
+
+    def acquire(self):
+        """Blocks until a request may start. Every acquire must be followed by
+        a release.
+        """
+        with self._condition:
+            while (wait := self._try_acquire()) != 0:
+                self._condition.wait(wait)
+
+    async def acquire_async(self):
+        """Waits without blocking the event loop until a request may start."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                wait = self._try_acquire()
+                if wait == 0:
+                    return
+                waiter = (loop, loop.create_future())
+                self._async_waiters.append(waiter)
+            try:
+                await asyncio.wait({waiter[1]}, timeout=wait)
+            finally:
+                with self._lock:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+    def _wake_waiters(self):
+        self._condition.notify_all()
+        for loop, future in self._async_waiters:
+            loop.call_soon_threadsafe(_resolve, future)
+        self._async_waiters.clear()
+
+    def release(self, status_code: int | None = None, retry_after: float | None = None):
+        """Finishes a request and adapts the limit to how it went.
+
+        :param status_code: The response status, None if the request failed without one
+        :param retry_after: The seconds the server asked to wait, if it did
+        """
+        with self._lock:
+            self._in_flight -= 1
+            now = time.monotonic()
+            if status_code is None or status_code in self.BACKOFF_STATUSES:
+                self._stats.throttled += 1
+                if now - self._last_decrease >= self.cooldown:
+                    self._limit = max(self.min_limit, self._limit * self.decrease)
+                    self._last_decrease = now
+                    self._stats.decreases += 1
+            else:
+                self._stats.successes += 1
+                self._limit = min(
+                    self.max_limit, self._limit + self.increase / self._limit
+                )
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            self._wake_waiters()
+
+    def cancel(self):
+        """Finishes a request that was cancelled before it got a response. The
+        limit is left as it is, since that says nothing about the API.
+        """
+        with self._lock:
+            self._in_flight -= 1
+            self._wake_waiters()
+
+    def stats(self):
+        with self._lock:
+            return replace(self._stats, limit=self._limit, in_flight=self._in_flight)
+
+
+def _resolve(future):
+    if not future.done():
+        future.set_result(None)
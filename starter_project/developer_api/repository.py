@@ -0,0 +1,217 @@
+import bisect
+from collections.abc import Iterable
+from operator import itemgetter
+
+from starter_project.developer_api.filters import (
+    ContradictoryFiltersError,
+    FilterRelation,
+    Relation,
+    reduce_filters,
+)
+from starter_project.developer_api.models import Account
+from starter_project.developer_api.models.account import ACCOUNT_SERVICE_MAPPING
+from starter_project.developer_api.predicates import (
+    CompiledFilter,
+    model_field_types,
+    value_converter,
+)
+
+_value = itemgetter(0)
+
+
+class _SortedIndex:
+    # (value, account_id) pairs in order, so a range of values is a slice
+    # found by binary search
+    def __init__(self):
+        self.entries = []
+
+    def add_many(self, entries: list):
+        if len(entries) * 8 < len(self.entries):
+            for entry in entries:
+                bisect.insort(self.entries, entry)
+            return
+        # Timsort merges the new entries in as one more sorted run
+        self.entries.extend(entries)
+        self.entries.sort()
+
+    def remove(self, value, account_id: str):
+        del self.entries[bisect.bisect_left(self.entries, (value, account_id))]
+
+    def range(self, bounds: list[tuple[Relation, float]]):
+        # Returns the slice of entries within every one of the bounds
+        low, high = 0, len(self.entries)
+        for relation, value in bounds:
+            if relation in (Relation.EQ, Relation.GE):
+                low = max(low, bisect.bisect_left(self.entries, value, key=_value))
+            elif relation == Relation.GT:
+                low = max(low, bisect.bisect_right(self.entries, value, key=_value))
+            if relation in (Relation.EQ, Relation.LE):
+                high = min(high, bisect.bisect_right(self.entries, value, key=_value))
+            elif relation == Relation.LT:
+                high = min(high, bisect.bisect_left(self.entries, value, key=_value))
+        return low, max(low, high)
+
+
+class AccountRepository:
+    """Holds accounts by account_id and answers Filter queries from indexes.
+
+    Categorical fields have a hash index from each value to the accounts with
+    it, and numeric fields a sorted index, so each filter on an indexed field
+    is a dict lookup or a binary search. The matches for each filter are
+    intersected smallest first, and filters on fields without an index are
+    only checked against what is left. Filters compare values the same way as
+    CompiledFilter.
+    """
+
+    HASH_INDEXED = ("state", "product_type", "currency_code")
+    SORTED_INDEXED = ("credit_score", "risk_score", "balance")
+
+    def __init__(self, accounts: Iterable[Account] = ()):
+        """
+        :param accounts: Accounts to start with, such as the result of get_accounts
+        """
+        self._accounts = {}
+        # The indexed values each account was stored under, which may no
+        # longer be the ones on the object if it has been changed since
+        self._keys = {}
+        self._converters = {
+            field: value_converter(field_type)
+            for field, field_type in model_field_types(Account).items()
+        }
+        self._hash_indexes = {field: {} for field in self.HASH_INDEXED}
+        self._sorted_indexes = {field: _SortedIndex() for field in self.SORTED_INDEXED}
+        self.upsert(accounts)
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def __contains__(self, account_id: str):
+        return account_id in self._accounts
+
+    def __iter__(self):
+        return iter(self._accounts.values())
+
+    def get(self, account_id: str):
+        """Returns the account with the id, or None if it isn't held."""
+        return self._accounts.get(account_id)
+
+    def _index(self, account: Account, sorted_entries: dict):
+        # Sorted index entries are collected in sorted_entries to be added
+        # in one go, which is far quicker than inserting them one at a time
+        keys = {}
+        for field in self.HASH_INDEXED + self.SORTED_INDEXED:
+            value = getattr(account, field)
+            if value is None:
+                continue
+            keys[field] = key = self._converters[field](value)
+            if field in self._hash_indexes:
+                self._hash_indexes[field].setdefault(key, set()).add(account.account_id)
+            else:
+                sorted_entries[field].append((key, account.account_id))
+        self._keys[account.account_id] = keys
+
+    def _unindex(self, account_id: str):
+        for field, key in self._keys.pop(account_id).items():
+            if field in self._hash_indexes:
+                matching = self._hash_indexes[field][key]
+                matching.discard(account_id)
+                if not matching:
+                    del self._hash_indexes[field][key]
+            else:
+                self._sorted_indexes[field].remove(key, account_id)
+
+    def upsert(self, accounts: Account | Iterable[Account]):
+        """Adds accounts, replacing any already held with the same account_id.
+
+        :param accounts: An account or an iterable of them
+        :return: The number of accounts added or replaced
+        """
+        if isinstance(accounts, Account):
+            accounts = [accounts]
+        # The last of any accounts repeated in the batch wins
+        accounts = {account.account_id: account for account in accounts}
+        sorted_entries = {field: [] for field in self._sorted_indexes}
+        for account_id, account in accounts.items():
+            if account_id in self._accounts:
+                self._unindex(account_id)
+            self._accounts[account_id] = account
+            self._index(account, sorted_entries)
+        for field, entries in sorted_entries.items():
+            self._sorted_indexes[field].add_many(entries)
+        return len(accounts)
+
+    def remove(self, account_id: str):
+        """Removes an account and returns it, or None if it wasn't held."""
+        account = self._accounts.pop(account_id, None)
+        if account is not None:
+            self._unindex(account_id)
+        return account
+
+    def _hash_lookup(self, field: str, value):
+        # Each lookup is the number of accounts an indexed filter matches, a
+        # function building the set of their ids and one checking a single id
+        matching = self._hash_indexes[field].get(value, set())
+        return len(matching), lambda: matching, matching.__contains__
+
+    def _range_lookup(self, field: str, bounds: list[tuple[Relation, float]]):
+        entries = self._sorted_indexes[field].entries
+        low, high = self._sorted_indexes[field].range(bounds)
+        if low == high:
+            return 0, set, lambda account_id: False
+        first, last = entries[low][0], entries[high - 1][0]
+
+        def contains(account_id):
+            key = self._keys[account_id].get(field)
+            return key is not None and first <= key <= last
+
+        return high - low, lambda: {id_ for _, id_ in entries[low:high]}, contains
+
+    def query(self, filters: list[FilterRelation]):
+        """Returns the accounts matching all the filters, ordered by account_id.
+
+        :param filters: Filters keyed by API field names, such as
+            ``Filter("riskScore").gt(50)``
+        """
+        try:
+            reduced = reduce_filters(filters)
+        except ContradictoryFiltersError:
+            return []
+
+        lookups = []
+        bounds = {}
+        unindexed = []
+        for filter_ in reduced:
+            field = ACCOUNT_SERVICE_MAPPING.inverse.get(filter_.key, filter_.key)
+            if field not in self._converters:
+                raise ValueError(f"{filter_.key} is not a field of Account")
+            value = self._converters[field](filter_.value)
+            if field in self._hash_indexes and filter_.relation == Relation.EQ:
+                lookups.append(self._hash_lookup(field, value))
+            elif field in self._sorted_indexes:
+                # Both ends of a range are answered by one slice of the index
+                bounds.setdefault(field, []).append((filter_.relation, value))
+            else:
+                unindexed.append(filter_)
+        for field, field_bounds in bounds.items():
+            lookups.append(self._range_lookup(field, field_bounds))
+
+        if lookups:
+            lookups.sort(key=itemgetter(0))
+            account_ids = set(lookups[0][1]())
+            for size, matching, contains in lookups[1:]:
+                if size <= len(account_ids):
+                    account_ids &= matching()
+                else:
+                    # Checking the few ids left beats building a larger set
+                    account_ids = set(filter(contains, account_ids))
+            accounts = [self._accounts[account_id] for account_id in account_ids]
+        else:
+            accounts = list(self._accounts.values())
+
+        if unindexed:
+            accounts = CompiledFilter(unindexed, Account).select(accounts)
+        return sorted(accounts, key=lambda account: account.account_id)
+
+    def count(self, filters: list[FilterRelation]):
+        """Returns the number of accounts matching all the filters."""
+        return len(self.query(filters))
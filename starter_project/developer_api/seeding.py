@@ -0,0 +1,249 @@
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError
+
+from starter_project.developer_api.bulk import CALL_ERRORS
+from starter_project.developer_api.clients import ApiResponseError, DeveloperApiClient
+from starter_project.developer_api.ratelimit import TokenBucket
+from starter_project.developer_api.transport import HttpTransport
+
+
+@dataclass
+class SeedManifest:
+    """The IDs created by a seeding run. Passing it back to Seeder.seed resumes
+    the run and only creates what is still missing.
+    """
+
+    account_ids: list[str] = field(default_factory=list)
+    transaction_ids: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def num_transactions(self):
+        return sum(len(ids) for ids in self.transaction_ids.values())
+
+    def to_dict(self):
+        return {"accountIds": self.account_ids, "transactionIds": self.transaction_ids}
+
+    @classmethod
+    def from_dict(cls, object_dict):
+        return cls(
+            account_ids=list(object_dict.get("accountIds", [])),
+            transaction_ids={
+                account_id: list(ids)
+                for account_id, ids in object_dict.get("transactionIds", {}).items()
+            },
+        )
+
+    def save(self, path: str):
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file)
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path) as file:
+            return cls.from_dict(json.load(file))
+
+
+@dataclass
+class SeedProgress:
+    accounts_created: int
+    transactions_created: int
+    failed_batches: int
+    elapsed: float
+
+    @property
+    def records_per_second(self):
+        if self.elapsed <= 0:
+            return 0.0
+        return (self.accounts_created + self.transactions_created) / self.elapsed
+
+
+@dataclass
+class SeedResult:
+    manifest: SeedManifest
+    progress: SeedProgress
+    errors: list[Exception]
+
+    @property
+    def complete(self):
+        return not self.errors
+
+
+class Seeder:
+    """Creates large numbers of accounts and transactions by splitting the
+    totals into batches the API accepts and running them concurrently.
+
+    Creates aren't idempotent, so a failed batch is only retried when the
+    request never reached the API or the API turned it away without acting on
+    it. Anything that still fails is left out of the manifest so running the
+    seed again with that manifest fills the gaps.
+
+    The Seeder is the only layer that retries, so every attempt is paced by
+    its rate limit. Give it a client whose transport doesn't retry, such as
+    ``DeveloperApiClient(token, transport=HttpTransport(max_retries=0))``.
+    """
+
+    MAX_ACCOUNTS_PER_REQUEST = 25
+    MAX_TRANSACTIONS_PER_REQUEST = 25
+
+    def __init__(
+        self,
+        client: DeveloperApiClient,
+        max_workers: int = 8,
+        requests_per_second: float = 10.0,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        on_progress: Callable[[SeedProgress], None] | None = None,
+    ):
+        """
+        :param client: The client used to create the records
+        :param max_workers: The number of requests to run at once
+        :param requests_per_second: The maximum rate at which requests are sent
+        :param max_retries: How many times a batch that is safe to retry is retried
+        :param retry_delay: Seconds to wait before the first retry, doubled after each attempt
+        :param on_progress: Called with a SeedProgress after every batch
+        :raises ValueError: If the client's transport retries requests itself
+        """
+        transport = getattr(client, "transport", None)
+        if isinstance(transport, HttpTransport) and transport.max_retries:
+            raise ValueError(
+                "Seeder retries creates itself, give its client a transport "
+                "with max_retries=0"
+            )
+        self.client = client
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.on_progress = on_progress
+        self._rate_limiter = TokenBucket(requests_per_second, burst=max_workers)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _batches(total: int, batch_size: int):
+        full_batches, remainder = divmod(max(total, 0), batch_size)
+        return [batch_size] * full_batches + ([remainder] if remainder else [])
+
+    @staticmethod
+    def _retry_after(error: Exception):
+        """Returns the seconds to wait before retrying a failed create, or None
+        if the API may have created the records and retrying could duplicate
+        them.
+        """
+        if isinstance(error, ApiResponseError):
+            # 429 and 503 with Retry-After are the API refusing the request
+            if error.status_code == 429 or (
+                error.status_code == 503 and error.retry_after is not None
+            ):
+                return error.retry_after or 0.0
+            return None
+        if isinstance(error, requests.ConnectionError) and error.args:
+            # requests wraps urllib3's errors, a connect timeout or refused
+            # connection means nothing was sent
+            reason = getattr(error.args[0], "reason", error.args[0])
+            if isinstance(reason, ConnectTimeoutError):
+                return 0.0
+        return None
+
+    def _call_with_retries(self, func: Callable, *args, **kwargs):
+        for attempt in range(self.max_retries + 1):
+            self._rate_limiter.acquire()
+            try:
+                return func(*args, **kwargs)
+            except (ApiResponseError, requests.ConnectionError) as error:
+                retry_after = self._retry_after(error)
+                if attempt == self.max_retries or retry_after is None:
+                    raise
+                time.sleep(max(self.retry_delay * (2**attempt), retry_after))
+
+    def _report(self, manifest: SeedManifest, errors: list, started: float):
+        progress = SeedProgress(
+            accounts_created=len(manifest.account_ids),
+            transactions_created=manifest.num_transactions,
+            failed_batches=len(errors),
+            elapsed=time.monotonic() - started,
+        )
+        if self.on_progress is not None:
+            self.on_progress(progress)
+        return progress
+
+    def _run(self, jobs: list, on_result: Callable, errors: list):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._call_with_retries, func, *args, **kwargs): args
+                for func, args, kwargs in jobs
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except CALL_ERRORS as error:
+                    with self._lock:
+                        errors.append(error)
+                    continue
+                with self._lock:
+                    on_result(futures[future], result)
+
+    def seed(
+        self,
+        num_accounts: int,
+        transactions_per_account: int = 0,
+        manifest: SeedManifest | None = None,
+        account_options: dict | None = None,
+        transaction_options: dict | None = None,
+    ):
+        """Creates accounts and transactions until the manifest holds the
+        target totals.
+
+        :param num_accounts: The total number of accounts wanted
+        :param transactions_per_account: The number of transactions wanted on each account
+        :param manifest: The manifest of an earlier run to resume
+        :param account_options: Extra keyword arguments passed to create_accounts
+        :param transaction_options: Extra keyword arguments passed to create_transactions
+        :return: A SeedResult with the updated manifest, the final progress and any errors
+        """
+        manifest = manifest if manifest is not None else SeedManifest()
+        account_options = account_options or {}
+        transaction_options = transaction_options or {}
+        errors = []
+        started = time.monotonic()
+
+        def on_accounts(args, accounts):
+            manifest.account_ids.extend(account.account_id for account in accounts)
+            self._report(manifest, errors, started)
+
+        account_jobs = [
+            (self.client.create_accounts, (quantity,), account_options)
+            for quantity in self._batches(
+                num_accounts - len(manifest.account_ids),
+                self.MAX_ACCOUNTS_PER_REQUEST,
+            )
+        ]
+        self._run(account_jobs, on_accounts, errors)
+
+        def on_transactions(args, transactions):
+            manifest.transaction_ids.setdefault(args[0], []).extend(
+                transaction.transaction_uuid for transaction in transactions
+            )
+            self._report(manifest, errors, started)
+
+        transaction_jobs = [
+            (
+                self.client.create_transactions,
+                (account_id, quantity),
+                transaction_options,
+            )
+            for account_id in manifest.account_ids[:num_accounts]
+            for quantity in self._batches(
+                transactions_per_account
+                - len(manifest.transaction_ids.get(account_id, [])),
+                self.MAX_TRANSACTIONS_PER_REQUEST,
+            )
+        ]
+        self._run(transaction_jobs, on_transactions, errors)
+
+        return SeedResult(manifest, self._report(manifest, errors, started), errors)
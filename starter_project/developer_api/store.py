@@ -0,0 +1,254 @@
+import json
+import sqlite3
+import threading
+import typing
+from dataclasses import fields
+
+from starter_project.developer_api.bulk import fan_out
+from starter_project.developer_api.filters import (
+    ContradictoryFiltersError,
+    Filter,
+    FilterRelation,
+    Relation,
+    reduce_filters,
+)
+from starter_project.developer_api.models import Account, Transaction
+from starter_project.developer_api.models.account import ACCOUNT_SERVICE_MAPPING
+from starter_project.developer_api.models.transcation import (
+    TRANSACTION_SERVICE_MAPPING,
+)
+
+_SQL_OPERATORS = {
+    Relation.EQ: "=",
+    Relation.GT: ">",
+    Relation.LT: "<",
+    Relation.GE: ">=",
+    Relation.LE: "<=",
+}
+
+
+class _Table:
+    # Describes how one model is stored: a column per API field, named after
+    # the API key so Filter keys can be used as column names directly
+    def __init__(self, name: str, model: type, service_mapping, primary_key: str):
+        self.name = name
+        self.model = model
+        self.primary_key = primary_key
+        hints = typing.get_type_hints(model)
+        self.columns = {}
+        self.json_columns = set()
+        for field in fields(model):
+            key = service_mapping[field.name]
+            field_type = hints[field.name]
+            if field_type in (int, bool):
+                self.columns[key] = "INTEGER"
+            elif field_type is float:
+                self.columns[key] = "REAL"
+            elif hasattr(field_type, "serialize"):
+                self.columns[key] = "TEXT"
+                self.json_columns.add(key)
+            else:
+                self.columns[key] = "TEXT"
+
+    def create_sql(self):
+        columns = ", ".join(
+            f'"{column}" {sql_type}'
+            + (" PRIMARY KEY" if column == self.primary_key else "")
+            for column, sql_type in self.columns.items()
+        )
+        return f"CREATE TABLE IF NOT EXISTS {self.name} ({columns})"
+
+    def upsert_sql(self):
+        columns = ", ".join(f'"{column}"' for column in self.columns)
+        placeholders = ", ".join("?" for _ in self.columns)
+        return f"INSERT OR REPLACE INTO {self.name} ({columns}) VALUES ({placeholders})"
+
+    def to_row(self, record):
+        serialized = record.serialize()
+        return tuple(
+            json.dumps(serialized[column])
+            if column in self.json_columns and serialized[column] is not None
+            else serialized[column]
+            for column in self.columns
+        )
+
+    def from_row(self, row: sqlite3.Row):
+        object_dict = dict(zip(self.columns, row))
+        for column in self.json_columns:
+            if object_dict[column] is not None:
+                object_dict[column] = json.loads(object_dict[column])
+        return self.model.deserialize(object_dict)
+
+    def where(self, filters: list[FilterRelation]):
+        """Translates reduced filters into a WHERE clause and its parameters."""
+        clauses = []
+        parameters = []
+        for filter_ in filters:
+            if filter_.key not in self.columns:
+                raise ValueError(
+                    f"{filter_.key} is not a field of {self.model.__name__}"
+                )
+            value = filter_.value
+            if self.columns[filter_.key] in ("INTEGER", "REAL"):
+                value = float(value)
+            clauses.append(f'"{filter_.key}" {_SQL_OPERATORS[filter_.relation]} ?')
+            parameters.append(value)
+        return clauses, parameters
+
+
+class LocalStore:
+    """A local SQLite mirror of accounts and transactions.
+
+    ``sync`` pulls new data from the API, only asking for transactions from
+    the second of the latest one already stored for each account onwards, and
+    the ``query_*`` methods answer Filter DSL queries from the local copy.
+    """
+
+    ACCOUNTS = _Table("accounts", Account, ACCOUNT_SERVICE_MAPPING, "accountId")
+    TRANSACTIONS = _Table(
+        "transactions", Transaction, TRANSACTION_SERVICE_MAPPING, "transactionUUID"
+    )
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        :param path: The SQLite database file, kept in memory if not given
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock, self._connection:
+            self._connection.execute(self.ACCOUNTS.create_sql())
+            self._connection.execute(self.TRANSACTIONS.create_sql())
+            for column in ("timestamp", "status", "amount"):
+                self._connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS transactions_{column} "
+                    f'ON transactions ("{column}")'
+                )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS transactions_account_timestamp "
+                'ON transactions ("accountUUID", "timestamp")'
+            )
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _upsert(self, table: _Table, records):
+        rows = [table.to_row(record) for record in records]
+        with self._lock, self._connection:
+            self._connection.executemany(table.upsert_sql(), rows)
+        return len(rows)
+
+    def upsert_accounts(self, accounts):
+        """Inserts or replaces accounts, returning how many were written."""
+        return self._upsert(self.ACCOUNTS, accounts)
+
+    def upsert_transactions(self, transactions):
+        """Inserts or replaces transactions, returning how many were written."""
+        return self._upsert(self.TRANSACTIONS, transactions)
+
+    def latest_timestamp(self, account_id: str):
+        """Returns the newest stored transaction timestamp of an account, or None."""
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT MAX("timestamp") FROM transactions WHERE "accountUUID" = ?',
+                (account_id,),
+            ).fetchone()
+        return row[0]
+
+    def _select(self, table: _Table, filters: list[FilterRelation], extra=()):
+        try:
+            filters = reduce_filters(filters)
+        except ContradictoryFiltersError:
+            return []
+        clauses, parameters = table.where(filters)
+        for clause, parameter in extra:
+            clauses.append(clause)
+            parameters.append(parameter)
+        columns = ", ".join(f'"{column}"' for column in table.columns)
+        sql = f"SELECT {columns} FROM {table.name}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        with self._lock:
+            rows = self._connection.execute(sql, parameters).fetchall()
+        return [table.from_row(row) for row in rows]
+
+    def query_accounts(self, filters: list[FilterRelation] | None = None):
+        """Gets stored accounts matching the filters, without any request.
+
+        :param filters: A list of optional filters using the API field names
+        """
+        return self._select(self.ACCOUNTS, filters or [])
+
+    def query_transactions(
+        self,
+        account_id: str | None = None,
+        filters: list[FilterRelation] | None = None,
+    ):
+        """Gets stored transactions matching the filters, without any request.
+
+        :param account_id: Only return transactions of this account if given
+        :param filters: A list of optional filters using the API field names
+        """
+        extra = [('"accountUUID" = ?', account_id)] if account_id is not None else []
+        return self._select(self.TRANSACTIONS, filters or [], extra)
+
+    def sync_accounts(self, client):
+        """Mirrors every account from the API, returning how many were written."""
+        return self.upsert_accounts(client.get_accounts())
+
+    def _fetch_new_transactions(self, client, account_id: str):
+        # Timestamps only go down to the second, so transactions from the same
+        # second as the latest stored one are fetched again in case there are
+        # new ones among them. The upsert absorbs the ones already stored.
+        latest = self.latest_timestamp(account_id)
+        filters = [Filter("timestamp").ge(latest)] if latest is not None else []
+        return client.get_transactions(account_id, filters)
+
+    def sync_transactions(self, client, account_id: str):
+        """Fetches the transactions of an account from the second of the latest
+        stored one onwards, returning how many were written.
+        """
+        return self.upsert_transactions(
+            self._fetch_new_transactions(client, account_id)
+        )
+
+    def sync(self, client, account_ids: list[str] | None = None, max_workers: int = 8):
+        """Mirrors accounts and then fetches new transactions for each account
+        in parallel.
+
+        :param client: The DeveloperApiClient to fetch with
+        :param account_ids: The accounts to sync transactions for, every stored account if not given
+        :param max_workers: The number of transaction requests to run at once
+        :return: A dict of account ID to the number of transactions written,
+            or the exception raised while syncing that account
+        """
+        self.sync_accounts(client)
+        if account_ids is None:
+            with self._lock:
+                account_ids = [
+                    row[0]
+                    for row in self._connection.execute(
+                        'SELECT "accountId" FROM accounts'
+                    )
+                ]
+
+        written = {}
+        for result in fan_out(
+            lambda account_id: self._fetch_new_transactions(client, account_id),
+            account_ids,
+            max_workers,
+        ):
+            if result.ok:
+                written[result.key] = self.upsert_transactions(result.result)
+            else:
+                written[result.key] = result.error
+        return written
@@ -0,0 +1,175 @@
+import codecs
+import json
+from collections.abc import Iterable
+from itertools import islice
+
+_WHITESPACE = " \t\n\r"
+
+_START = "start"
+_KEY = "key"
+_COLON = "colon"
+_VALUE = "value"
+_AFTER_VALUE = "after_value"
+_ARRAY_START = "array_start"
+_FIRST_ITEM = "first_item"
+_ITEM = "item"
+_AFTER_ITEM = "after_item"
+_DONE = "done"
+
+_INCOMPLETE = object()
+
+
+class JsonArrayStreamParser:
+    """Incrementally parses the records of one array in a JSON object, such as
+    the ``Accounts`` array of ``{"Accounts": [...]}``.
+
+    Bytes are pushed in with ``feed`` as they arrive and every record that is
+    complete so far is returned, so only the record being read is buffered.
+    Other top level keys are skipped. If the key is missing no records are
+    returned, the same as ``response.get(key, [])``.
+    """
+
+    # Consumed text is only dropped from the buffer once it gets this large, so
+    # that parsing many small records doesn't copy the buffer for each one
+    COMPACT_THRESHOLD = 64 * 1024
+
+    def __init__(self, key: str):
+        """
+        :param key: The top level key holding the array of records
+        """
+        self.key = key
+        self._json_decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._current_key = None
+        self._eof = False
+
+    def feed(self, data: bytes):
+        """Adds the next chunk of the response and returns any completed records.
+
+        :param data: The next chunk of raw response bytes
+        :return: A list of the records completed by this chunk
+        """
+        self._buffer += self._text_decoder.decode(data)
+        return self._parse()
+
+    def close(self):
+        """Marks the end of the response and returns any remaining records.
+
+        :return: A list of the records that were still pending
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        self._eof = True
+        records = self._parse()
+        if self._state != _DONE:
+            raise ValueError("Unexpected end of JSON response")
+        return records
+
+    def _skip_whitespace(self):
+        buffer = self._buffer
+        pos = self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < len(buffer)
+
+    def _decode(self):
+        try:
+            value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._eof:
+                raise
+            return _INCOMPLETE
+        # A value running up to the end of the buffer may be a number that
+        # continues in the next chunk
+        if end == len(self._buffer) and not self._eof:
+            return _INCOMPLETE
+        self._pos = end
+        return value
+
+    def _expect(self, expected: str, char: str):
+        if char not in expected:
+            raise ValueError(
+                f"Unexpected {char!r} at position {self._pos} of JSON response"
+            )
+        self._pos += 1
+
+    def _parse(self):
+        records = []
+        while self._state != _DONE and self._skip_whitespace():
+            char = self._buffer[self._pos]
+            state = self._state
+
+            if state == _START:
+                self._expect("{", char)
+                self._state = _KEY
+            elif state == _KEY:
+                if char == "}":
+                    self._pos += 1
+                    self._state = _DONE
+                    continue
+                self._expect('"', char)
+                self._pos -= 1
+                key = self._decode()
+                if key is _INCOMPLETE:
+                    break
+                self._current_key = key
+                self._state = _COLON
+            elif state == _COLON:
+                self._expect(":", char)
+                self._state = _ARRAY_START if self._current_key == self.key else _VALUE
+            elif state == _VALUE:
+                if self._decode() is _INCOMPLETE:
+                    break
+                self._state = _AFTER_VALUE
+            elif state == _AFTER_VALUE:
+                self._expect(",}", char)
+                self._state = _KEY if char == "," else _DONE
+            elif state == _ARRAY_START:
+                self._expect("[", char)
+                self._state = _FIRST_ITEM
+            elif state == _FIRST_ITEM and char == "]":
+                self._pos += 1
+                self._state = _AFTER_VALUE
+            elif state in (_FIRST_ITEM, _ITEM):
+                record = self._decode()
+                if record is _INCOMPLETE:
+                    break
+                records.append(record)
+                self._state = _AFTER_ITEM
+            elif state == _AFTER_ITEM:
+                self._expect(",]", char)
+                self._state = _ITEM if char == "," else _AFTER_VALUE
+
+        if self._pos >= self.COMPACT_THRESHOLD or self._pos == len(self._buffer):
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        return records
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str):
+    """Yields the records of the array under ``key`` from an iterable of
+    response chunks, one at a time.
+
+    :param chunks: The raw response body in chunks
+    :param key: The top level key holding the array of records
+    """
+    parser = JsonArrayStreamParser(key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def chunked(iterable: Iterable, size: int):
+    """Groups an iterable into lists of at most ``size`` items.
+
+    :param iterable: The items to group
+    :param size: The maximum number of items in each list
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
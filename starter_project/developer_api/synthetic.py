@@ -0,0 +1,80 @@
+import random
+import uuid
+
+CURRENCIES = ["GBP", "EUR", "USD"]
+STATUSES = ["Successful", "Pending", "Flagged", "Declined"]
+MERCHANTS = [
+    ("Capital Two", "Bills & Utilities", "Credit Card Company", ["Online"]),
+    ("Blahbucks", "Food & Dining", "Supplying all your coffee needs", ["In-store"]),
+    ("Tescos", "Groceries", "Everyday groceries", ["In-store", "Online"]),
+    ("Trainline", "Travel", "Train tickets", ["Online"]),
+]
+
+
+def make_account(index: int, rng: random.Random):
+    """Builds a raw API account dict shaped like the Accounts endpoint returns."""
+    return {
+        "accountId": str(10_000_000 + index),
+        "firstname": "Blondell",
+        "phoneNumber": "+44873425431",
+        "developerId": "123",
+        "uci": str(100_000 + index),
+        "riskScore": str(rng.randint(0, 100)),
+        "creditScore": str(rng.randint(300, 850)),
+        "currencyCode": rng.choice(CURRENCIES),
+        "productType": rng.choice(["Credit", "Debit"]),
+        "email": "Blondell.Bartell@emailservice.co.uk",
+        "lastname": "Bartell",
+        "homeAddress": "72 Richard Road, Oxford, United Kingdom",
+        "state": rng.choice(["open", "closed", "suspended", "flagged"]),
+        "creditLimit": str(rng.choice([500, 1000, 5000])),
+        "balance": str(rng.randint(0, 10_000)),
+        "liveBalance": "true",
+    }
+
+
+def _random_timestamp(rng: random.Random):
+    return (
+        f"2019-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} "
+        f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+    )
+
+
+def make_transaction(account_id: str, rng: random.Random, timestamp: str | None = None):
+    """Builds a raw API transaction dict shaped like the Transactions endpoint returns."""
+    merchant_index = rng.randrange(len(MERCHANTS))
+    name, category, description, point_of_sale = MERCHANTS[merchant_index]
+    return {
+        "transactionUUID": str(uuid.UUID(int=rng.getrandbits(128))),
+        "accountUUID": account_id,
+        "merchantUUID": str(merchant_index),
+        "merchant": {
+            "name": name,
+            "category": category,
+            "description": description,
+            "pointOfSale": point_of_sale,
+        },
+        "amount": round(rng.uniform(1, 1000), 2),
+        "creditDebitIndicator": rng.choice(["Credit", "Debit"]),
+        "currency": rng.choice(CURRENCIES),
+        "timestamp": timestamp or _random_timestamp(rng),
+        "emoji": "🤑",
+        "latitude": round(rng.uniform(50, 58), 5),
+        "longitude": round(rng.uniform(-6, 2), 5),
+        "status": rng.choice(STATUSES),
+        "message": "Weekly groceries shopping",
+        "pointOfSale": rng.choice(point_of_sale),
+    }
+
+
+def make_accounts(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [make_account(index, rng) for index in range(count)]
+
+
+def make_transactions(count: int, num_accounts: int = 100, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        make_transaction(str(10_000_000 + rng.randrange(num_accounts)), rng)
+        for _ in range(count)
+    ]
@@ -0,0 +1,187 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+from starter_project.developer_api.frames import parse_timestamps
+
+Timestamp = str | int
+
+BUCKET_SECONDS = {"hour": 3600, "day": 86400}
+
+
+def _epoch(timestamp: Timestamp):
+    if isinstance(timestamp, str):
+        return int(parse_timestamps([timestamp])[0])
+    return int(timestamp)
+
+
+class _Run:
+    # The transactions of one account sorted by time, with their parsed
+    # timestamps kept alongside for binary search
+    def __init__(self):
+        self.epochs = np.empty(0, dtype=np.int64)
+        self.records = np.empty(0, dtype=object)
+
+    def add(self, epochs: np.ndarray, records: np.ndarray):
+        order = np.argsort(epochs, kind="stable")
+        epochs, records = epochs[order], records[order]
+        if not len(self.epochs) or epochs[0] >= self.epochs[-1]:
+            # New transactions are usually newer than everything held
+            self.epochs = np.concatenate([self.epochs, epochs])
+            self.records = np.concatenate([self.records, records])
+            return
+        positions = np.searchsorted(self.epochs, epochs, side="right")
+        self.epochs = np.insert(self.epochs, positions, epochs)
+        self.records = np.insert(self.records, positions, records)
+
+    def slice(self, start: int | None = None, end: int | None = None):
+        low = 0 if start is None else np.searchsorted(self.epochs, start, "left")
+        high = (
+            len(self.epochs)
+            if end is None
+            else np.searchsorted(self.epochs, end, "left")
+        )
+        return self.epochs[low:high], self.records[low:high]
+
+
+class TransactionTimeIndex:
+    """Answers time range questions over fetched transactions by binary search.
+
+    Every timestamp is parsed once, when its transaction is added, and each
+    account's transactions are kept as a sorted run. New batches, such as the
+    result of ``get_transactions`` or ``create_transactions``, are merged into
+    the runs without re-sorting them, and transactions already held are skipped.
+    Timestamps are given either in the API's ``2019-05-20 10:51:33`` format or
+    as epoch seconds, and ranges include their start but not their end.
+    """
+
+    def __init__(self, transactions: Iterable = ()):
+        """
+        :param transactions: Transactions to start with, any objects with
+            transaction_uuid, account_uuid and timestamp attributes
+        """
+        self._runs = {}
+        self._transaction_uuids = set()
+        self.add(transactions)
+
+    def __len__(self):
+        return len(self._transaction_uuids)
+
+    def __contains__(self, transaction_uuid: str):
+        return transaction_uuid in self._transaction_uuids
+
+    @property
+    def account_uuids(self):
+        return list(self._runs)
+
+    def add(self, transactions: Iterable):
+        """Adds a batch of transactions, skipping any already in the index.
+
+        :return: The number of transactions added
+        """
+        by_account = {}
+        for transaction in transactions:
+            if transaction.transaction_uuid in self._transaction_uuids:
+                continue
+            self._transaction_uuids.add(transaction.transaction_uuid)
+            by_account.setdefault(transaction.account_uuid, []).append(transaction)
+
+        for account_uuid, batch in by_account.items():
+            records = np.empty(len(batch), dtype=object)
+            records[:] = batch
+            epochs = parse_timestamps([transaction.timestamp for transaction in batch])
+            self._runs.setdefault(account_uuid, _Run()).add(epochs, records)
+        return sum(len(batch) for batch in by_account.values())
+
+    def _slices(self, account_uuid: str, start: Timestamp, end: Timestamp):
+        start = None if start is None else _epoch(start)
+        end = None if end is None else _epoch(end)
+        if account_uuid is not None:
+            runs = [self._runs[account_uuid]] if account_uuid in self._runs else []
+        else:
+            runs = self._runs.values()
+        slices = [run.slice(start, end) for run in runs]
+        return [(epochs, records) for epochs, records in slices if len(epochs)]
+
+    def _merged(self, account_uuid: str, start: Timestamp, end: Timestamp):
+        slices = self._slices(account_uuid, start, end)
+        if not slices:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=object)
+        if len(slices) == 1:
+            return slices[0]
+        epochs = np.concatenate([epochs for epochs, _ in slices])
+        records = np.concatenate([records for _, records in slices])
+        order = np.argsort(epochs, kind="stable")
+        return epochs[order], records[order]
+
+    def between(
+        self,
+        start: Timestamp | None = None,
+        end: Timestamp | None = None,
+        account_uuid: str | None = None,
+    ):
+        """Returns the transactions from ``start`` up to ``end`` in time order.
+
+        :param start: The earliest timestamp included, unbounded if not given
+        :param end: The timestamp the range stops before, unbounded if not given
+        :param account_uuid: Only return this account's transactions if given
+        """
+        return self._merged(account_uuid, start, end)[1].tolist()
+
+    def count(
+        self,
+        start: Timestamp | None = None,
+        end: Timestamp | None = None,
+        account_uuid: str | None = None,
+    ):
+        """Counts the transactions from ``start`` up to ``end`` without
+        building a list of them.
+        """
+        return sum(len(epochs) for epochs, _ in self._slices(account_uuid, start, end))
+
+    def latest(
+        self, n: int, account_uuid: str | None = None, before: Timestamp | None = None
+    ):
+        """Returns the ``n`` most recent transactions, newest first.
+
+        :param n: The number of transactions to return
+        :param account_uuid: Only return this account's transactions if given
+        :param before: Only consider transactions before this timestamp
+        """
+        if n <= 0:
+            return []
+        # Only the last n of every account can be among the last n overall
+        tails = [
+            (epochs[-n:], records[-n:])
+            for epochs, records in self._slices(account_uuid, None, before)
+        ]
+        if not tails:
+            return []
+        epochs = np.concatenate([epochs for epochs, _ in tails])
+        records = np.concatenate([records for _, records in tails])
+        order = np.argsort(epochs, kind="stable")[::-1][:n]
+        return records[order].tolist()
+
+    def bucket_counts(
+        self,
+        bucket: str = "day",
+        start: Timestamp | None = None,
+        end: Timestamp | None = None,
+        account_uuid: str | None = None,
+    ):
+        """Counts transactions per hour or day.
+
+        :param bucket: Either ``hour`` or ``day``
+        :return: A dict of the bucket's start, in the API timestamp format, to
+            the number of transactions in it, in time order
+        """
+        if bucket not in BUCKET_SECONDS:
+            raise ValueError(f"bucket must be one of {', '.join(BUCKET_SECONDS)}")
+        seconds = BUCKET_SECONDS[bucket]
+        epochs, _ = self._merged(account_uuid, start, end)
+        buckets, counts = np.unique(epochs // seconds * seconds, return_counts=True)
+        labels = buckets.astype("datetime64[s]").astype(str)
+        return {
+            str(label).replace("T", " "): int(count)
+            for label, count in zip(labels, counts)
+        }
@@ -0,0 +1,185 @@
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from starter_project.developer_api.ratelimit import (
+    AdaptiveRateController,
+    parse_retry_after,
+)
+
+
+@dataclass
+class PoolStats:
+    connections_opened: int = 0
+    connections_reused: int = 0
+    requests: int = 0
+
+
+class _PoolTrackingAdapter(HTTPAdapter):
+    # Remembers every urllib3 pool handed out so their connection counters can
+    # be reported per host, even after the pool manager evicts a pool
+    def __init__(self, *args, **kwargs):
+        self._pools_lock = threading.Lock()
+        self._pools = {}
+        super().__init__(*args, **kwargs)
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        pool = super().get_connection_with_tls_context(request, verify, proxies, cert)
+        with self._pools_lock:
+            self._pools.setdefault(urlsplit(request.url).netloc, {})[id(pool)] = pool
+        return pool
+
+    def pool_stats(self):
+        stats = {}
+        with self._pools_lock:
+            for host, pools in self._pools.items():
+                opened = sum(pool.num_connections for pool in pools.values())
+                made = sum(pool.num_requests for pool in pools.values())
+                stats[host] = PoolStats(opened, max(made - opened, 0), made)
+        return stats
+
+
+class Transport(ABC):
+    """Base class for the HTTP layer used by the developer API clients.
+
+    Subclasses only need to implement ``request`` and, if they hold any
+    resources, ``close``.
+    """
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict | None = None,
+        params: dict | None = None,
+        data: str | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ):
+        """Sends a request and returns the ``requests.Response``."""
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class HttpTransport(Transport):
+    """A pooled, keep-alive transport built on a shared ``requests.Session``.
+
+    Requests answered with 429 are retried for any method, 5xx responses are
+    only retried for idempotent methods so creates are never replayed after the
+    server may have acted on them. Retries wait at least as long as a
+    Retry-After header asks.
+    """
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+    DEFAULT_TIMEOUT = 10.0
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = 3,
+        backoff_factor: float = 0.2,
+        backoff_max: float = 5.0,
+        rate_controller: AdaptiveRateController = None,
+    ):
+        """
+        :param pool_size: The maximum number of keep-alive connections kept per host
+        :param timeout: Default timeout in seconds for a single request
+        :param max_retries: How many times a throttled or failed request is retried
+        :param backoff_factor: Base delay in seconds for the exponential backoff
+        :param backoff_max: Upper bound in seconds for a single backoff delay
+        :param rate_controller: Paces every attempt and adapts to throttling, can be
+            shared with other transports and clients
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.rate_controller = rate_controller
+
+        self._adapter = _PoolTrackingAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+
+    def _should_retry(self, method: str, status_code, attempt: int):
+        if attempt >= self.max_retries or status_code not in self.RETRY_STATUSES:
+            return False
+        return status_code == 429 or method in self.IDEMPOTENT_METHODS
+
+    def _backoff(self, attempt: int, retry_after: float | None = None):
+        # Full jitter keeps many workers that were throttled together from
+        # retrying in lockstep
+        delay = min(self.backoff_max, self.backoff_factor * (2**attempt))
+        return max(random.uniform(0, delay), retry_after or 0.0)
+
+    def _send(self, method: str, url: str, **kwargs):
+        if self.rate_controller is None:
+            return self._session.request(method, url, **kwargs)
+        self.rate_controller.acquire()
+        try:
+            response = self._session.request(method, url, **kwargs)
+        except Exception:
+            self.rate_controller.release()
+            raise
+        self.rate_controller.release(
+            response.status_code,
+            parse_retry_after(response.headers.get("Retry-After")),
+        )
+        return response
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict | None = None,
+        params: dict | None = None,
+        data: str | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ):
+        method = method.upper()
+        if timeout is None:
+            timeout = self.timeout
+
+        attempt = 0
+        while True:
+            response = self._send(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                data=data,
+                timeout=timeout,
+                stream=stream,
+            )
+            if not self._should_retry(method, response.status_code, attempt):
+                return response
+            response.close()
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            time.sleep(self._backoff(attempt, retry_after))
+            attempt += 1
+
+    def pool_stats(self):
+        """Returns the connection statistics keyed by host."""
+        return self._adapter.pool_stats()
+
+    def close(self):
+        self._session.close()
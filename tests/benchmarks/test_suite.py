@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from benchmarks import suite
+from benchmarks.suite import Metric, compare
+
+
+class TestSuite:
+    @pytest.fixture(autouse=True)
+    def set_up(self, monkeypatch):
+        self.metrics = [
+            Metric("get_request", 800.0, "requests/s", True),
+            Metric("account_memory", 500.0, "bytes/record", False),
+        ]
+        monkeypatch.setattr(suite, "run", lambda records, requests: self.metrics)
+
+    def _baseline(self, get_request: float, account_memory: float):
+        return {
+            "get_request": {"value": get_request},
+            "account_memory": {"value": account_memory},
+        }
+
+    def test_change_is_positive_for_regressions_either_way(self):
+        throughput = Metric("get_request", 800.0, "requests/s", True)
+        memory = Metric("account_memory", 500.0, "bytes/record", False)
+
+        assert throughput.change_from(1000.0) == pytest.approx(0.2)
+        assert throughput.change_from(500.0) == pytest.approx(-0.6)
+        assert memory.change_from(400.0) == pytest.approx(0.25)
+        assert memory.change_from(1000.0) == pytest.approx(-0.5)
+        assert memory.change_from(0) == 0.0
+
+    def test_compare_reports_only_regressions_past_the_threshold(self):
+        assert compare(self.metrics, self._baseline(850.0, 480.0), 0.1) == []
+        assert compare(self.metrics, self._baseline(1000.0, 480.0), 0.1) == [
+            "get_request"
+        ]
+        assert compare(self.metrics, self._baseline(850.0, 250.0), 0.1) == [
+            "account_memory"
+        ]
+        # Improvements never count, however large
+        assert compare(self.metrics, self._baseline(100.0, 5000.0), 0.1) == []
+
+    def test_compare_skips_metrics_missing_from_the_baseline(self):
+        assert compare(self.metrics, {}, 0.1) == []
+
+    def test_main_fails_on_a_regression(self, tmp_path):
+        output = tmp_path / "results.json"
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps({"metrics": self._baseline(1200.0, 500.0)}))
+
+        assert suite.main(["--output", str(output)]) == 0
+        assert suite.main(["--output", str(output), "--baseline", str(baseline)]) == 1
+        assert json.loads(output.read_text())["metrics"]["get_request"] == {
+            "value": 800.0,
+            "unit": "requests/s",
+            "higher_is_better": True,
+        }
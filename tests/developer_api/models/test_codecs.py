@@ -0,0 +1,72 @@
+import pytest
+
+from starter_project.developer_api.models import (
+    Account,
+    AccountState,
+    Merchant,
+    ProductType,
+    Transaction,
+    TransactionStatus,
+)
+from tests.developer_api import test_clients
+
+
+class TestCodecs:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.raw_account = test_clients.TestClients.EXAMPLE_ACCOUNT_RESPONSE[
+            "Accounts"
+        ][0]
+        self.raw_transaction = test_clients.TestClients.EXAMPLE_TRANSACTION_RESPONSE[
+            "Transactions"
+        ][0]
+
+    def test_account_fields_are_converted(self):
+        account = Account.deserialize(self.raw_account)
+
+        assert account.risk_score == 22
+        assert account.balance == 1000.0
+        assert account.live_balance is True
+        assert account.product_type is ProductType.CREDIT
+        assert account.state is AccountState.OPEN
+
+    def test_false_strings_decode_to_false(self):
+        account = Account.deserialize({**self.raw_account, "liveBalance": "false"})
+
+        assert account.live_balance is False
+
+    def test_unknown_enum_values_are_kept(self):
+        account = Account.deserialize({**self.raw_account, "state": "dormant"})
+
+        assert account.state == "dormant"
+
+    def test_transaction_fields_are_converted(self, capsys):
+        transaction = Transaction.deserialize(self.raw_transaction)
+
+        assert transaction.status is TransactionStatus.SUCCESSFUL
+        assert transaction.credit_debit_indicator is ProductType.DEBIT
+        assert transaction.merchant == Merchant(
+            "Capital Two", "Bills & Utilities", "Credit Card Company", ["Online"]
+        )
+        assert capsys.readouterr().out == ""
+
+    def test_serialize_round_trips(self):
+        transaction = Transaction.deserialize(self.raw_transaction)
+        account = Account.deserialize(self.raw_account)
+
+        assert Transaction.deserialize(transaction.serialize()) == transaction
+        assert Account.deserialize(account.serialize()) == account
+        assert transaction.serialize()["merchant"] == self.raw_transaction["merchant"]
+        assert transaction.serialize()["status"] == "Successful"
+
+    def test_serialize_keeps_the_api_enum_values(self):
+        transaction = Transaction.deserialize(self.raw_transaction).serialize()
+        account = Account.deserialize(self.raw_account).serialize()
+
+        for raw, serialized in (
+            (self.raw_transaction, transaction),
+            (self.raw_account, account),
+        ):
+            for key in ("creditDebitIndicator", "status", "productType", "state"):
+                if key in raw:
+                    assert serialized[key] == raw[key]
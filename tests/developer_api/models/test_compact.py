@@ -0,0 +1,95 @@
+from dataclasses import fields
+
+import pytest
+
+from starter_project.developer_api.models import (
+    Account,
+    CompactAccount,
+    CompactTransaction,
+    MerchantTable,
+    Transaction,
+    TransactionStatus,
+)
+from tests.developer_api import test_clients
+
+
+class TestCompactModels:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.raw_account = test_clients.TestClients.EXAMPLE_ACCOUNT_RESPONSE[
+            "Accounts"
+        ][0]
+        self.raw_transactions = test_clients.TestClients.EXAMPLE_TRANSACTION_RESPONSE[
+            "Transactions"
+        ]
+        self.merchants = MerchantTable()
+
+    def test_instances_have_no_dict(self):
+        account = CompactAccount.deserialize(self.raw_account)
+
+        assert not hasattr(account, "__dict__")
+        assert account.risk_score == 22
+
+    def test_transactions_share_merchants(self):
+        first = CompactTransaction.deserialize(self.raw_transactions[0], self.merchants)
+        again = CompactTransaction.deserialize(
+            dict(self.raw_transactions[0]), self.merchants
+        )
+        other = CompactTransaction.deserialize(self.raw_transactions[1], self.merchants)
+
+        assert first.merchant is again.merchant
+        assert first.merchant is not other.merchant
+        assert len(self.merchants) == 2
+        assert first.status is TransactionStatus.SUCCESSFUL
+
+    def test_repeated_strings_are_interned(self):
+        raw = self.raw_transactions[0]
+        # Built at runtime so the two strings are equal but not the same object
+        first = CompactTransaction.deserialize(
+            {**raw, "currency": "gbp".upper()}, self.merchants
+        )
+        second = CompactTransaction.deserialize(
+            {**raw, "currency": "gbp".upper()}, self.merchants
+        )
+
+        assert first.currency is second.currency
+
+    def test_serializes_like_the_full_models(self):
+        transaction = Transaction.deserialize(self.raw_transactions[1])
+        compact = CompactTransaction.from_transaction(transaction, self.merchants)
+        account = Account.deserialize(self.raw_account)
+
+        assert compact.serialize() == transaction.serialize()
+        assert compact.to_transaction() == transaction
+        assert CompactAccount.from_account(account).to_account() == account
+
+    def test_serializing_first_keeps_interning(self):
+        raw = self.raw_transactions[0]
+        transaction = Transaction.deserialize(raw)
+        CompactTransaction(
+            **{
+                field.name: getattr(transaction, field.name)
+                for field in fields(Transaction)
+            }
+        ).serialize()
+
+        first = CompactTransaction.deserialize(
+            {**raw, "message": "shop".upper()}, self.merchants
+        )
+        second = CompactTransaction.deserialize(
+            {**raw, "message": "shop".upper()}, self.merchants
+        )
+
+        assert first.message is second.message
+
+    def test_merchants_without_a_uuid_are_not_shared(self):
+        first = CompactTransaction.deserialize(
+            {**self.raw_transactions[0], "merchantUUID": None}, self.merchants
+        )
+        other = CompactTransaction.deserialize(
+            {**self.raw_transactions[1], "merchantUUID": None}, self.merchants
+        )
+
+        assert first.merchant.name == "Capital Two"
+        assert other.merchant.name == "Blahbucks"
+        assert len(self.merchants) == 0
@@ -0,0 +1,70 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from starter_project.developer_api.clients import DeveloperApiClient
+from starter_project.developer_api.models import (
+    Account,
+    AccountState,
+    LazyAccount,
+    LazyTransaction,
+    Merchant,
+    Transaction,
+)
+from tests.developer_api import test_clients
+
+
+class TestLazyModels:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.raw_account = test_clients.TestClients.EXAMPLE_ACCOUNT_RESPONSE[
+            "Accounts"
+        ][0]
+        self.raw_transaction = test_clients.TestClients.EXAMPLE_TRANSACTION_RESPONSE[
+            "Transactions"
+        ][0]
+
+    def test_fields_are_decoded_on_first_read(self):
+        account = LazyAccount(self.raw_account)
+
+        assert account._decoded == {}
+        assert account.balance == 1000.0
+        assert account.state is AccountState.OPEN
+        assert set(account._decoded) == {"balance", "state"}
+
+    def test_nested_merchant_is_decoded(self):
+        transaction = LazyTransaction(self.raw_transaction)
+
+        assert isinstance(transaction.merchant, Merchant)
+        assert transaction.latitude == -4.38849
+
+    def test_behaves_like_the_full_model(self):
+        lazy = LazyTransaction(self.raw_transaction)
+        full = Transaction.deserialize(self.raw_transaction)
+
+        assert lazy == full
+        assert full == lazy
+        assert lazy.serialize() == full.serialize()
+        assert lazy.to_model() == full
+        assert LazyAccount(self.raw_account) == Account.deserialize(self.raw_account)
+
+    def test_assignment_overrides_the_raw_value(self):
+        account = LazyAccount(self.raw_account)
+        account.balance = 5.0
+
+        assert account.balance == 5.0
+        assert self.raw_account["balance"] == "1000"
+
+    @patch("requests.Session.request")
+    def test_client_returns_lazy_views(self, mock_request):
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.content = json.dumps(
+            test_clients.TestClients.EXAMPLE_TRANSACTION_RESPONSE
+        ).encode()
+        client = DeveloperApiClient("dummy-token")
+
+        transactions = client.get_transactions("72965642", lazy=True)
+
+        assert all(isinstance(t, LazyTransaction) for t in transactions)
+        assert transactions[1].amount == 517.06
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from starter_project.developer_api.aggregates import Aggregate, TransactionAggregator
+from starter_project.developer_api.models import Transaction
+from starter_project.developer_api.frames import TransactionFrame
+from starter_project.developer_api.synthetic import make_transactions
+
+
+class TestTransactionAggregator:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.raw = make_transactions(1000, num_accounts=5)
+        self.transactions = [Transaction.deserialize(raw) for raw in self.raw]
+        self.aggregator = TransactionAggregator(self.transactions[:600])
+        self.aggregator.add(self.transactions[600:])
+
+    def _expected(self, account_uuid, key_of=lambda transaction: None):
+        expected = {}
+        for transaction in self.transactions:
+            if transaction.account_uuid == account_uuid:
+                by_indicator = expected.setdefault(key_of(transaction), {})
+                aggregate = by_indicator.setdefault(
+                    transaction.credit_debit_indicator.value, Aggregate()
+                )
+                aggregate.add(transaction.amount)
+        return expected
+
+    def _assert_equal(self, actual, expected):
+        assert actual.keys() == expected.keys()
+        for indicator, aggregate in actual.items():
+            assert aggregate.count == expected[indicator].count
+            assert aggregate.total == pytest.approx(expected[indicator].total)
+            assert aggregate.minimum == expected[indicator].minimum
+            assert aggregate.maximum == expected[indicator].maximum
+
+    def test_totals_match_a_recompute(self):
+        for account_uuid in self.aggregator.account_uuids:
+            self._assert_equal(
+                self.aggregator.totals(account_uuid),
+                self._expected(account_uuid)[None],
+            )
+
+    def test_breakdowns_match_a_recompute(self):
+        account_uuid = self.transactions[0].account_uuid
+        for dimension, key_of in TransactionAggregator.DIMENSIONS.items():
+            breakdown = self.aggregator.breakdown(account_uuid, dimension)
+            expected = self._expected(account_uuid, key_of)
+            assert breakdown.keys() == expected.keys()
+            for key, by_indicator in breakdown.items():
+                self._assert_equal(by_indicator, expected[key])
+
+        days = list(self.aggregator.daily(account_uuid))
+        assert days == sorted(days)
+        with pytest.raises(ValueError):
+            self.aggregator.breakdown(account_uuid, "week")
+
+    def test_keys_are_the_api_values(self):
+        account_uuid = self.transactions[0].account_uuid
+        raw = [t for t in self.raw if t["accountUUID"] == account_uuid]
+        frame = TransactionFrame.from_dicts(raw)
+
+        totals = self.aggregator.totals(account_uuid)
+        assert {
+            indicator: aggregate.count for indicator, aggregate in totals.items()
+        } == frame.group_count("credit_debit_indicator")
+        assert set(self.aggregator.breakdown(account_uuid, "status")) == {
+            t["status"] for t in raw
+        }
+
+    def test_duplicates_are_skipped(self):
+        account_uuid = self.transactions[0].account_uuid
+        before = self.aggregator.totals(account_uuid)
+
+        assert self.aggregator.add(random.sample(self.transactions, 100)) == 0
+        assert len(self.aggregator) == 1000
+        assert self.aggregator.totals(account_uuid) == before
+
+    def test_snapshot_round_trip(self, tmp_path):
+        path = str(tmp_path / "aggregates.json")
+        self.aggregator.save(path)
+
+        restored = TransactionAggregator.load(path)
+
+        assert len(restored) == 1000
+        assert restored.add(self.transactions[:10]) == 0
+        for account_uuid in self.aggregator.account_uuids:
+            assert restored.totals(account_uuid) == self.aggregator.totals(account_uuid)
+            for dimension in TransactionAggregator.DIMENSIONS:
+                assert restored.breakdown(
+                    account_uuid, dimension
+                ) == self.aggregator.breakdown(account_uuid, dimension)
+
+    def test_restore_rejects_other_versions(self):
+        snapshot = self.aggregator.snapshot()
+        snapshot["version"] = 0
+
+        with pytest.raises(ValueError):
+            TransactionAggregator.restore(snapshot)
@@ -0,0 +1,102 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from starter_project.developer_api.binary_snapshot import SnapshotReader, write_snapshot
+from starter_project.developer_api.models import (
+    Account,
+    CompactTransaction,
+    MerchantTable,
+    Transaction,
+)
+from starter_project.developer_api.synthetic import make_accounts, make_transactions
+from tests.developer_api import test_clients
+
+
+class TestBinarySnapshot:
+    @pytest.fixture(autouse=True)
+    def set_up(self, tmp_path):
+        self.path = str(tmp_path / "snapshot.bin")
+        self.accounts = [
+            Account.deserialize(raw)
+            for raw in make_accounts(50)
+            + test_clients.TestClients.EXAMPLE_ACCOUNT_RESPONSE["Accounts"]
+        ]
+        self.transactions = [
+            Transaction.deserialize(raw)
+            for raw in make_transactions(500)
+            + test_clients.TestClients.EXAMPLE_TRANSACTION_RESPONSE["Transactions"]
+        ]
+
+    def _round_trip(self, accounts=(), transactions=()):
+        write_snapshot(self.path, accounts, transactions)
+        with SnapshotReader(self.path) as reader:
+            return list(reader.accounts), list(reader.transactions)
+
+    def test_round_trips_serialize_output(self):
+        accounts, transactions = self._round_trip(self.accounts, self.transactions)
+
+        assert [a.serialize() for a in accounts] == [
+            a.serialize() for a in self.accounts
+        ]
+        assert [t.serialize() for t in transactions] == [
+            t.serialize() for t in self.transactions
+        ]
+        assert accounts == self.accounts
+        assert transactions == self.transactions
+
+    def test_round_trips_missing_and_unknown_values(self):
+        account = dataclasses.replace(
+            self.accounts[0], risk_score=None, balance=None, email=None, state="frozen"
+        )
+        transaction = dataclasses.replace(
+            self.transactions[0], merchant=None, latitude=None, status="Refunded"
+        )
+
+        accounts, transactions = self._round_trip([account], [transaction])
+
+        assert accounts[0].serialize() == account.serialize()
+        assert transactions[0].serialize() == transaction.serialize()
+
+    def test_stores_compact_models(self):
+        compact = [
+            CompactTransaction.from_transaction(transaction, MerchantTable())
+            for transaction in self.transactions
+        ]
+
+        _, transactions = self._round_trip(transactions=compact)
+
+        assert transactions == self.transactions
+
+    def test_reads_rows_and_columns_on_demand(self):
+        write_snapshot(self.path, self.accounts, self.transactions)
+
+        with SnapshotReader(self.path) as reader:
+            assert len(reader.transactions) == len(self.transactions)
+            assert reader.transactions[-1] == self.transactions[-1]
+            assert reader.transactions[10:13] == self.transactions[10:13]
+            assert np.array_equal(
+                reader.transactions.column("amount"),
+                [t.amount for t in self.transactions],
+            )
+            assert reader.accounts.column("accountId") == [
+                a.account_id for a in self.accounts
+            ]
+            with pytest.raises(IndexError):
+                reader.accounts[len(self.accounts)]
+            with pytest.raises(ValueError):
+                reader.accounts.column("unknown")
+
+    def test_rejects_values_it_cannot_store(self):
+        account = dataclasses.replace(self.accounts[0], uci=123)
+
+        with pytest.raises(TypeError):
+            write_snapshot(self.path, [account])
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as file:
+            file.write(b'{"Accounts": []}')
+
+        with pytest.raises(ValueError):
+            SnapshotReader(self.path)
@@ -0,0 +1,252 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from starter_project.developer_api.bulk import (
+    BatchExecutor,
+    Operation,
+    async_fan_out,
+    fan_out,
+    unique_keys,
+)
+from starter_project.developer_api.clients import (
+    AsyncDeveloperApiClient,
+    DeveloperApiClient,
+)
+from starter_project.developer_api.local_server import LocalDeveloperApi
+
+
+class TestBulk:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.client = DeveloperApiClient("dummy-token")
+
+    @staticmethod
+    def _fetch(account_id):
+        if account_id == "bad":
+            raise ValueError("no such account")
+        return f"transactions-{account_id}"
+
+    def test_unique_keys_keeps_first_seen_order(self):
+        assert unique_keys(["b", "a", "b", "c", "a"]) == ["b", "a", "c"]
+
+    def test_fan_out_isolates_errors(self):
+        results = {
+            result.key: result for result in fan_out(self._fetch, ["1", "bad", "2"], 2)
+        }
+
+        assert results["1"].result == "transactions-1"
+        assert results["2"].ok
+        assert not results["bad"].ok
+        assert isinstance(results["bad"].error, ValueError)
+
+    def test_fan_out_runs_in_parallel(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait_for_others(key):
+            barrier.wait()
+            return key
+
+        results = list(fan_out(wait_for_others, ["1", "2", "3"], 3))
+
+        assert sorted(result.result for result in results) == ["1", "2", "3"]
+
+    def test_get_transactions_for_accounts(self):
+        with patch.object(self.client, "get_transactions") as mock_get_transactions:
+            mock_get_transactions.side_effect = lambda account_id, filters: self._fetch(
+                account_id
+            )
+
+            results = self.client.get_transactions_for_accounts(["2", "bad", "1", "2"])
+
+        assert list(results) == ["2", "bad", "1"]
+        assert results["1"].result == "transactions-1"
+        assert not results["bad"].ok
+        assert mock_get_transactions.call_count == 3
+
+    def test_get_accounts_by_ids_removes_duplicates(self):
+        with patch.object(self.client, "get_account") as mock_get_account:
+            mock_get_account.side_effect = lambda account_id: f"account-{account_id}"
+
+            results = self.client.get_accounts_by_ids(["1", "1", "2"])
+
+        assert {key: result.result for key, result in results.items()} == {
+            "1": "account-1",
+            "2": "account-2",
+        }
+        assert mock_get_account.call_count == 2
+
+    def test_async_get_transactions_for_accounts(self):
+        client = AsyncDeveloperApiClient("dummy-token")
+
+        async def get_transactions(account_id, filters):
+            await asyncio.sleep(0)
+            return self._fetch(account_id)
+
+        with patch.object(client, "get_transactions", get_transactions):
+            results = asyncio.run(
+                client.get_transactions_for_accounts(["1", "bad", "1"])
+            )
+
+        assert list(results) == ["1", "bad"]
+        assert results["1"].result == "transactions-1"
+        assert isinstance(results["bad"].error, ValueError)
+
+    def test_async_fan_out_yields_in_completion_order(self):
+        async def fetch(key):
+            await asyncio.sleep(0.02 if key == "slow" else 0)
+            return key
+
+        async def run():
+            return [
+                result.key async for result in async_fan_out(fetch, ["slow", "fast"])
+            ]
+
+        assert asyncio.run(run()) == ["fast", "slow"]
+
+
+class TestBatchExecutor:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.executor = BatchExecutor(max_workers=2, max_pending=4)
+        yield
+        self.executor.shutdown()
+
+    def test_map_keeps_input_order(self):
+        def call(index):
+            time.sleep(0.01 * (5 - index))
+            return index
+
+        results = list(
+            self.executor.map((index, lambda i=index: call(i)) for index in range(5))
+        )
+
+        assert [result.key for result in results] == list(range(5))
+        assert [result.result for result in results] == list(range(5))
+
+    def test_map_only_takes_calls_as_there_is_room(self):
+        taken = []
+
+        def calls():
+            for index in range(100):
+                taken.append(index)
+                yield index, lambda: None
+
+        results = self.executor.map(calls())
+        next(results)
+
+        assert len(taken) <= self.executor.max_pending + 1
+        assert len(list(results)) == 99
+
+    def test_submit_blocks_when_the_queue_is_full(self):
+        release = threading.Event()
+        for _ in range(4):
+            self.executor.submit(release.wait)
+        submitted = threading.Event()
+        thread = threading.Thread(
+            target=lambda: (self.executor.submit(lambda: None), submitted.set())
+        )
+        thread.start()
+
+        assert not submitted.wait(0.05)
+        release.set()
+        assert submitted.wait(1)
+        thread.join()
+
+    def test_per_call_timeout(self):
+        results = list(
+            self.executor.map(
+                [
+                    ("slow", lambda: time.sleep(0.5)),
+                    ("fast", lambda: "done", None),
+                ],
+                timeout=0.05,
+            )
+        )
+
+        assert isinstance(results[0].error, TimeoutError)
+        assert results[1].result == "done"
+
+    def test_deadline_fails_unfinished_calls(self):
+        started = time.monotonic()
+
+        results = list(
+            self.executor.map(
+                ((index, lambda: time.sleep(0.2)) for index in range(8)),
+                deadline=0.1,
+            )
+        )
+
+        assert time.monotonic() - started < 0.2
+        assert all(isinstance(result.error, TimeoutError) for result in results)
+
+
+class TestClientBatch:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.server = LocalDeveloperApi(seed=0).start()
+        self.accounts = self.server.add_accounts(3)
+        self.client = DeveloperApiClient("token", service_url=self.server.url)
+        yield
+        self.client.close()
+        self.server.stop()
+
+    def test_runs_operations_in_order(self):
+        account_id = self.accounts[0]["accountId"]
+        operations = [
+            Operation("get_account", account_id),
+            Operation("create_transactions", account_id, 2),
+            Operation("get_transactions", account_id=account_id),
+            Operation("get_account", "missing"),
+        ]
+
+        results = self.client.batch(operations, max_workers=1)
+
+        assert [result.key for result in results] == operations
+        assert results[0].result.account_id == account_id
+        assert len(results[1].result) == 2
+        assert results[2].result == results[1].result
+        assert not results[3].ok
+
+    def test_runs_operations_in_parallel(self):
+        self.server.latency = 0.1
+        operations = [
+            Operation("get_account", account["accountId"]) for account in self.accounts
+        ] * 4
+
+        started = time.monotonic()
+        results = self.client.batch(operations, max_workers=12)
+
+        assert time.monotonic() - started < 0.6
+        assert all(result.ok for result in results)
+
+    def test_operation_timeout(self):
+        self.server.latency = 0.3
+
+        started = time.monotonic()
+        (result,) = self.client.batch(
+            [Operation("get_accounts", timeout=0.05)], timeout=5
+        )
+
+        assert time.monotonic() - started < 0.25
+        assert isinstance(result.error, TimeoutError)
+
+    def test_deadline_bounds_the_batch(self):
+        self.server.latency = 1.0
+        operations = [
+            Operation("get_accounts"),
+            Operation("get_account", self.accounts[0]["accountId"]),
+        ]
+
+        started = time.monotonic()
+        results = self.client.batch(operations, deadline=0.2)
+
+        assert time.monotonic() - started < 0.6
+        assert all(isinstance(result.error, TimeoutError) for result in results)
+
+    def test_rejects_private_methods(self):
+        with pytest.raises(ValueError):
+            self.client.batch([Operation("_get", "accounts")])
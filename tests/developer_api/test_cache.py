@@ -0,0 +1,144 @@
+import asyncio
+import json
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from starter_project.developer_api.cache import ResponseCache
+from starter_project.developer_api.clients import (
+    ApiResponseError,
+    AsyncDeveloperApiClient,
+    DeveloperApiClient,
+)
+from starter_project.developer_api.filters import Filter
+from starter_project.developer_api.local_server import LocalDeveloperApi
+from starter_project.developer_api.transport import HttpTransport
+from tests.developer_api import test_clients
+
+
+class TestResponseCache:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.cache = ResponseCache(max_size=2, default_ttl=60)
+        self.client = DeveloperApiClient("dummy-token", cache=ResponseCache())
+
+    def test_key_ignores_filter_order(self):
+        assert ResponseCache.make_key(
+            "url", {"a": ["gt:1", "lt:5"], "b": ["eq:2"]}
+        ) == ResponseCache.make_key("url", {"b": ["eq:2"], "a": ["lt:5", "gt:1"]})
+
+    def test_evicts_least_recently_used(self):
+        self.cache.set("a", 1, "accounts")
+        self.cache.set("b", 2, "accounts")
+        self.cache.get("a")
+        self.cache.set("c", 3, "accounts")
+
+        assert self.cache.get("b") is None
+        assert self.cache.get("a") == 1
+        stats = self.cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (2, 1, 1)
+
+    def test_entries_expire_per_endpoint(self):
+        cache = ResponseCache(ttls={"accounts/{account_id}": 0.01, "accounts": 0})
+        cache.set("a", 1, "accounts/{account_id}")
+        cache.set("b", 2, "accounts")
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.stats().expirations == 1
+
+    @patch("requests.Session.request")
+    def test_client_serves_repeat_reads_from_cache(self, mock_request):
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.content = json.dumps(
+            test_clients.TestClients.EXAMPLE_ACCOUNT_RESPONSE
+        ).encode()
+
+        self.client.get_account("66512652")
+        account = self.client.get_account("66512652")
+        self.client.get_accounts(
+            [Filter("riskScore").ge(20), Filter("creditScore").lt(5)]
+        )
+        self.client.get_accounts(
+            [Filter("creditScore").lt(5), Filter("riskScore").ge(20)]
+        )
+
+        assert account.account_id == "66512652"
+        assert mock_request.call_count == 2
+        assert self.client.cache.stats().hits == 2
+
+    @patch("requests.Session.request")
+    def test_create_transactions_invalidates_account(self, mock_request):
+        get_response = Mock(status_code=200)
+        get_response.content = json.dumps(
+            test_clients.TestClients.EXAMPLE_ACCOUNT_RESPONSE
+        ).encode()
+        post_response = Mock(status_code=201)
+        post_response.content = json.dumps(
+            test_clients.TestClients.EXAMPLE_TRANSACTION_RESPONSE
+        ).encode()
+        mock_request.side_effect = [get_response, post_response, get_response]
+
+        self.client.get_account("66512652")
+        self.client.create_transactions("66512652", 2)
+        self.client.get_account("66512652")
+
+        assert mock_request.call_count == 3
+        assert self.client.cache.stats().invalidations == 1
+
+    def test_shared_cache_keeps_tokens_apart(self):
+        cache = ResponseCache()
+        with LocalDeveloperApi(seed=0) as server:
+            server.add_accounts(1)
+            clients = [
+                DeveloperApiClient(token, service_url=server.url, cache=cache)
+                for token in ("token-a", "token-b", "token-a")
+            ]
+            for client in clients:
+                client.get_accounts()
+                client.close()
+            requests_made = server.stats()["requests"]["accounts"]
+
+        assert requests_made == 2
+        assert cache.stats().hits == 1
+
+    def test_error_responses_are_raised_and_not_cached(self):
+        with LocalDeveloperApi(seed=0) as server:
+            server.add_accounts(2)
+            client = DeveloperApiClient(
+                "token",
+                transport=HttpTransport(max_retries=0),
+                service_url=server.url,
+                cache=ResponseCache(),
+            )
+            server.error_rate = 1.0
+            with pytest.raises(ApiResponseError) as error:
+                client.get_accounts()
+            server.error_rate = 0.0
+
+            assert error.value.status_code == 500
+            assert len(client.get_accounts()) == 2
+            client.close()
+
+    def test_missing_account_raises_not_found(self):
+        with LocalDeveloperApi(seed=0) as server:
+            client = DeveloperApiClient(
+                "token", service_url=server.url, cache=ResponseCache()
+            )
+            with pytest.raises(ApiResponseError) as error:
+                client.get_account("missing")
+            client.close()
+
+            async def get_account():
+                async with AsyncDeveloperApiClient(
+                    "token", service_url=server.url, cache=ResponseCache()
+                ) as async_client:
+                    with pytest.raises(ApiResponseError) as async_error:
+                        await async_client.get_account("missing")
+                return async_error.value
+
+            async_error = asyncio.run(get_account())
+
+        assert error.value.status_code == async_error.status_code == 404
@@ -1,10 +1,16 @@
+import asyncio
 import json
-from unittest.mock import patch, Mock
+from unittest.mock import Mock, patch
 
 import pytest
+from aiohttp import web
 
-from starter_project.developer_api.clients import DeveloperApiClient
+from starter_project.developer_api.clients import (
+    AsyncDeveloperApiClient,
+    DeveloperApiClient,
+)
 from starter_project.developer_api.filters import Filter
+from starter_project.developer_api.transport import HttpTransport
 
 
 class TestClients:
@@ -85,10 +91,13 @@ class TestClients:
     def set_up(self):
         self.client = DeveloperApiClient("dummy-token")
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_account(self, mock_get):
         # Arrange
-        mock_get.return_value.json.return_value = self.EXAMPLE_ACCOUNT_RESPONSE
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.content = json.dumps(
+            self.EXAMPLE_ACCOUNT_RESPONSE
+        ).encode()
 
         # Act
         account = self.client.get_account("66512652")
@@ -97,10 +106,13 @@ class TestClients:
         assert account.account_id == "66512652"
         mock_get.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_accounts_with_filters(self, mock_get):
         # Arrange
-        mock_get.return_value.json.return_value = self.EXAMPLE_ACCOUNT_RESPONSE
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.content = json.dumps(
+            self.EXAMPLE_ACCOUNT_RESPONSE
+        ).encode()
 
         # Act
         account = self.client.get_accounts(filters=[Filter("riskScore").ge(20)])
@@ -109,6 +121,7 @@ class TestClients:
         assert account[0].account_id == "66512652"
         mock_get.assert_called_once()
         mock_get.assert_called_with(
+            "GET",
             "https://sandbox.capitalone.co.uk/developer-services-platform-pr/api/data/accounts",
             headers={
                 "Authorization": "Bearer dummy-token",
@@ -116,14 +129,44 @@ class TestClients:
                 "Version": "1.0",
             },
             params={"riskScore": ["gte:20"]},
+            data=None,
+            timeout=HttpTransport.DEFAULT_TIMEOUT,
+            stream=False,
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.request")
+    def test_contradictory_filters_skip_the_request(self, mock_get):
+        # Act
+        accounts = self.client.get_accounts(
+            filters=[Filter("riskScore").lt(3), Filter("riskScore").gt(10)]
+        )
+
+        # Assert
+        assert accounts == []
+        mock_get.assert_not_called()
+
+    @patch("requests.Session.request")
+    def test_get_transactions(self, mock_get):
+        # Arrange
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.content = json.dumps(
+            self.EXAMPLE_TRANSACTION_RESPONSE
+        ).encode()
+
+        # Act
+        transactions = self.client.get_transactions("72965642")
+
+        # Assert
+        assert len(transactions) == 2
+        assert transactions[0].account_uuid == "72965642"
+        mock_get.assert_called_once()
+
+    @patch("requests.Session.request")
     def test_create_accounts(self, mock_post):
         # Arrange
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = self.EXAMPLE_ACCOUNT_RESPONSE
+        mock_response.content = json.dumps(self.EXAMPLE_ACCOUNT_RESPONSE).encode()
         mock_post.return_value = mock_response
         expected_num_accounts = 1
 
@@ -135,21 +178,25 @@ class TestClients:
         mock_post.assert_called_once()
 
         mock_post.assert_called_with(
+            "POST",
             "https://sandbox.capitalone.co.uk/developer-services-platform-pr/api/data/accounts/create",
             headers={
                 "Authorization": "Bearer dummy-token",
                 "Content-Type": "application/json",
                 "Version": "1.0",
             },
+            params=None,
             data=json.dumps({"quantity": 1, "numTransactions": 0, "liveBalance": True}),
+            timeout=HttpTransport.DEFAULT_TIMEOUT,
+            stream=False,
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.request")
     def test_create_accounts_with_custom_fields(self, mock_post):
         # Arrange
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = self.EXAMPLE_ACCOUNT_RESPONSE
+        mock_response.content = json.dumps(self.EXAMPLE_ACCOUNT_RESPONSE).encode()
         mock_post.return_value = mock_response
         expected_num_accounts = 1
 
@@ -169,12 +216,14 @@ class TestClients:
         mock_post.assert_called_once()
 
         mock_post.assert_called_with(
+            "POST",
             "https://sandbox.capitalone.co.uk/developer-services-platform-pr/api/data/accounts/create",
             headers={
                 "Authorization": "Bearer dummy-token",
                 "Content-Type": "application/json",
                 "Version": "1.0",
             },
+            params=None,
             data=json.dumps(
                 {
                     "quantity": 1,
@@ -188,14 +237,16 @@ class TestClients:
                     "creditLimit": "1000",
                 }
             ),
+            timeout=HttpTransport.DEFAULT_TIMEOUT,
+            stream=False,
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.request")
     def test_create_transactions(self, mock_post):
         # Arrange
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = self.EXAMPLE_TRANSACTION_RESPONSE
+        mock_response.content = json.dumps(self.EXAMPLE_TRANSACTION_RESPONSE).encode()
         mock_post.return_value = mock_response
         expected_num_transactions = 2
 
@@ -208,21 +259,25 @@ class TestClients:
         mock_post.assert_called_once()
 
         mock_post.assert_called_with(
+            "POST",
             "https://sandbox.capitalone.co.uk/developer-services-platform-pr/api/data/transactions/accounts/66512652/create",
             headers={
                 "Authorization": "Bearer dummy-token",
                 "Content-Type": "application/json",
                 "Version": "1.0",
             },
+            params=None,
             data=json.dumps({"quantity": expected_num_transactions}),
+            timeout=HttpTransport.DEFAULT_TIMEOUT,
+            stream=False,
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.request")
     def test_create_transactions_with_custom_fields(self, mock_post):
         # Arrange
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = self.EXAMPLE_TRANSACTION_RESPONSE
+        mock_response.content = json.dumps(self.EXAMPLE_TRANSACTION_RESPONSE).encode()
         mock_post.return_value = mock_response
         expected_num_transactions = 2
 
@@ -239,12 +294,14 @@ class TestClients:
         # Assert
         mock_post.assert_called_once()
         mock_post.assert_called_with(
+            "POST",
             "https://sandbox.capitalone.co.uk/developer-services-platform-pr/api/data/transactions/accounts/66512652/create",
             headers={
                 "Authorization": "Bearer dummy-token",
                 "Content-Type": "application/json",
                 "Version": "1.0",
             },
+            params=None,
             data=json.dumps(
                 {
                     "quantity": expected_num_transactions,
@@ -253,4 +310,99 @@ class TestClients:
                     "credit_debit_indicator": "Debit",
                     "status": "Successful",
                 }
-            ),)
+            ),
+            timeout=HttpTransport.DEFAULT_TIMEOUT,
+            stream=False,
+        )
+
+
+class TestAsyncClients:
+    async def _serve(self, handler_routes):
+        app = web.Application()
+        app.add_routes(handler_routes)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        return runner, f"http://127.0.0.1:{port}"
+
+    def test_get_accounts_with_filters(self):
+        seen_queries = []
+
+        async def accounts(request):
+            seen_queries.append(request.query.getall("riskScore"))
+            return web.json_response(TestClients.EXAMPLE_ACCOUNT_RESPONSE)
+
+        async def run():
+            runner, url = await self._serve([web.get("/accounts", accounts)])
+            try:
+                async with AsyncDeveloperApiClient("dummy-token") as client:
+                    client.SERVICE_URL = url
+                    return await client.get_accounts(
+                        filters=[Filter("riskScore").ge(20), Filter("riskScore").le(80)]
+                    )
+            finally:
+                await runner.cleanup()
+
+        accounts_ = asyncio.run(run())
+
+        assert accounts_[0].account_id == "66512652"
+        assert seen_queries == [["gte:20", "lte:80"]]
+
+    def test_create_transactions(self):
+        async def create(request):
+            assert await request.json() == {"quantity": 2}
+            return web.json_response(
+                TestClients.EXAMPLE_TRANSACTION_RESPONSE, status=201
+            )
+
+        async def run():
+            runner, url = await self._serve(
+                [web.post("/transactions/accounts/{account_id}/create", create)]
+            )
+            try:
+                async with AsyncDeveloperApiClient("dummy-token") as client:
+                    client.SERVICE_URL = url
+                    return await client.create_transactions("72965642", 2)
+            finally:
+                await runner.cleanup()
+
+        transactions = asyncio.run(run())
+
+        assert [t.transaction_uuid for t in transactions] == [
+            "0673bca4-fbb2-46bd-aa76-36243305ceed",
+            "093c805f-31c1-4721-8642-b7e9a09964f0",
+        ]
+
+    def test_concurrency_is_bounded(self):
+        in_flight = 0
+        peak = 0
+
+        async def account(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return web.json_response(TestClients.EXAMPLE_ACCOUNT_RESPONSE)
+
+        async def run():
+            runner, url = await self._serve(
+                [web.get("/accounts/{account_id}", account)]
+            )
+            try:
+                async with AsyncDeveloperApiClient(
+                    "dummy-token", max_concurrency=3
+                ) as client:
+                    client.SERVICE_URL = url
+                    return await asyncio.gather(
+                        *(client.get_account(str(i)) for i in range(12))
+                    )
+            finally:
+                await runner.cleanup()
+
+        accounts_ = asyncio.run(run())
+
+        assert len(accounts_) == 12
+        assert peak == 3
@@ -0,0 +1,191 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from starter_project.developer_api.clients import (
+    AsyncDeveloperApiClient,
+    DeveloperApiClient,
+)
+from starter_project.developer_api.coalescing import AsyncSingleFlight, SingleFlight
+from starter_project.developer_api.local_server import LocalDeveloperApi
+
+
+class TestSingleFlight:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.single_flight = SingleFlight()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def _slow(self, result):
+        self.calls += 1
+        self.release.wait(1)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _run_concurrently(self, num_callers: int, result):
+        outcomes = [None] * num_callers
+
+        def call(index):
+            try:
+                outcomes[index] = self.single_flight.do(
+                    "key", lambda: self._slow(result)
+                )
+            except ValueError as error:
+                outcomes[index] = error
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(num_callers)]
+        for thread in threads:
+            thread.start()
+        while self.single_flight.stats().deduplicated < num_callers - 1:
+            time.sleep(0.001)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        return outcomes
+
+    def test_concurrent_callers_share_one_call(self):
+        outcomes = self._run_concurrently(5, {"Accounts": []})
+
+        assert self.calls == 1
+        assert all(outcome is outcomes[0] for outcome in outcomes)
+        stats = self.single_flight.stats()
+        assert (stats.executed, stats.deduplicated) == (1, 4)
+        assert stats.dedup_rate == 0.8
+
+    def test_concurrent_callers_share_the_error(self):
+        error = ValueError("boom")
+
+        outcomes = self._run_concurrently(3, error)
+
+        assert self.calls == 1
+        assert outcomes == [error] * 3
+
+    def test_later_calls_run_again(self):
+        self.release.set()
+        self.single_flight.do("key", lambda: self._slow(1))
+        self.single_flight.do("key", lambda: self._slow(2))
+
+        assert self.calls == 2
+
+
+class TestAsyncSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def main():
+            return await asyncio.gather(
+                *(single_flight.do("key", fetch) for _ in range(5))
+            )
+
+        assert asyncio.run(main()) == ["result"] * 5
+        assert len(calls) == 1
+        assert single_flight.stats().deduplicated == 4
+
+    def test_cancelling_one_caller_does_not_cancel_the_others(self):
+        single_flight = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "result"
+
+        async def main():
+            first = asyncio.ensure_future(single_flight.do("key", fetch))
+            second = asyncio.ensure_future(single_flight.do("key", fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(main()) == "result"
+
+
+class TestCoalescingClients:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.server = LocalDeveloperApi(latency=0.1, seed=0).start()
+        (self.account,) = self.server.add_accounts(1)
+        yield
+        self.server.stop()
+
+    def test_threads_share_identical_requests(self):
+        single_flight = SingleFlight()
+        client = DeveloperApiClient(
+            "token", service_url=self.server.url, single_flight=single_flight
+        )
+        barrier = threading.Barrier(8)
+        results = []
+
+        def get_account():
+            barrier.wait()
+            results.append(client.get_account(self.account["accountId"]))
+
+        threads = [threading.Thread(target=get_account) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.close()
+
+        assert len(results) == 8
+        assert all(result == results[0] for result in results)
+        assert results[0] is not results[1]
+        assert self.server.stats()["requests"]["accounts/{account_id}"] == 1
+        assert single_flight.stats().deduplicated == 7
+
+    def test_clients_with_different_tokens_do_not_share(self):
+        single_flight = SingleFlight()
+        clients = [
+            DeveloperApiClient(
+                token, service_url=self.server.url, single_flight=single_flight
+            )
+            for token in ("token-a", "token-b")
+        ]
+        barrier = threading.Barrier(2)
+
+        def get_accounts(client):
+            barrier.wait()
+            client.get_accounts()
+
+        threads = [
+            threading.Thread(target=get_accounts, args=(client,)) for client in clients
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for client in clients:
+            client.close()
+
+        assert self.server.stats()["requests"]["accounts"] == 2
+        assert single_flight.stats().deduplicated == 0
+
+    def test_coroutines_share_identical_requests(self):
+        single_flight = AsyncSingleFlight()
+
+        async def main():
+            async with AsyncDeveloperApiClient(
+                "token", service_url=self.server.url, single_flight=single_flight
+            ) as client:
+                return await asyncio.gather(
+                    *(client.get_account(self.account["accountId"]) for _ in range(8)),
+                    client.get_accounts(),
+                )
+
+        *accounts, listed = asyncio.run(main())
+
+        assert len(accounts) == 8
+        assert listed == [accounts[0]]
+        assert self.server.stats()["requests"] == {
+            "accounts/{account_id}": 1,
+            "accounts": 1,
+        }
+        assert single_flight.stats().deduplicated == 7
@@ -1,6 +1,11 @@
 import pytest
 
-from starter_project.developer_api.filters import Filter, Relation
+from starter_project.developer_api.filters import (
+    ContradictoryFiltersError,
+    Filter,
+    Relation,
+    reduce_filters,
+)
 
 
 class TestFilters:
@@ -40,3 +45,72 @@ class TestFilters:
         assert less_than_or_equal_filter.key == self.TEST_KEY
         assert less_than_or_equal_filter.relation == Relation.LE
         assert less_than_or_equal_filter.value == self.TEST_VALUE
+
+
+class TestReduceFilters:
+    @staticmethod
+    def _as_tuples(filters):
+        return [(f.key, f.relation, f.value) for f in filters]
+
+    def test_merges_overlapping_lower_bounds(self):
+        reduced = reduce_filters([Filter("a").gt(5), Filter("a").gt(10)])
+
+        assert self._as_tuples(reduced) == [("a", Relation.GT, 10)]
+
+    def test_exclusive_bound_wins_at_same_value(self):
+        reduced = reduce_filters([Filter("a").le(7), Filter("a").lt(7)])
+
+        assert self._as_tuples(reduced) == [("a", Relation.LT, 7)]
+
+    def test_closed_range_on_one_value_becomes_equals(self):
+        reduced = reduce_filters([Filter("a").ge(3), Filter("a").le(3)])
+
+        assert self._as_tuples(reduced) == [("a", Relation.EQ, 3)]
+
+    def test_drops_duplicates_and_keeps_other_keys(self):
+        reduced = reduce_filters(
+            [
+                Filter("currency").eq("GBP"),
+                Filter("amount").ge(1),
+                Filter("currency").eq("GBP"),
+                Filter("amount").lt(100),
+            ]
+        )
+
+        assert self._as_tuples(reduced) == [
+            ("currency", Relation.EQ, "GBP"),
+            ("amount", Relation.GE, 1),
+            ("amount", Relation.LT, 100),
+        ]
+
+    def test_equals_inside_range_replaces_range(self):
+        reduced = reduce_filters(
+            [Filter("a").gt(1), Filter("a").eq("5"), Filter("a").lt(10)]
+        )
+
+        assert self._as_tuples(reduced) == [("a", Relation.EQ, "5")]
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            [Filter("a").lt(3), Filter("a").gt(10)],
+            [Filter("a").gt(3), Filter("a").lt(3)],
+            [Filter("a").eq("GBP"), Filter("a").eq("USD")],
+            [Filter("a").eq(2), Filter("a").gt(2)],
+        ],
+    )
+    def test_detects_contradictions(self, filters):
+        with pytest.raises(ContradictoryFiltersError):
+            reduce_filters(filters)
+
+    def test_compares_timestamps_as_text(self):
+        reduced = reduce_filters(
+            [
+                Filter("timestamp").gt("2019-05-20 10:51:33"),
+                Filter("timestamp").gt("2019-07-09 11:47:47"),
+            ]
+        )
+
+        assert self._as_tuples(reduced) == [
+            ("timestamp", Relation.GT, "2019-07-09 11:47:47")
+        ]
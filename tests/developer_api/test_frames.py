@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from starter_project.developer_api.filters import Filter
+from starter_project.developer_api.frames import TransactionFrame
+from starter_project.developer_api.models import Transaction
+from tests.developer_api import test_clients
+
+
+class TestTransactionFrame:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.raw = test_clients.TestClients.EXAMPLE_TRANSACTION_RESPONSE["Transactions"]
+        self.frame = TransactionFrame.from_dicts(self.raw)
+
+    def test_from_transactions_matches_from_dicts(self):
+        frame = TransactionFrame.from_transactions(
+            [Transaction.deserialize(transaction) for transaction in self.raw]
+        )
+
+        for column in ("amount", "latitude", "longitude", "timestamp"):
+            assert np.array_equal(frame[column], self.frame[column])
+        for column in (
+            "account_uuid",
+            "currency",
+            "status",
+            "credit_debit_indicator",
+            "merchant_category",
+        ):
+            assert frame[column].decode() == self.frame[column].decode()
+            assert frame.group_count(column) == self.frame.group_count(column)
+        indicator = [Filter("creditDebitIndicator").eq("Debit")]
+        assert frame.mask(indicator).tolist() == [True, False]
+        assert self.frame.mask(indicator).tolist() == [True, False]
+
+    def test_parses_timestamps_to_epoch_seconds(self):
+        assert self.frame["timestamp"].tolist() == [1558349493, 1562672867]
+
+    def test_group_sum_and_count(self):
+        assert self.frame.group_sum("merchant_category") == {
+            "Bills & Utilities": 843.92,
+            "Food & Dining": 517.06,
+        }
+        assert self.frame.group_sum("currency") == {"GBP": pytest.approx(1360.98)}
+        assert self.frame.group_count("credit_debit_indicator") == {
+            "Debit": 1,
+            "Credit": 1,
+        }
+
+    def test_filter_with_filter_dsl(self):
+        filtered = self.frame.filter(
+            [
+                Filter("amount").gt(600),
+                Filter("timestamp").lt("2019-06-01 00:00:00"),
+                Filter("currency").eq("GBP"),
+            ]
+        )
+
+        assert filtered.transaction_uuids.tolist() == [
+            "0673bca4-fbb2-46bd-aa76-36243305ceed"
+        ]
+        assert filtered.sum() == 843.92
+
+    def test_filter_on_missing_category_is_empty(self):
+        assert len(self.frame.filter(self.frame["currency"].equals("USD"))) == 0
+
+    def test_empty_frame(self):
+        frame = TransactionFrame.from_dicts([])
+
+        assert len(frame) == 0
+        assert frame.group_sum("currency") == {}
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from starter_project.developer_api.frames import TransactionFrame
+from starter_project.developer_api.geoindex import GeoIndex, haversine_km
+from starter_project.developer_api.models import Transaction
+from tests.developer_api import test_clients
+
+
+class TestGeoIndex:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        rng = np.random.default_rng(0)
+        self.latitudes = rng.uniform(50, 58, 5000)
+        self.longitudes = rng.uniform(-6, 2, 5000)
+        self.index = GeoIndex(self.latitudes, self.longitudes)
+
+    def _brute_force(self, latitude, longitude):
+        return haversine_km(latitude, longitude, self.latitudes, self.longitudes)
+
+    def test_haversine(self):
+        # London to Paris
+        distance = haversine_km(51.5074, -0.1278, np.array([48.8566]), [2.3522])
+        assert distance[0] == pytest.approx(343.5, abs=0.5)
+
+    def test_within_matches_a_brute_force_scan(self):
+        for latitude, longitude, radius in ((54, -2, 25), (51.5, -0.1, 80), (0, 0, 10)):
+            distances = self._brute_force(latitude, longitude)
+            expected = set(np.flatnonzero(distances <= radius).tolist())
+
+            found = self.index.within(latitude, longitude, radius, with_distance=True)
+
+            assert {position for position, _ in found} == expected
+            assert [d for _, d in found] == sorted(d for _, d in found)
+
+    def test_nearest_matches_a_brute_force_scan(self):
+        distances = self._brute_force(55.3, -1.7)
+
+        nearest = self.index.nearest(55.3, -1.7, 10)
+
+        assert nearest == np.argsort(distances)[:10].tolist()
+        assert len(self.index.nearest(0, 0, 3)) == 3
+        assert len(self.index.nearest(0, 0, 10_000)) == 5000
+
+    def test_crosses_the_antimeridian_and_poles(self):
+        index = GeoIndex([0, 0, 89.9, 89.9], [179.95, -179.95, 0, 180], items="abcd")
+
+        assert sorted(index.within(0, 180, 10)) == ["a", "b"]
+        assert sorted(index.within(90, 0, 20)) == ["c", "d"]
+        assert index.nearest(0, -179.9, 1) == ["b"]
+
+    def test_from_transactions_and_frame(self):
+        raw = test_clients.TestClients.EXAMPLE_TRANSACTION_RESPONSE["Transactions"]
+        transactions = [Transaction.deserialize(transaction) for transaction in raw]
+        first = transactions[0]
+
+        by_object = GeoIndex.from_transactions(transactions)
+        by_frame = GeoIndex.from_frame(TransactionFrame.from_dicts(raw))
+
+        assert by_object.nearest(first.latitude, first.longitude, 1) == [first]
+        assert by_frame.within(first.latitude, first.longitude, 0.1) == [
+            first.transaction_uuid
+        ]
+
+    def test_rejects_mismatched_lengths(self):
+        with pytest.raises(ValueError):
+            GeoIndex([1, 2], [1])
+        with pytest.raises(ValueError):
+            GeoIndex([1, 2], [1, 2], items=["a"])
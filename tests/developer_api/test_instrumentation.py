@@ -0,0 +1,144 @@
+import threading
+import time
+
+import pytest
+
+from starter_project.developer_api.clients import DeveloperApiClient
+from starter_project.developer_api.coalescing import SingleFlight
+from starter_project.developer_api.instrumentation import (
+    Instrumentation,
+    LatencyHistogram,
+    RequestEvent,
+)
+from starter_project.developer_api.local_server import LocalDeveloperApi
+from starter_project.developer_api.transport import HttpTransport
+
+
+class TestLatencyHistogram:
+    def test_percentiles_are_within_bucket_growth(self):
+        histogram = LatencyHistogram()
+        for millisecond in range(1, 1001):
+            histogram.record(millisecond / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.05)
+        assert histogram.percentile(95) == pytest.approx(0.95, rel=0.05)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.05)
+        assert histogram.percentile(100) == 1.0
+        assert histogram.mean == pytest.approx(0.5005)
+
+    def test_empty_histogram(self):
+        assert LatencyHistogram().percentile(99) == 0.0
+        assert LatencyHistogram().summary()["count"] == 0
+
+
+class TestInstrumentation:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.events = []
+        self.instrumentation = Instrumentation(hooks=[self.events.append])
+        self.server = LocalDeveloperApi(seed=0).start()
+        self.client = DeveloperApiClient(
+            "token",
+            transport=HttpTransport(max_retries=0),
+            service_url=self.server.url,
+            instrumentation=self.instrumentation,
+        )
+        yield
+        self.client.close()
+        self.server.stop()
+
+    def test_records_an_event_per_request(self):
+        (account,) = self.client.create_accounts(1)
+        self.client.get_account(account.account_id)
+        self.client.get_transactions(account.account_id)
+
+        assert [(event.method, event.endpoint) for event in self.events] == [
+            ("POST", "accounts/create"),
+            ("GET", "accounts/{account_id}"),
+            ("GET", "transactions/accounts/{account_id}/transactions"),
+        ]
+        create, get, _ = self.events
+        assert create.status_code == 200
+        assert create.bytes_sent > 0
+        assert get.bytes_sent == 0
+        assert get.bytes_received > 0
+        assert get.network_time > 0
+        assert get.model_time > 0
+        assert get.total_time == pytest.approx(
+            get.network_time + get.decode_time + get.model_time
+        )
+
+    def test_keeps_histograms_per_endpoint(self):
+        self.server.add_accounts(2)
+        for account_id in ("10000000", "10000001", "10000000"):
+            self.client.get_account(account_id)
+
+        stats = self.instrumentation.stats()
+        assert stats["accounts/{account_id}"]["requests"] == 3
+        assert stats["accounts/{account_id}"]["status_codes"] == {200: 3}
+        assert stats["accounts/{account_id}"]["latency"]["total"]["count"] == 3
+        percentiles = self.instrumentation.percentiles("accounts/{account_id}")
+        assert 0 < percentiles["p50"] <= percentiles["p95"] <= percentiles["p99"]
+
+    def test_unknown_endpoints_have_no_percentiles(self):
+        assert self.instrumentation.percentiles("accounts") == {
+            "p50": 0.0,
+            "p95": 0.0,
+            "p99": 0.0,
+        }
+        assert self.instrumentation.stats() == {}
+
+    def test_coalesced_requests_are_recorded_once_with_model_time(self):
+        (account,) = self.server.add_accounts(1)
+        self.server.latency = 0.1
+        client = DeveloperApiClient(
+            "token",
+            service_url=self.server.url,
+            instrumentation=self.instrumentation,
+            single_flight=SingleFlight(),
+        )
+        deserialize = client._deserialize_account
+
+        def slow_deserialize(response):
+            time.sleep(0.05)
+            return deserialize(response)
+
+        client._deserialize_account = slow_deserialize
+        barrier = threading.Barrier(4)
+
+        def get_account():
+            barrier.wait()
+            client.get_account(account["accountId"])
+
+        threads = [threading.Thread(target=get_account) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.close()
+
+        (event,) = self.events
+        assert event.endpoint == "accounts/{account_id}"
+        assert event.model_time >= 0.05
+
+    def test_records_failed_requests(self):
+        self.server.error_rate = 1.0
+
+        with pytest.raises(ValueError):
+            self.client.create_accounts(1)
+
+        (event,) = self.events
+        assert event.status_code == 500
+        assert event.model_time == 0
+
+    def test_hooks_can_be_added_later(self):
+        late_events = []
+        self.instrumentation.add_hook(late_events.append)
+
+        self.instrumentation.record(RequestEvent("GET", "accounts", 200))
+
+        assert late_events == self.events
+        assert self.instrumentation.stats()["accounts"]["requests"] == 1
+        self.instrumentation.reset()
+        assert self.instrumentation.stats() == {}
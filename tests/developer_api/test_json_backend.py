@@ -0,0 +1,62 @@
+import gc
+import importlib
+import json
+import sys
+
+import pytest
+
+from starter_project.developer_api import json_backend
+from starter_project.developer_api.synthetic import make_transactions
+
+
+class TestJsonBackend:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.payload = json.dumps({"Transactions": make_transactions(1000)})
+        yield
+        gc.enable()
+
+    def test_decodes_bytes_and_text(self):
+        expected = json.loads(self.payload)
+
+        assert json_backend.loads(self.payload.encode()) == expected
+        assert json_backend.loads(self.payload) == expected
+        assert json_backend.BACKEND in ("orjson", "json")
+
+    def test_falls_back_to_the_standard_library(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        try:
+            stdlib_backend = importlib.reload(json_backend)
+
+            assert stdlib_backend.BACKEND == "json"
+            assert stdlib_backend.loads(self.payload.encode()) == json.loads(
+                self.payload
+            )
+            with pytest.raises(ValueError):
+                stdlib_backend.loads(self.payload[:-1])
+        finally:
+            monkeypatch.undo()
+            importlib.reload(json_backend)
+
+    def test_leaves_the_garbage_collector_alone(self):
+        gc.disable()
+        json_backend.loads(self.payload)
+        assert not gc.isenabled()
+
+        gc.enable()
+        json_backend.loads(self.payload)
+        assert gc.isenabled()
+
+    def test_pause_restores_the_garbage_collector_after_errors(self):
+        with pytest.raises(ValueError), json_backend.PausedGc():
+            assert not gc.isenabled()
+            json_backend.loads(self.payload[:-1])
+
+        assert gc.isenabled()
+
+    def test_pauses_nest(self):
+        with json_backend.PausedGc():
+            with json_backend.PausedGc():
+                assert not gc.isenabled()
+            assert not gc.isenabled()
+        assert gc.isenabled()
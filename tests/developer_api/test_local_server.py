@@ -0,0 +1,94 @@
+import pytest
+import requests
+
+from starter_project.developer_api.clients import DeveloperApiClient
+from starter_project.developer_api.filters import Filter
+from starter_project.developer_api.local_server import LocalDeveloperApi
+from starter_project.developer_api.transport import HttpTransport
+
+
+class TestLocalDeveloperApi:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.server = LocalDeveloperApi(seed=0).start()
+        self.client = DeveloperApiClient(
+            "token",
+            transport=HttpTransport(max_retries=0),
+            service_url=self.server.url,
+        )
+        yield
+        self.client.close()
+        self.server.stop()
+
+    def test_creates_and_gets_accounts(self):
+        created = self.client.create_accounts(2, num_transactions=3, risk_score=42)
+
+        assert len(created) == 2
+        assert all(account.risk_score == 42 for account in created)
+        assert self.client.get_accounts() == created
+        assert self.client.get_account(created[1].account_id) == created[1]
+        assert len(self.client.get_transactions(created[0].account_id)) == 3
+
+    def test_filters_accounts(self):
+        self.server.add_accounts(10)
+
+        matches = self.client.get_accounts(
+            [Filter("riskScore").ge(20), Filter("riskScore").lt(60)]
+        )
+
+        assert matches
+        assert all(20 <= account.risk_score < 60 for account in matches)
+        assert len(matches) < 10
+
+    def test_creates_gets_and_filters_transactions(self):
+        (account,) = self.server.add_accounts(1)
+        created = self.client.create_transactions(account["accountId"], 5, amount=12.5)
+
+        assert [t.amount for t in created] == [12.5] * 5
+        transaction = self.client.get_transaction(
+            account["accountId"], created[2].transaction_uuid
+        )
+        assert transaction == created[2]
+        assert (
+            self.client.get_transactions(
+                account["accountId"], [Filter("amount").gt(100)]
+            )
+            == []
+        )
+
+    def test_rejects_too_many_transactions(self):
+        (account,) = self.server.add_accounts(1)
+
+        with pytest.raises(ValueError):
+            self.client.create_transactions(account["accountId"], 26)
+
+    def test_unknown_account_is_not_found(self):
+        response = requests.get(f"{self.server.url}/accounts/missing")
+
+        assert response.status_code == 404
+
+    def test_injects_throttling_with_retry_after(self):
+        self.server.throttle_rate = 1.0
+        self.server.retry_after = 2
+
+        response = requests.get(f"{self.server.url}/accounts")
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2"
+        assert self.server.stats()["requests"] == {"429": 1}
+
+    def test_injects_server_errors(self):
+        self.server.error_rate = 1.0
+
+        response = requests.get(f"{self.server.url}/accounts")
+
+        assert response.status_code == 500
+
+    def test_reuses_connections(self):
+        self.server.add_accounts(1)
+        for _ in range(5):
+            self.client.get_accounts()
+
+        stats = self.server.stats()
+        assert stats["connections"] == 1
+        assert stats["requests"] == {"accounts": 5}
@@ -0,0 +1,67 @@
+import pytest
+
+from starter_project.developer_api.filters import Filter
+from starter_project.developer_api.models import Account, ProductType, Transaction
+from starter_project.developer_api.predicates import compile_filters
+from tests.developer_api import test_clients
+
+
+class TestPredicates:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.account = Account.deserialize(
+            test_clients.TestClients.EXAMPLE_ACCOUNT_RESPONSE["Accounts"][0]
+        )
+        self.transactions = [
+            Transaction.deserialize(transaction)
+            for transaction in test_clients.TestClients.EXAMPLE_TRANSACTION_RESPONSE[
+                "Transactions"
+            ]
+        ]
+
+    def test_numeric_fields_compare_as_numbers(self):
+        # "9" < "22" as numbers but not as text
+        predicate = compile_filters(
+            [Filter("riskScore").gt("9"), Filter("balance").le(1000)], Account
+        )
+
+        assert predicate(self.account)
+
+    def test_text_fields_compare_as_text(self):
+        predicate = compile_filters([Filter("currencyCode").eq("GBP")], Account)
+
+        assert predicate(self.account)
+        assert not compile_filters([Filter("state").eq("closed")], Account)(
+            self.account
+        )
+
+    def test_enum_fields_match_the_api_values(self):
+        assert self.account.product_type is ProductType.CREDIT
+        assert compile_filters([Filter("productType").eq("Credit")], Account)(
+            self.account
+        )
+        assert compile_filters(
+            [Filter("creditDebitIndicator").eq("Debit")], Transaction
+        ).mask(self.transactions) == [True, False]
+        assert compile_filters([Filter("status").eq("Successful")], Transaction).mask(
+            self.transactions
+        ) == [True, True]
+
+    def test_mask_and_select_transactions(self):
+        compiled = compile_filters(
+            [Filter("amount").gt(600), Filter("currency").eq("GBP")], Transaction
+        )
+
+        assert compiled.mask(self.transactions) == [True, False]
+        assert compiled.select(self.transactions) == self.transactions[:1]
+
+    def test_contradictory_filters_never_match(self):
+        compiled = compile_filters(
+            [Filter("amount").lt(3), Filter("amount").gt(10)], Transaction
+        )
+
+        assert compiled.mask(self.transactions) == [False, False]
+
+    def test_unknown_field_raises(self):
+        with pytest.raises(ValueError):
+            compile_filters([Filter("colour").eq("red")], Account)
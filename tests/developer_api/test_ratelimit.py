@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from starter_project.developer_api.clients import (
+    ApiResponseError,
+    AsyncDeveloperApiClient,
+    DeveloperApiClient,
+)
+from starter_project.developer_api.local_server import LocalDeveloperApi
+from starter_project.developer_api.ratelimit import (
+    AdaptiveRateController,
+    TokenBucket,
+    parse_retry_after,
+)
+from starter_project.developer_api.transport import HttpTransport
+
+
+class TestTokenBucket:
+    def test_allows_burst_then_waits(self):
+        bucket = TokenBucket(rate=10, burst=2)
+
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == pytest.approx(0.1, abs=0.02)
+
+    def test_acquire_blocks_until_refilled(self):
+        bucket = TokenBucket(rate=50, burst=1)
+        bucket.acquire()
+
+        started = time.monotonic()
+        bucket.acquire()
+
+        assert time.monotonic() - started >= 0.015
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestParseRetryAfter:
+    def test_parses_seconds(self):
+        assert parse_retry_after("3") == 3.0
+
+    def test_parses_http_dates(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        assert parse_retry_after(format_datetime(retry_at)) == pytest.approx(30, abs=2)
+
+    def test_caps_and_ignores_bad_values(self):
+        assert parse_retry_after("3600") == 60.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestAdaptiveRateController:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.controller = AdaptiveRateController(
+            initial_limit=4, min_limit=1, max_limit=8, cooldown=0
+        )
+
+    def test_increases_additively_while_healthy(self):
+        for _ in range(4):
+            self.controller.acquire()
+            self.controller.release(200)
+
+        assert 4.9 < self.controller.limit < 5
+
+    def test_decreases_multiplicatively_on_throttling(self):
+        self.controller.acquire()
+        self.controller.release(429)
+        self.controller.acquire()
+        self.controller.release(503)
+        self.controller.acquire()
+        self.controller.release()
+
+        assert self.controller.limit == 1
+        assert self.controller.stats().throttled == 3
+
+    def test_decreases_once_per_cooldown(self):
+        self.controller.cooldown = 60
+        for _ in range(3):
+            self.controller.acquire()
+            self.controller.release(500)
+
+        assert self.controller.limit == 2
+        assert self.controller.stats().decreases == 1
+
+    def test_blocks_at_the_limit_until_a_release(self):
+        for _ in range(4):
+            self.controller.acquire()
+        acquired = threading.Event()
+        thread = threading.Thread(
+            target=lambda: (self.controller.acquire(), acquired.set())
+        )
+        thread.start()
+
+        assert not acquired.wait(0.05)
+        self.controller.release(200)
+        assert acquired.wait(1)
+        thread.join()
+
+    def test_pauses_for_retry_after(self):
+        self.controller.acquire()
+        self.controller.release(429, retry_after=0.05)
+
+        started = time.monotonic()
+        self.controller.acquire()
+
+        assert time.monotonic() - started >= 0.04
+
+    def test_wakes_async_waiters_from_other_threads(self):
+        for _ in range(4):
+            self.controller.acquire()
+
+        async def wait_for_slot():
+            threading.Timer(0.05, self.controller.release, (200,)).start()
+            await asyncio.wait_for(self.controller.acquire_async(), 1)
+
+        asyncio.run(wait_for_slot())
+        assert self.controller.stats().in_flight == 4
+
+    def test_shared_by_sync_and_async_clients(self):
+        with LocalDeveloperApi(seed=0, throttle_rate=1.0, retry_after=0) as server:
+            client = DeveloperApiClient(
+                "token",
+                transport=HttpTransport(max_retries=0, rate_controller=self.controller),
+                service_url=server.url,
+            )
+            with pytest.raises(ApiResponseError):
+                client.get_accounts()
+            client.close()
+
+            async def get_accounts():
+                async with AsyncDeveloperApiClient(
+                    "token", service_url=server.url, rate_controller=self.controller
+                ) as async_client:
+                    with pytest.raises(ApiResponseError):
+                        await async_client.get_accounts()
+
+            asyncio.run(get_accounts())
+
+        stats = self.controller.stats()
+        assert (stats.throttled, stats.in_flight, stats.limit) == (2, 0, 1)
+
+    def test_cancelled_requests_do_not_back_off(self):
+        with LocalDeveloperApi(seed=0, latency=1.0) as server:
+
+            async def cancel_get_accounts():
+                async with AsyncDeveloperApiClient(
+                    "token", service_url=server.url, rate_controller=self.controller
+                ) as client:
+                    task = asyncio.ensure_future(client.get_accounts())
+                    await asyncio.sleep(0.1)
+                    task.cancel()
+                    with pytest.raises(asyncio.CancelledError):
+                        await task
+
+            asyncio.run(cancel_get_accounts())
+
+        stats = self.controller.stats()
+        assert (stats.throttled, stats.in_flight, stats.limit) == (0, 0, 4)
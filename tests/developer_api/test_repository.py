@@ -0,0 +1,98 @@
+import dataclasses
+
+import pytest
+
+from starter_project.developer_api.filters import Filter
+from starter_project.developer_api.models import Account
+from starter_project.developer_api.predicates import compile_filters
+from starter_project.developer_api.repository import AccountRepository
+from starter_project.developer_api.store import LocalStore
+from starter_project.developer_api.synthetic import make_accounts
+
+
+class TestAccountRepository:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.accounts = [Account.deserialize(raw) for raw in make_accounts(500)]
+        self.repository = AccountRepository(self.accounts)
+
+    def _assert_matches_a_scan(self, filters):
+        expected = compile_filters(filters, Account).select(self.repository)
+
+        assert self.repository.query(filters) == sorted(
+            expected, key=lambda account: account.account_id
+        )
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            [Filter("state").eq("open")],
+            [Filter("productType").eq("Debit"), Filter("currencyCode").eq("GBP")],
+            [Filter("creditScore").ge(600), Filter("creditScore").lt(700)],
+            [Filter("riskScore").gt("9"), Filter("state").eq("flagged")],
+            [Filter("balance").le(100)],
+            [Filter("riskScore").eq(50), Filter("balance").gt(5000)],
+            [Filter("creditLimit").eq(1000), Filter("state").eq("closed")],
+            [Filter("firstname").eq("Blondell")],
+            [],
+        ],
+    )
+    def test_query_matches_a_scan(self, filters):
+        self._assert_matches_a_scan(filters)
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            [Filter("productType").eq("Credit")],
+            [Filter("productType").eq("credit")],
+            [Filter("state").eq("open"), Filter("currencyCode").eq("GBP")],
+        ],
+    )
+    def test_query_matches_the_local_store(self, filters):
+        with LocalStore() as store:
+            store.upsert_accounts(self.accounts)
+            expected = store.query_accounts(filters)
+
+        assert [account.account_id for account in self.repository.query(filters)] == (
+            sorted(account.account_id for account in expected)
+        )
+
+    def test_contradictory_and_empty_queries(self):
+        assert self.repository.query([Filter("riskScore").gt(200)]) == []
+        assert self.repository.query([Filter("state").eq("unknown")]) == []
+        assert (
+            self.repository.query(
+                [Filter("state").eq("open"), Filter("state").eq("closed")]
+            )
+            == []
+        )
+        with pytest.raises(ValueError):
+            self.repository.query([Filter("unknown").eq(1)])
+
+    def test_upsert_reindexes_a_refreshed_account(self):
+        account = self.accounts[0]
+        refreshed = dataclasses.replace(account, risk_score=1000, balance=None)
+
+        assert self.repository.upsert(refreshed) == 1
+        assert len(self.repository) == 500
+        assert self.repository.get(account.account_id) is refreshed
+        assert self.repository.query([Filter("riskScore").ge(1000)]) == [refreshed]
+        assert refreshed not in self.repository.query([Filter("balance").ge(0)])
+        self._assert_matches_a_scan([Filter("riskScore").le(50)])
+
+    def test_remove(self):
+        account = self.accounts[0]
+
+        assert self.repository.remove(account.account_id) is account
+        assert self.repository.remove(account.account_id) is None
+        assert account.account_id not in self.repository
+        assert self.repository.count([]) == 499
+        self._assert_matches_a_scan([Filter("state").eq(account.state.value)])
+
+    def test_upsert_keeps_the_last_of_a_repeated_account(self):
+        account = self.accounts[0]
+        first = dataclasses.replace(account, credit_score=1)
+        last = dataclasses.replace(account, credit_score=2)
+
+        assert self.repository.upsert([first, last]) == 1
+        assert self.repository.query([Filter("creditScore").lt(3)]) == [last]
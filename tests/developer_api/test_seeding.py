@@ -0,0 +1,143 @@
+import itertools
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from starter_project.developer_api.clients import ApiResponseError, DeveloperApiClient
+from starter_project.developer_api.local_server import LocalDeveloperApi
+from starter_project.developer_api.seeding import Seeder, SeedManifest
+from starter_project.developer_api.transport import HttpTransport
+
+
+class TestSeeding:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        ids = itertools.count()
+        self.client = Mock()
+        self.client.create_accounts.side_effect = lambda quantity: [
+            SimpleNamespace(account_id=f"account-{next(ids)}") for _ in range(quantity)
+        ]
+        self.client.create_transactions.side_effect = lambda account_id, quantity: [
+            SimpleNamespace(transaction_uuid=f"transaction-{next(ids)}")
+            for _ in range(quantity)
+        ]
+        self.progress = []
+        self.seeder = Seeder(
+            self.client,
+            max_workers=4,
+            requests_per_second=1000,
+            retry_delay=0,
+            on_progress=self.progress.append,
+        )
+
+    def test_splits_totals_into_api_sized_batches(self):
+        result = self.seeder.seed(30, transactions_per_account=30)
+
+        assert result.complete
+        assert len(result.manifest.account_ids) == 30
+        assert result.manifest.num_transactions == 900
+        account_quantities = sorted(
+            call.args[0] for call in self.client.create_accounts.call_args_list
+        )
+        assert account_quantities == [5, 25]
+        assert (
+            max(call.args[1] for call in self.client.create_transactions.call_args_list)
+            == Seeder.MAX_TRANSACTIONS_PER_REQUEST
+        )
+        assert self.progress[-1].transactions_created == 900
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ApiResponseError("POST", "accounts/create", 429),
+            ApiResponseError("POST", "accounts/create", 503, retry_after=0),
+            requests.ConnectionError(
+                MaxRetryError(None, "/", NewConnectionError(None, "refused"))
+            ),
+        ],
+    )
+    def test_retries_batches_the_api_never_acted_on(self, error):
+        created = self.client.create_accounts.side_effect(2)
+        self.client.create_accounts.side_effect = [error, created]
+
+        result = self.seeder.seed(2)
+
+        assert result.complete
+        assert len(result.manifest.account_ids) == 2
+        assert self.client.create_accounts.call_count == 2
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ApiResponseError("POST", "accounts/create", 500),
+            ApiResponseError("POST", "accounts/create", 503),
+            requests.ConnectionError("Connection aborted"),
+            requests.ReadTimeout(),
+        ],
+    )
+    def test_does_not_retry_batches_that_may_have_been_created(self, error):
+        self.client.create_accounts.side_effect = error
+
+        result = self.seeder.seed(2)
+
+        assert not result.complete
+        assert result.errors == [error]
+        assert self.client.create_accounts.call_count == 1
+
+    def test_resumes_from_manifest(self, tmp_path):
+        manifest = SeedManifest(
+            account_ids=["existing"], transaction_ids={"existing": ["t1", "t2"]}
+        )
+        manifest.save(tmp_path / "manifest.json")
+
+        result = self.seeder.seed(
+            2,
+            transactions_per_account=3,
+            manifest=SeedManifest.load(tmp_path / "manifest.json"),
+        )
+
+        self.client.create_accounts.assert_called_once_with(1)
+        assert len(result.manifest.transaction_ids["existing"]) == 3
+        assert result.manifest.num_transactions == 6
+
+    def test_reports_batches_that_keep_failing(self):
+        self.client.create_transactions.side_effect = ApiResponseError(
+            "POST", "transactions/accounts/account-0/create", 429
+        )
+        seeder = Seeder(
+            self.client, requests_per_second=1000, max_retries=1, retry_delay=0
+        )
+
+        result = seeder.seed(1, transactions_per_account=5)
+
+        assert not result.complete
+        assert len(result.errors) == 1
+        assert result.manifest.transaction_ids == {}
+
+    def test_rejects_clients_that_retry_themselves(self):
+        client = DeveloperApiClient("token")
+
+        with pytest.raises(ValueError):
+            Seeder(client)
+        client.close()
+
+    def test_throttled_batches_are_only_retried_by_the_seeder(self):
+        with LocalDeveloperApi(seed=0, throttle_rate=1.0, retry_after=0) as server:
+            client = DeveloperApiClient(
+                "token",
+                transport=HttpTransport(max_retries=0),
+                service_url=server.url,
+            )
+            seeder = Seeder(
+                client, requests_per_second=1000, max_retries=2, retry_delay=0
+            )
+
+            result = seeder.seed(1)
+            client.close()
+            requests_made = server.stats()["requests"]
+
+        assert not result.complete
+        assert sum(requests_made.values()) == 3
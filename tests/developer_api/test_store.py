@@ -0,0 +1,128 @@
+import copy
+from unittest.mock import Mock
+
+import pytest
+
+from starter_project.developer_api.clients import DeveloperApiClient
+from starter_project.developer_api.filters import Filter, Relation
+from starter_project.developer_api.local_server import LocalDeveloperApi
+from starter_project.developer_api.models import Account, ProductType, Transaction
+from starter_project.developer_api.store import LocalStore
+from tests.developer_api import test_clients
+
+
+class TestLocalStore:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.store = LocalStore()
+        self.account = Account.deserialize(
+            test_clients.TestClients.EXAMPLE_ACCOUNT_RESPONSE["Accounts"][0]
+        )
+        self.transactions = [
+            Transaction.deserialize(transaction)
+            for transaction in test_clients.TestClients.EXAMPLE_TRANSACTION_RESPONSE[
+                "Transactions"
+            ]
+        ]
+        yield
+        self.store.close()
+
+    def test_round_trips_models(self):
+        self.store.upsert_accounts([self.account])
+        self.store.upsert_transactions(self.transactions)
+
+        assert self.store.query_accounts() == [self.account]
+        assert self.store.query_transactions("72965642") == self.transactions
+
+    def test_upsert_replaces_existing_records(self):
+        self.store.upsert_accounts([self.account])
+        updated = copy.deepcopy(self.account)
+        updated.balance = 5.0
+        self.store.upsert_accounts([updated])
+
+        assert [account.balance for account in self.store.query_accounts()] == [5.0]
+
+    def test_translates_filters_to_sql(self):
+        self.store.upsert_transactions(self.transactions)
+
+        matches = self.store.query_transactions(
+            filters=[
+                Filter("amount").gt("600"),
+                Filter("creditDebitIndicator").eq("Debit"),
+                Filter("timestamp").lt("2019-06-01 00:00:00"),
+            ]
+        )
+
+        assert [t.transaction_uuid for t in matches] == [
+            "0673bca4-fbb2-46bd-aa76-36243305ceed"
+        ]
+        assert matches[0].credit_debit_indicator is ProductType.DEBIT
+        assert (
+            self.store.query_transactions(
+                filters=[Filter("amount").lt(3), Filter("amount").gt(10)]
+            )
+            == []
+        )
+
+    def test_text_compares_with_the_api_casing(self):
+        self.store.upsert_accounts([self.account])
+        self.store.upsert_transactions(self.transactions)
+
+        assert self.store.query_accounts([Filter("productType").eq("Credit")]) == [
+            self.account
+        ]
+        assert self.store.query_accounts([Filter("productType").eq("credit")]) == []
+        assert (
+            self.store.query_transactions(
+                filters=[Filter("message").eq("Weekly groceries shopping")]
+            )
+            == self.transactions[:1]
+        )
+        assert (
+            self.store.query_transactions(
+                filters=[Filter("message").eq("weekly groceries shopping")]
+            )
+            == []
+        )
+
+    def test_sync_only_requests_transactions_from_the_latest_second(self):
+        client = Mock()
+        client.get_accounts.return_value = [self.account]
+        self.transactions[0].account_uuid = self.account.account_id
+        client.get_transactions.side_effect = [self.transactions[:1], []]
+
+        first = self.store.sync(client)
+        second = self.store.sync(client)
+
+        assert first == {"66512652": 1}
+        assert second == {"66512652": 0}
+        assert client.get_transactions.call_args_list[0].args == ("66512652", [])
+        (since,) = client.get_transactions.call_args_list[1].args[1]
+        assert (since.key, since.relation, since.value) == (
+            "timestamp",
+            Relation.GE,
+            "2019-05-20 10:51:33",
+        )
+
+    def test_sync_keeps_transactions_from_the_same_second(self):
+        with LocalDeveloperApi(seed=0) as server:
+            (account,) = server.add_accounts(1)
+            account_id = account["accountId"]
+            timestamp = "2024-01-01 10:00:00"
+            client = DeveloperApiClient("token", service_url=server.url)
+
+            server.add_transactions(account_id, 1, timestamp=timestamp)
+            self.store.sync(client)
+            server.add_transactions(account_id, 1, timestamp=timestamp)
+            self.store.sync(client)
+            client.close()
+
+        assert len(self.store.query_transactions(account_id)) == 2
+
+    def test_persists_to_disk(self, tmp_path):
+        path = tmp_path / "mirror.db"
+        with LocalStore(path) as store:
+            store.upsert_accounts([self.account])
+
+        with LocalStore(path) as store:
+            assert store.query_accounts([Filter("riskScore").ge(20)]) == [self.account]
@@ -0,0 +1,80 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from starter_project.developer_api.clients import DeveloperApiClient
+from starter_project.developer_api.streaming import (
+    JsonArrayStreamParser,
+    chunked,
+    iter_json_array,
+)
+from tests.developer_api import test_clients
+
+
+def _split(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestStreaming:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.client = DeveloperApiClient("dummy-token")
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_parses_records_across_chunks(self, chunk_size):
+        body = json.dumps(
+            test_clients.TestClients.EXAMPLE_TRANSACTION_RESPONSE
+        ).encode()
+
+        records = list(iter_json_array(_split(body, chunk_size), "Transactions"))
+
+        assert (
+            records
+            == test_clients.TestClients.EXAMPLE_TRANSACTION_RESPONSE["Transactions"]
+        )
+
+    def test_skips_other_keys(self):
+        body = b'{"count": 12345, "meta": {"Accounts": [1]}, "Accounts": [{"a": 1}, {"a": 2}], "next": null}'
+
+        assert list(iter_json_array(_split(body, 3), "Accounts")) == [
+            {"a": 1},
+            {"a": 2},
+        ]
+
+    def test_missing_key_returns_no_records(self):
+        assert list(iter_json_array([b'{"Transactions": []}'], "Accounts")) == []
+
+    def test_truncated_response_raises(self):
+        parser = JsonArrayStreamParser("Accounts")
+        assert parser.feed(b'{"Accounts": [{"a": 1}, {"a"') == [{"a": 1}]
+
+        with pytest.raises(ValueError):
+            parser.close()
+
+    def test_chunked(self):
+        assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    @patch("requests.Session.request")
+    def test_iter_accounts(self, mock_request):
+        body = json.dumps(test_clients.TestClients.EXAMPLE_ACCOUNT_RESPONSE).encode()
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.iter_content.return_value = _split(body, 16)
+
+        accounts = list(self.client.iter_accounts())
+
+        assert [account.account_id for account in accounts] == ["66512652"]
+        assert mock_request.call_args.kwargs["stream"] is True
+        mock_request.return_value.close.assert_called_once()
+
+    @patch("requests.Session.request")
+    def test_iter_transactions_chunked(self, mock_request):
+        body = json.dumps(
+            test_clients.TestClients.EXAMPLE_TRANSACTION_RESPONSE
+        ).encode()
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.iter_content.return_value = _split(body, 64)
+
+        batches = list(self.client.iter_transactions_chunked("72965642", chunk_size=1))
+
+        assert [len(batch) for batch in batches] == [1, 1]
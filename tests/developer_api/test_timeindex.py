@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from starter_project.developer_api.models import Transaction
+from starter_project.developer_api.synthetic import make_transaction, make_transactions
+from starter_project.developer_api.timeindex import TransactionTimeIndex
+
+
+def _transaction(account_id: str, timestamp: str, seed: int):
+    return Transaction.deserialize(
+        make_transaction(account_id, random.Random(seed), timestamp)
+    )
+
+
+class TestTransactionTimeIndex:
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.first = _transaction("1", "2019-05-20 10:51:33", 0)
+        self.second = _transaction("2", "2019-05-20 23:00:00", 1)
+        self.third = _transaction("1", "2019-05-21 09:15:00", 2)
+        self.index = TransactionTimeIndex([self.third, self.first, self.second])
+
+    def test_between_returns_the_range_in_time_order(self):
+        assert self.index.between() == [self.first, self.second, self.third]
+        assert self.index.between("2019-05-20 10:51:33", "2019-05-21 09:15:00") == [
+            self.first,
+            self.second,
+        ]
+        assert self.index.between(start=1558349494) == [self.second, self.third]
+        assert self.index.between(account_uuid="1") == [self.first, self.third]
+        assert self.index.between(account_uuid="unknown") == []
+        assert self.index.count("2019-05-20 12:00:00") == 2
+
+    def test_latest_is_newest_first(self):
+        assert self.index.latest(2) == [self.third, self.second]
+        assert self.index.latest(5, account_uuid="1") == [self.third, self.first]
+        assert self.index.latest(1, before="2019-05-21 00:00:00") == [self.second]
+        assert self.index.latest(0) == []
+
+    def test_bucket_counts(self):
+        assert self.index.bucket_counts("day") == {
+            "2019-05-20 00:00:00": 2,
+            "2019-05-21 00:00:00": 1,
+        }
+        assert self.index.bucket_counts("hour", account_uuid="1") == {
+            "2019-05-20 10:00:00": 1,
+            "2019-05-21 09:00:00": 1,
+        }
+        with pytest.raises(ValueError):
+            self.index.bucket_counts("week")
+
+    def test_add_merges_older_batches_and_skips_duplicates(self):
+        earlier = _transaction("1", "2019-05-01 00:00:00", 3)
+        between = _transaction("1", "2019-05-20 12:00:00", 4)
+
+        assert self.index.add([between, self.first, earlier]) == 2
+        assert len(self.index) == 5
+        assert earlier.transaction_uuid in self.index
+        assert self.index.between(account_uuid="1") == [
+            earlier,
+            self.first,
+            between,
+            self.third,
+        ]
+
+    def test_matches_a_linear_scan(self):
+        transactions = [
+            Transaction.deserialize(raw) for raw in make_transactions(2000, seed=1)
+        ]
+        index = TransactionTimeIndex(transactions[:1000])
+        index.add(transactions[1000:])
+        start, end = "2019-03-01 00:00:00", "2019-09-01 00:00:00"
+
+        expected = [t for t in transactions if start <= t.timestamp < end]
+        assert {t.transaction_uuid for t in index.between(start, end)} == {
+            t.transaction_uuid for t in expected
+        }
+        timestamps = [t.timestamp for t in index.between()]
+        assert timestamps == sorted(timestamps)
+        assert sum(index.bucket_counts("day").values()) == 2000
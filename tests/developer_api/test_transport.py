@@ -0,0 +1,126 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+
+from starter_project.developer_api.clients import DeveloperApiClient
+from starter_project.developer_api.ratelimit import AdaptiveRateController
+from starter_project.developer_api.transport import HttpTransport, Transport
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"Accounts": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestTransport:
+    def test_subclasses_must_implement_request(self):
+        class NoRequest(Transport):
+            pass
+
+        with pytest.raises(TypeError):
+            NoRequest()
+
+
+class TestHttpTransport:
+    TEST_URL = "https://example.com/accounts"
+
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        self.transport = HttpTransport(backoff_factor=0)
+        yield
+        self.transport.close()
+
+    @staticmethod
+    def _response(status_code, headers=None):
+        response = Mock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        return response
+
+    @patch("requests.Session.request")
+    def test_retries_throttled_requests(self, mock_request):
+        mock_request.side_effect = [self._response(429), self._response(200)]
+
+        response = self.transport.request("GET", self.TEST_URL)
+
+        assert response.status_code == 200
+        assert mock_request.call_count == 2
+
+    @patch("requests.Session.request")
+    def test_does_not_retry_server_errors_on_post(self, mock_request):
+        mock_request.return_value = self._response(500)
+
+        response = self.transport.request("POST", self.TEST_URL, data="{}")
+
+        assert response.status_code == 500
+        mock_request.assert_called_once()
+
+    @patch("requests.Session.request")
+    def test_gives_up_after_max_retries(self, mock_request):
+        mock_request.return_value = self._response(503)
+
+        response = self.transport.request("GET", self.TEST_URL)
+
+        assert response.status_code == 503
+        assert mock_request.call_count == self.transport.max_retries + 1
+
+    @patch("time.sleep")
+    @patch("requests.Session.request")
+    def test_waits_for_retry_after(self, mock_request, mock_sleep):
+        mock_request.side_effect = [
+            self._response(429, {"Retry-After": "2"}),
+            self._response(200),
+        ]
+
+        self.transport.request("GET", self.TEST_URL)
+
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("requests.Session.request")
+    def test_reports_every_attempt_to_the_rate_controller(self, mock_request):
+        controller = AdaptiveRateController(initial_limit=4, cooldown=0)
+        self.transport.rate_controller = controller
+        mock_request.side_effect = [self._response(503), self._response(200)]
+
+        self.transport.request("GET", self.TEST_URL)
+
+        stats = controller.stats()
+        assert (stats.throttled, stats.successes, stats.in_flight) == (1, 1, 0)
+        assert stats.limit == pytest.approx(2.5)
+
+    def test_reuses_keep_alive_connections(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            host = f"127.0.0.1:{server.server_port}"
+            for _ in range(3):
+                self.transport.request("GET", f"http://{host}/accounts")
+
+            stats = self.transport.pool_stats()[host]
+            assert stats.requests == 3
+            assert stats.connections_opened == 1
+            assert stats.connections_reused == 2
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_client_closes_transport(self):
+        transport = Mock()
+
+        with DeveloperApiClient("dummy-token", transport=transport):
+            pass
+
+        transport.close.assert_called_once()